@@ -9,17 +9,20 @@ pg.mixer.init()
 screen = pg.display.set_mode((consts.WIDTH, consts.HEIGHT))
 
 from src.modules.Game import Game, start_game
+from src.modules.mainmenu.startscrean import loading_screen
 
 
 def main():
     create_data_base()
     while True:
         name = start_game(screen)
-        game = Game(name, screen)
+        game = Game(name, screen, build_first_level=False)
+        loading_screen(screen, game.load_async())
         game.background = pg.Color(27, 24, 24)
         pg.mixer.music.stop()
         game.setup()
         game.start()
+        game.close()
     # pg.quit()
 
 
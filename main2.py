@@ -20,8 +20,10 @@ def main(algorithm):
     
     if algorithm == 0:
         print("Algoritmo genético de estado estacionario")
-    else:
+    elif algorithm == 1:
         print("Algoritmo genético generacional")
+    else:
+        print("Algoritmo genético de islas")
 
     levels = [Level(floor_type, main_hero, algorithm=algorithm) for floor_type in consts.FloorsTypes]
     for level in levels:
@@ -75,8 +77,8 @@ def main(algorithm):
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Ejecución del juego con algoritmo genético.')
-    parser.add_argument('--algorithm', type=int, default=0, choices=[0, 1],
-                        help='Especifica el algoritmo a utilizar: 0 para estado estacionario, 1 para generacional')
+    parser.add_argument('--algorithm', type=int, default=0, choices=[0, 1, 2],
+                        help='Especifica el algoritmo a utilizar: 0 para estado estacionario, 1 para generacional, 2 para islas')
 
     args = parser.parse_args()
     main(args.algorithm)
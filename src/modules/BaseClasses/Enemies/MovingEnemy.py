@@ -7,7 +7,9 @@ from src.modules.BaseClasses.Based.MoveSprite import MoveSprite
 from src.modules.characters.parents import Player
 from src.modules.levels.Border import Border
 from src.utils.funcs import pixels_to_cell, cell_to_pixels
-from src.utils.graph import make_path_to_cell
+from src.utils.campoFlujo import FlowField
+from src.utils.graph import GridGraph, find_path
+from src.utils.tablaSaltos import next_hop_table
 
 
 class MovingEnemy(BaseEnemy, MoveSprite):
@@ -24,6 +26,11 @@ class MovingEnemy(BaseEnemy, MoveSprite):
     :param enemy_collide_groups: Grupos de sprites para manejar las colisiones de esta entidad.
     :param groups: Grupos de sprites.
     """
+    # Moverse en diagonal: el camino se busca con A* y la caché de caminos (graph.find_path) en lugar del campo
+    # de flujo o de la tabla de siguiente paso, que solo tienen pasos ortogonales.
+    # Los voladores lo buscan en el grafo en diagonal de la habitación (Room.fly_paths, ver update_fly_graph).
+    # Desactivado por defecto: cada subclase decide si lo activa
+    use_diagonals: bool = False
 
     def __init__(self,
                  xy_pos: tuple[int, int],
@@ -45,6 +52,11 @@ class MovingEnemy(BaseEnemy, MoveSprite):
         self.slowdown_coef: float = 1.0
         self.flyable = flyable
         self.path: list[tuple[int, int]] = []
+        # Campo de flujo hacia el personaje principal compartido por la habitación.
+        # Mientras no lo haya, se usa la tabla de siguiente paso de la disposición de obstáculos (tablaSaltos)
+        # o, con diagonales, A* (graph.find_path, con caché por versión del grafo)
+        self.flow_field: FlowField | None = None
+        self.fly_graph: GridGraph | None = None  # Grafo en diagonal de la habitación para los voladores
 
         self.do_update_speed = True
 
@@ -102,26 +114,33 @@ class MovingEnemy(BaseEnemy, MoveSprite):
             self.move_ticks = 0
             return
 
-        if self.flyable:  # Los voladores vuelan directamente hacia el personaje principal
-            dx = self.main_hero.rect.centerx - self.rect.centerx
-            dy = self.main_hero.rect.centery - self.rect.centery
-            distance = math.hypot(dx, dy)
-            if distance:
-                self.set_speed(self.speed * dx / distance, self.speed * dy / distance)
-            else:
-                self.set_speed(0, 0)
+        if self.flyable and not (self.use_diagonals and self.fly_graph is not None):
+            self.fly_to_main_hero()
             return
 
         self.move_ticks = 0
         xy_end = self.main_hero.rect.center
         xy_end = pixels_to_cell(xy_end)
-        path_list = make_path_to_cell(self.room_graph, (self.x, self.y), xy_end)
-        if not path_list or len(path_list) < 2:
-            self.vx, self.vy = 0, 0
+        if self.use_diagonals:
+            graph = self.fly_graph if self.flyable else self.room_graph
+            path = find_path(graph, (self.x, self.y), xy_end, True) if xy_end else False
+            next_cell = path[1] if path and len(path) > 1 else None
+        elif self.flow_field is not None:
+            self.flow_field.update(self.room_graph, xy_end)
+            next_cell = self.flow_field.next_cell((self.x, self.y))
+        elif isinstance(self.room_graph, GridGraph):
+            next_cell = next_hop_table(self.room_graph).next_cell((self.x, self.y), xy_end)
+        else:
+            path = find_path(self.room_graph, (self.x, self.y), xy_end) if xy_end else False
+            next_cell = path[1] if path and len(path) > 1 else None
+        if next_cell is None:
+            if self.flyable:  # Ya está en la celda del personaje principal
+                self.fly_to_main_hero()
+            else:
+                self.vx, self.vy = 0, 0
             return
 
-        self.path = path_list[1:]
-        next_cell = self.path[0]
+        self.path = [next_cell]
         x, y = cell_to_pixels(next_cell)
         dx = x - self.rect.centerx
         dy = y - self.rect.centery
@@ -129,6 +148,34 @@ class MovingEnemy(BaseEnemy, MoveSprite):
         if distance:
             self.set_speed(self.speed * dx / distance, self.speed * dy / distance)
 
+    def fly_to_main_hero(self):
+        """
+        Volar directamente hacia el personaje principal.
+        """
+        dx = self.main_hero.rect.centerx - self.rect.centerx
+        dy = self.main_hero.rect.centery - self.rect.centery
+        distance = math.hypot(dx, dy)
+        if distance:
+            self.set_speed(self.speed * dx / distance, self.speed * dy / distance)
+        else:
+            self.set_speed(0, 0)
+
+    def update_fly_graph(self, fly_graph: GridGraph | None):
+        """
+        Usar el grafo en diagonal de la habitación (Room.fly_paths) para los voladores con use_diagonals.
+
+        :param fly_graph: grafo de la habitación con pasos en diagonal.
+        """
+        self.fly_graph = fly_graph
+
+    def update_flow_field(self, flow_field: FlowField):
+        """
+        Usar el campo de flujo compartido de la habitación.
+
+        :param flow_field: campo de flujo hacia el personaje principal.
+        """
+        self.flow_field = flow_field
+
     def check_fly_collides(self):
         for group in self.collide_groups:
             if sprites := pg.sprite.spritecollide(self, group, False):
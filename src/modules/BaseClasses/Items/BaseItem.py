@@ -1,3 +1,5 @@
+from typing import Callable
+
 import pygame as pg
 
 
@@ -16,6 +18,9 @@ class BaseItem(BaseSprite):
     :param hurtable: Indica si causa daño al personaje al tocarlo.
     """
 
+    # Función que recibe el objeto cuando cambia collidable o hurtable (la habitación la usa para su grafo)
+    obstacle_listener: Callable[['BaseItem'], None] | None = None
+
     def __init__(self,
                  xy_pos: tuple[int, int],
                  *groups: pg.sprite.AbstractGroup,
@@ -34,6 +39,28 @@ class BaseItem(BaseSprite):
         self.vx = 0
         self.vy = 0
 
+    @property
+    def collidable(self) -> bool:
+        return self._collidable
+
+    @collidable.setter
+    def collidable(self, value: bool):
+        changed = value != getattr(self, '_collidable', value)
+        self._collidable = value
+        if changed and self.obstacle_listener is not None:
+            self.obstacle_listener(self)
+
+    @property
+    def hurtable(self) -> bool:
+        return self._hurtable
+
+    @hurtable.setter
+    def hurtable(self, value: bool):
+        changed = value != getattr(self, '_hurtable', value)
+        self._hurtable = value
+        if changed and self.obstacle_listener is not None:
+            self.obstacle_listener(self)
+
     def collide(self, other: MoveSprite) -> bool:
         """
         Procesamiento de la colisión con una entidad.
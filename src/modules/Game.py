@@ -1,7 +1,12 @@
+import concurrent.futures
+import time
+from typing import Callable, Iterable
+
 import pygame as pg
 
 from src.modules.mainmenu import startscrean
 from src.utils.funcs import load_sound, load_image
+from src.utils.semillas import derive_seed, new_seed
 
 from src.modules.Banners.end_screen import end_screen
 from src.modules.Banners.pause import pause
@@ -9,6 +14,8 @@ from src.modules.Banners.win import win
 from src.modules.BaseClasses.Based.BaseGame import BaseGame
 from src.modules.handlers.MainHeroActionsHandler import MainHeroActionsHandler
 from src.modules.levels.Level import Level
+from src.modules.levels.reservaMapas import LayoutPool
+from src.modules.levels.telemetria import GenerationEvent
 from src.modules.levels.Room import Room
 from src.modules.menus.StatsLine import Stats
 from src.modules.characters.parents import Player
@@ -36,20 +43,63 @@ class Game(BaseGame):
 
     :param name: nombre del personaje
     :param main_screen: lienzo principal en el que se dibujará.
+    :param seed: semilla de la partida; cada piso usa una semilla derivada de ella.
+                 Sin semilla los mapas se toman de la reserva en disco (con semilla se generan para poder repetirlos).
+    :param observers: funciones que reciben la telemetría de cada generación al generar los pisos (ver telemetria).
+    :param time_budget_ms: tiempo en milisegundos para generar cada piso; None para no limitarlo.
+                           Con un límite de tiempo la misma semilla puede dar mapas distintos.
+    :param build_first_level: construir el primer piso al crear el juego. Si es False, hay que esperar load_async()
+                              (por ejemplo, desde startscrean.loading_screen) antes de empezar.
     """
-    def __init__(self, name: str, main_screen: pg.Surface, fps: int = 60):
+    def __init__(self, name: str, main_screen: pg.Surface, fps: int = 60, seed: int | None = None,
+                 observers: Iterable[Callable[[GenerationEvent], None]] | None = None,
+                 time_budget_ms: float | None = None, build_first_level: bool = True):
         self.name_hero = name
+        self.layout_pool = LayoutPool() if seed is None else None
+        self.observers = list(observers or [])
+        self.time_budget_ms = time_budget_ms
+        self.seed = seed if seed is not None else new_seed()
         self.main_hero = Player(name)
 
         BaseGame.__init__(self, main_screen, fps)
         self.level_screen = pg.Surface((GAME_WIDTH, GAME_HEIGHT))
         self.is_paused = False
-        self.levels = [Level(floor_type, self.main_hero) for floor_type in FloorsTypes]
-        self.current_level = self.levels[0]
+        self.floors = list(FloorsTypes)
+        self.level_build_times: dict[FloorsTypes, float] = {}  # Segundos que tardó en construirse cada piso
+        self.level_wait_times: list[float] = []  # Segundos que esperó el jugador al bajar de piso
+        # Solo se construye el piso actual; el siguiente se construye en segundo plano mientras se juega
+        self.level_builder = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.current_level: Level | None = None
+        self.next_level: concurrent.futures.Future | None = None
+        self.stats: Stats | None = None
+
+        self.main_hero_handler = MainHeroActionsHandler(self.main_hero)
+        if build_first_level:
+            self.enter_first_level(self.build_level(self.floors[0]))
+
+    async def load_async(self):
+        """
+        Construir el primer piso sin bloquear el bucle de eventos.
+        """
+        self.enter_first_level(await self.build_level_async(self.floors[0]))
+
+    def enter_first_level(self, level: Level):
+        """
+        Empezar en el primer piso y construir el siguiente en segundo plano.
+
+        :param level: primer piso.
+        """
+        self.current_level = level
+        self.next_level = self.level_builder.submit(self.build_level, self.floors[1 % len(self.floors)])
         self.current_level.update_main_hero_collide_groups()
         self.stats = Stats(self.main_hero, self.current_level)
 
-        self.main_hero_handler = MainHeroActionsHandler(self.main_hero)
+    def close(self):
+        """
+        Detener el hilo de construcción de pisos al terminar la partida: se cancela el siguiente piso si aún no
+        empezó a construirse y no se espera al que se esté construyendo.
+        """
+        self.level_builder.shutdown(wait=False, cancel_futures=True)
 
     def setup(self):
         """
@@ -91,6 +141,39 @@ class Game(BaseGame):
             self.is_paused = True
             pause(self.main_screen, self.name_hero)
 
+    def build_level(self, floor_type: FloorsTypes) -> Level:
+        """
+        Construir un piso y guardar cuánto tardó.
+
+        :param floor_type: tipo de piso.
+        :return: nivel construido.
+        """
+        start = time.perf_counter()
+        level = Level(floor_type, self.main_hero, **self.level_options(floor_type))
+        self.level_build_times[floor_type] = time.perf_counter() - start
+        return level
+
+    async def build_level_async(self, floor_type: FloorsTypes) -> Level:
+        """
+        Construir un piso en el hilo de construcción de pisos sin bloquear el bucle de eventos.
+
+        :param floor_type: tipo de piso.
+        :return: nivel construido.
+        """
+        start = time.perf_counter()
+        level = await Level.build_async(floor_type, self.main_hero, executor=self.level_builder,
+                                        **self.level_options(floor_type))
+        self.level_build_times[floor_type] = time.perf_counter() - start
+        return level
+
+    def level_options(self, floor_type: FloorsTypes) -> dict:
+        """
+        :param floor_type: tipo de piso.
+        :return: argumentos con nombre de Level para ese piso.
+        """
+        return dict(seed=derive_seed(self.seed, floor_type.value), pool=self.layout_pool, observers=self.observers,
+                    time_budget_ms=self.time_budget_ms)
+
     def get_current_level_rooms(self) -> list[list[Room | None]]:
         """
         Obtener todas las habitaciones del nivel actual.
@@ -107,7 +190,14 @@ class Game(BaseGame):
             if win(self.main_screen, score=self.main_hero.score):
                 self.running = False
         self.main_hero.kill_tears()
-        self.current_level = self.levels[(self.levels.index(self.current_level) + 1) % len(self.levels)]
+
+        # Solo se bloquea si el siguiente piso aún no terminó de construirse
+        start = time.perf_counter()
+        self.current_level = self.next_level.result()
+        self.level_wait_times.append(time.perf_counter() - start)
+
+        following = self.floors[(self.floors.index(self.current_level.floor_type) + 1) % len(self.floors)]
+        self.next_level = self.level_builder.submit(self.build_level, following)
         self.current_level.update_main_hero_collide_groups()
         self.move_main_hero((ROOM_WIDTH // 2, ROOM_HEIGHT // 2))
         self.stats = Stats(self.main_hero, self.current_level)
@@ -1,10 +1,18 @@
 import pygame as pg
+import asyncio
+import concurrent.futures
+import functools
 import os
+import random
+from typing import Callable, Iterable
 
 from src import consts
-from src.utils.graph import valid_coords, get_neighbors_coords
+from src.utils.graph import valid_coords, GridGraph
+from src.utils.semillas import derive_seed, new_seed
 from src.modules.levels.Room import Room
-from src.modules.levels.LevelGenerator import generate_level
+from src.modules.levels.LevelGenerator import generate_level, FLOOR_ROOM_NUMBERS
+from src.modules.levels.reservaMapas import LayoutPool
+from src.modules.levels.telemetria import GenerationEvent
 from src.modules.animations.MovingRoomAnimation import MovingRoomAnimation
 from src.modules.characters.parents import Player
 from src.consts import RoomsTypes
@@ -18,35 +26,73 @@ class Level:
      :param main_hero: Personaje principal.
      :param width: ancho máximo de la disposición de la habitación.
      :param height: altura máxima de la disposición de la habitación.
+     :param algorithm: algoritmo genético (0 - estado estable, 1 - generacional, 2 - islas).
+     :param vectorized: usar el motor NumPy del algoritmo genético.
+     :param seed: semilla del piso; de ella se derivan la del mapa y la de cada habitación.
+     :param pool: reserva de mapas ya generados; si tiene un mapa para este piso no se ejecuta el algoritmo genético.
+     :param observers: funciones que reciben la telemetría de cada generación del algoritmo genético.
+     :param time_budget_ms: tiempo en milisegundos para generar el mapa (ver generate_level); None para no limitarlo.
      """
     def __init__(self,
                  floor_type: consts.FloorsTypes | str,
                  main_hero: Player,
                  width: int = 10,
                  height: int = 6,
-                 algorithm: int = 0):
+                 algorithm: int = 0,
+                 vectorized: bool = False,
+                 seed: int | None = None,
+                 pool: LayoutPool | None = None,
+                 observers: Iterable[Callable[[GenerationEvent], None]] | None = None,
+                 time_budget_ms: float | None = None):
         self.floor_type = floor_type
+        self.seed = seed if seed is not None else new_seed()
         self.main_hero = main_hero
         self.width = width
         self.height = height
         self.level_map: list[list[consts.RoomsTypes | str]] = []
+        self.map_graph: GridGraph | None = None  # Grafo de vecinos del mapa (para las puertas)
         self.rooms: list[list[Room | None]] = [[None] * width for _ in range(height)]
         self.current_room: Room | None = None
         self.is_moving: bool | MovingRoomAnimation = False
+        self.pool = pool
+        self.observers = observers
+        self.time_budget_ms = time_budget_ms
 
-        self.setup_level(algorithm=algorithm)
+        self.setup_level(algorithm=algorithm, vectorized=vectorized)
 
-    def setup_level(self, algorithm: int = 0):
+    @classmethod
+    async def build_async(cls, *args, executor: concurrent.futures.Executor | None = None, **kwargs) -> 'Level':
+        """
+        Construir el nivel (mapa y habitaciones) en un ejecutor sin bloquear el bucle de eventos.
+
+        :param args: argumentos de Level.
+        :param executor: ejecutor en el que se construye (por defecto, el del bucle de eventos).
+        :param kwargs: argumentos con nombre de Level.
+        :return: nivel construido.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(cls, *args, **kwargs))
+
+    def setup_level(self, algorithm: int = 0, vectorized: bool = False):
         """
         Generación de cuartos de nivel y colocación de puertas.
+
+        :param algorithm: algoritmo genético (0 - estado estable, 1 - generacional, 2 - islas).
+        :param vectorized: usar el motor NumPy del algoritmo genético.
         """
         rangeRooms = self.get_number_of_rooms(self.floor_type)
-        self.level_map = generate_level(self.width, self.height, rangeRooms, algorithm)
+        rng = random.Random(derive_seed(self.seed, 'layout'))
+        level_map = self.pool.take(self.floor_type, rangeRooms, rng) if self.pool is not None else None
+        if level_map is None:
+            level_map = generate_level(self.width, self.height, rangeRooms, algorithm, vectorized=vectorized, rng=rng,
+                                       observers=self.observers, time_budget_ms=self.time_budget_ms)
+        self.level_map = level_map
+        self.map_graph = GridGraph.from_rooms(level_map)
         for y, row in enumerate(self.level_map):
             for x, room_type in enumerate(row):
                 if room_type == consts.RoomsTypes.EMPTY:
                     continue
-                room = Room(self.floor_type, room_type, (x, y), self.main_hero, None)
+                room = Room(self.floor_type, room_type, (x, y), self.main_hero, None, rng=self.room_rng(x, y))
                 room.setup_doors(self.get_doors(x, y))
                 if room_type == consts.RoomsTypes.SPAWN:
                     self.current_room = room
@@ -60,6 +106,16 @@ class Level:
         assert self.current_room is not None and self.current_room.room_type == consts.RoomsTypes.SPAWN
         self.change_rooms_state(self.current_room.x, self.current_room.y)
 
+    def room_rng(self, x: int, y: int) -> random.Random:
+        """
+        Generador de números aleatorios propio de una habitación, derivado de la semilla del piso.
+
+        :param x: Coordenada de la habitación.
+        :param y: Coordenada de la habitación.
+        :return: random.Random.
+        """
+        return random.Random(derive_seed(self.seed, 'room', x, y))
+
     def get_doors(self, cur_x: int, cur_y: int) -> list[tuple[consts.DoorsCoords, consts.RoomsTypes]]:
         """
          Obtención de las coordenadas de las puertas y la información necesaria para la instalación de la textura.
@@ -68,7 +124,7 @@ class Level:
          :param cur_y: Coordenada de la habitación actual.
          :return: Hoja con pares (coordenadas, tipo de habitación).
          """
-        coords = get_neighbors_coords(cur_x, cur_y, self.level_map)
+        coords = self.map_graph.get((cur_x, cur_y), [])
         doors = []
         for room_x, room_y in coords:
             direction = None
@@ -105,7 +161,7 @@ class Level:
          :param cur_y: Coordenada de la habitación actual.
         """
         self.rooms[cur_y][cur_x].update_detection_state(is_active=True)
-        coords = get_neighbors_coords(cur_x, cur_y, self.level_map)
+        coords = self.map_graph.get((cur_x, cur_y), [])
         for x, y in coords:
             self.rooms[y][x].update_detection_state(is_spotted=True)
 
@@ -146,6 +202,12 @@ class Level:
         self.is_moving = MovingRoomAnimation(from_room, to_room, direction)
 
     def update_main_hero_collide_groups(self):
+        # Las habitaciones no añaden el personaje a sus grupos al construirse (el nivel puede construirse
+        # en otro hilo); se añade aquí, en el hilo principal
+        for row in self.rooms:
+            for room in row:
+                if room is not None:
+                    room.add_main_hero()
         self.main_hero.update_room_groups(*self.current_room.get_room_groups())
 
     def update(self, delta_t: float):
@@ -180,29 +242,7 @@ class Level:
          :return: Rango del número de habitaciones.
         """
 
-        minRooms = 10
-        maxRooms = 15
-
-        if nivel == consts.FloorsTypes.BASEMENT:
-            minRooms += 2
-            maxRooms += 2
-        elif nivel == consts.FloorsTypes.CAVES:
-            minRooms += 4
-            maxRooms += 4
-        elif nivel == consts.FloorsTypes.CATACOMBS:
-            minRooms += 6
-            maxRooms += 6
-        elif nivel == consts.FloorsTypes.DEPTHS:
-            minRooms += 8
-            maxRooms += 8
-        elif nivel == consts.FloorsTypes.BLUEWOMB:
-            minRooms += 10
-            maxRooms += 10
-        elif nivel == consts.FloorsTypes.WOMB:
-            minRooms += 12
-            maxRooms += 12
-        
-        return minRooms, maxRooms
+        return FLOOR_ROOM_NUMBERS.get(nivel, (10, 15))
     
     def constructor(self, floor_type: consts.FloorsTypes | str, main_hero: Player, level_map: list[list[consts.RoomsTypes | str]], width: int = 10, height: int = 6):
         """
@@ -234,11 +274,12 @@ class Level:
         """
 
         self.level_map = level_map
+        self.map_graph = GridGraph.from_rooms(level_map)
         for y, row in enumerate(self.level_map):
             for x, room_type in enumerate(row):
                 if room_type == consts.RoomsTypes.EMPTY:
                     continue
-                room = Room(self.floor_type, room_type, (x, y), self.main_hero, None)
+                room = Room(self.floor_type, room_type, (x, y), self.main_hero, None, rng=self.room_rng(x, y))
                 room.setup_doors(self.get_doors(x, y))
                 if room_type == consts.RoomsTypes.SPAWN:
                     self.current_room = room
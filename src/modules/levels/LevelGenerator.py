@@ -1,18 +1,72 @@
 """
 Generador de piso.
-Llamar a generate_level(width, height, rooms) para obtener un mapa del nivel.
+Llamar a generate_level(width, height, rooms) para obtener un mapa del nivel
+(o await generate_level_async(...) desde una corrutina para no bloquear el bucle de eventos).
 """
 
-from src.consts import RoomsTypes
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import random
+import sys
+from typing import Callable, Iterable
+
+from src.tipos import FloorsTypes, RoomsTypes
 from src.modules.levels.algoritmoGenetico import steady_state_genetic_algorithm, generational_genetic_algorithm, set_default_rooms, set_other_rooms
+import src.modules.levels.algoritmoGenetico as ag
+from src.modules.levels import genomaVectorizado
+from src.modules.levels.evaluacionParalela import FitnessEvaluator
+from src.modules.levels.modeloIslas import island_genetic_algorithm
+from src.modules.levels.criteriosParada import StoppingCriteria, MAX_FITNESS
+from src.modules.levels.seleccion import ParentSelector
+from src.modules.levels.telemetria import GenerationEvent
+from src.modules.levels.reservaMapas import is_valid_layout
+from src.utils.semillas import numpy_rng
+
+# Rango del número de habitaciones de cada piso: cada piso tiene dos habitaciones más que el anterior
+FLOOR_ROOM_NUMBERS: dict[FloorsTypes, tuple[int, int]] = {
+    floor_type: (12 + 2 * i, 17 + 2 * i) for i, floor_type in enumerate(FloorsTypes)
+}
 
-def generate_level(map_width: int, map_height: int, room_numbers: tuple[int,int], algorithm: int = 0) -> list[list[RoomsTypes | str]]:
+def generate_level(map_width: int, map_height: int, room_numbers: tuple[int,int], algorithm: int = 0,
+                   vectorized: bool = False, backend: str = 'serial',
+                   workers: int | None = None, islands: int = 4, migration_interval: int = 5,
+                   topology: str = 'ring',
+                   stopping: StoppingCriteria | None = None,
+                   rng: random.Random | None = None,
+                   selection: ParentSelector | None = None,
+                   observers: Iterable[Callable[[GenerationEvent], None]] | None = None,
+                   time_budget_ms: float | None = None) -> list[list[RoomsTypes | str]]:
     """
      Generador de piso (nivel).
 
+     Si el mejor mapa no es válido (reservaMapas.is_valid_layout: le falta alguna sala especial o no está conectado),
+     se usa un mapa del paseo aleatorio reparado, así que siempre tiene todas las salas.
+
      :param map_width: ancho del piso.
      :param map_height: altura del piso.
      :param room_numbers: - número de habitaciones teniendo en cuenta la generación, la tienda, el jefe, etc.
+     :param algorithm: 0 - estado estable, 1 - generacional, 2 - modelo de islas (varios procesos).
+     :param vectorized: usar el motor NumPy (genomaVectorizado), que evoluciona toda la población como una matriz.
+     :param backend: ejecutor de la aptitud: "serial", "thread" o "process" (ver evaluacionParalela).
+     :param workers: número de trabajadores del ejecutor (o de procesos del modelo de islas).
+     :param islands: número de islas (algorithm=2).
+     :param migration_interval: generaciones entre migraciones (algorithm=2).
+     :param topology: topología de migración, "ring" o "fully_connected" (algorithm=2).
+     :param stopping: criterios de parada anticipada; por defecto se detiene al alcanzar la aptitud máxima
+                      o tras 15 generaciones sin mejorar. Después de generar guarda la generación en la que se detuvo.
+     :param rng: generador de números aleatorios; con el mismo estado se genera el mismo mapa.
+     :param selection: selección de padres: ruleta, torneo y elitismo (por defecto, ruleta de Baker).
+     :param observers: funciones que reciben un GenerationEvent después de cada generación (ver telemetria);
+                       el modelo de islas no los usa.
+     :param time_budget_ms: tiempo disponible en milisegundos. El algoritmo evoluciona hasta agotarlo (o hasta la
+                            aptitud máxima) en lugar de 50 generaciones y devuelve el mejor mapa encontrado.
+                            El resultado depende del tiempo, así que no se repite con la misma semilla.
+                            Con el modelo de islas (algorithm=2), cada isla comprueba el tiempo en cada generación,
+                            pero el arranque de los procesos y la población inicial de cada isla no se pueden cortar:
+                            con un núcleo y cuatro islas se tarda unos 70-75 ms aunque el límite sea de 30 ms.
+                            Para un tiempo predecible, usar algorithm=0 o 1.
      """
     minRooms = room_numbers[0]
     maxRooms = room_numbers[1]
@@ -21,6 +75,17 @@ def generate_level(map_width: int, map_height: int, room_numbers: tuple[int,int]
     assert 3 <= map_height <= 10                       # Comprobando el tamaño de la tarjeta
     assert minRooms >= 5                               # Generación, tienda, tesorería, jefe, habitación secreta.
     assert maxRooms < map_width * map_height - 3   # Es posible generar todas las habitaciones.
+    assert algorithm in (0, 1, 2)
+
+    generations = 50
+    result_stopping = stopping
+    if time_budget_ms is not None:
+        generations = sys.maxsize
+        # Copia: el límite de tiempo no debe quedarse en los criterios del llamador para otras ejecuciones
+        stopping = copy.copy(stopping) if stopping is not None else StoppingCriteria(max_fitness=MAX_FITNESS)
+        stopping.time_budget_ms = time_budget_ms
+    if stopping is None:
+        stopping = StoppingCriteria(max_fitness=MAX_FITNESS, stagnation=15)
 
     rooms = []
     """
@@ -32,15 +97,60 @@ def generate_level(map_width: int, map_height: int, room_numbers: tuple[int,int]
         set_default_rooms(rooms, room_numbers)
         successful_generation = set_other_rooms(rooms)"""
     
-    if algorithm == 0:
-        rooms = steady_state_genetic_algorithm(10, map_width, map_height, room_numbers, 50)
+    if algorithm == 2:
+        rooms = island_genetic_algorithm(10, map_width, map_height, room_numbers, generations, islands=islands,
+                                         migration_interval=migration_interval, topology=topology, workers=workers,
+                                         seed=rng.getrandbits(64) if rng is not None else None, stopping=stopping,
+                                         selection=selection)
+    elif vectorized:
+        # El motor vectorizado devuelve el mapa ya convertido a RoomsTypes
+        vector_rng = numpy_rng(rng) if rng is not None else None
+        if algorithm == 0:
+            rooms = genomaVectorizado.steady_state_genetic_algorithm(10, map_width, map_height, room_numbers,
+                                                                      generations, rng=vector_rng, stopping=stopping,
+                                                                      selection=selection, observers=observers)
+        else:
+            rooms = genomaVectorizado.generational_genetic_algorithm(10, map_width, map_height, room_numbers,
+                                                                     generations, rng=vector_rng, stopping=stopping,
+                                                                     selection=selection, observers=observers)
     else:
-        rooms = generational_genetic_algorithm(10, map_width, map_height, room_numbers, 50)
-        
+        with FitnessEvaluator(backend, workers) as evaluator:
+            if algorithm == 0:
+                rooms = steady_state_genetic_algorithm(10, map_width, map_height, room_numbers, generations,
+                                                       evaluator=evaluator, stopping=stopping, rng=rng,
+                                                       selection=selection, observers=observers)
+            else:
+                rooms = generational_genetic_algorithm(10, map_width, map_height, room_numbers, generations,
+                                                       evaluator=evaluator, stopping=stopping, rng=rng,
+                                                       selection=selection, observers=observers)
+
+    if result_stopping is not None and result_stopping is not stopping:
+        result_stopping.copy_result(stopping)
+
+    if not is_valid_layout(rooms):
+        # El cruce y la mutación pueden quitar salas especiales (o no hubo tiempo de encontrar un mapa válido):
+        # el paseo aleatorio reparado siempre da un mapa con todas
+        rooms = ag.generate_level(map_width, map_height, minRooms, rng)
+
     assert rooms
     return rooms
 
 
+async def generate_level_async(*args, executor: concurrent.futures.Executor | None = None,
+                               **kwargs) -> list[list[RoomsTypes | str]]:
+    """
+     Versión asíncrona de generate_level: el algoritmo genético se ejecuta en un ejecutor
+     y el bucle de eventos sigue libre (por ejemplo, para dibujar una animación de carga).
+
+     :param args: argumentos de generate_level.
+     :param executor: ejecutor en el que se genera el mapa (por defecto, el del bucle de eventos).
+     :param kwargs: argumentos con nombre de generate_level.
+     :return: mapa del nivel.
+     """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(generate_level, *args, **kwargs))
+
+
 def print_map(rooms: list[list[RoomsTypes | str]]) -> None:
     """
      Salida del mapa a la consola.
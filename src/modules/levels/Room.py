@@ -1,9 +1,10 @@
+import collections
 import random
 import math
 
 import pygame as pg
 
-from src.modules.BaseClasses import BaseItem, BaseEnemy, ShootingEnemy
+from src.modules.BaseClasses import BaseItem, BaseEnemy, MovingEnemy, ShootingEnemy
 from src.modules.enemies.Envy import Envy
 from src.modules.enemies.Pudge import Pudge
 from src.modules.enemies.Teratoma import Teratoma
@@ -17,7 +18,9 @@ from src.modules.levels.Border import Border
 from src.modules.enemies import Maw, Guts, Host
 from src.modules.enemies.Fly import Fly
 from src.utils.funcs import pixels_to_cell, load_image
-from src.utils.graph import make_neighbors_graph
+from src.utils.graph import GridGraph
+from src.utils.campoFlujo import FlowField
+from src.utils.semillas import numpy_rng
 from src import consts
 
 from src.modules.characters.parents import Player
@@ -61,6 +64,7 @@ class Room(RoomTextures):
      :param texture_variant: Opción de textura (1-4, una de las opciones de la imagen).
      :param xy_pos: Ubicación en el piso (x, y).
      :param main_hero: El personaje principal.
+     :param rng: Generador de números aleatorios de la habitación (texturas y entidades).
      """
     paths_update_delay: int | float = 1
     artifacts = [Dinner, FreshMeat, GreenSyringe, GreySyringe, MomsHeels, PurpleSyringe, RedSyringe, WhiteSyringe]
@@ -71,14 +75,16 @@ class Room(RoomTextures):
                  room_type: consts.RoomsTypes,
                  xy_pos: tuple[int, int],
                  main_hero: Player,
-                 texture_variant: int = None):
+                 texture_variant: int = None,
+                 rng: random.Random | None = None):
 
         assert room_type != consts.RoomsTypes.EMPTY, f"El tipo de habitación no puede ser {consts.RoomsTypes.EMPTY}."
 
+        self.rng = rng or random
         self.x, self.y = xy_pos
         self.floor_type = floor_type
         self.room_type = room_type
-        self.texture_variant = texture_variant if texture_variant else random.randint(1, 4)
+        self.texture_variant = texture_variant if texture_variant else self.rng.randint(1, 4)
         self.minimap_cell: pg.Surface = pg.Surface((0, 0))
         self.background: pg.Surface = pg.Surface((0, 0))
         self.paths_update_ticks = 0
@@ -94,8 +100,9 @@ class Room(RoomTextures):
         self.colliadble_group = pg.sprite.Group()  # Algo que no se puede atravesar mientras está ahí
         self.obstacles = pg.sprite.Group()  # Obstáculos para construir un gráfico de habitación
         self.blowable = pg.sprite.Group()  # Algo que explota
+        # El personaje se añade en add_main_hero() desde el hilo principal: la habitación puede construirse
+        # en segundo plano mientras se juega con el mismo personaje
         self.main_hero_group = pg.sprite.Group()
-        self.main_hero_group.add(main_hero)
         self.movement_borders = pg.sprite.Group()  # Barreras que no permiten traspasar uno mismo
         self.tears_borders = pg.sprite.Group()  # Barreras que impiden que las lágrimas salgan volando
 
@@ -110,8 +117,13 @@ class Room(RoomTextures):
         self.doors = pg.sprite.Group()
         self.other = pg.sprite.Group()  # Bombas, llaves, monedas, etc., etc.
         self.artifacts_group = pg.sprite.Group()  # artefactos
-        self.paths = dict()  # Caminos para el piso
-        self.fly_paths = dict()  # Caminos para enemigos voladores.
+        self.paths = GridGraph.from_blocked(consts.ROOM_WIDTH, consts.ROOM_HEIGHT, ())  # Caminos para el piso
+        self.paths_version = 0  # Aumenta cada vez que cambia el grafo de caminos
+        self.obstacle_cells: dict[tuple[int, int], list[BaseItem]] = {}  # Obstáculos de cada celda
+        self.blocked_cells: set[tuple[int, int]] = set()  # Celdas por las que no se puede caminar
+        self.dirty_cells: set[tuple[int, int]] = set()  # Celdas cuyos obstáculos cambiaron desde la última versión
+        self.fly_paths: GridGraph | None = None  # Caminos para enemigos voladores.
+        self.flow_field = FlowField()  # Camino hacia el personaje principal compartido por los enemigos terrestres
 
         self.main_hero = main_hero
 
@@ -119,6 +131,13 @@ class Room(RoomTextures):
         self.setup_borders()
         self.setup_entities_ac()
         self.setup_graph()
+        self.update_enemies_paths()
+
+    def add_main_hero(self):
+        """
+        Añadir el personaje principal al grupo de la habitación (desde el hilo principal).
+        """
+        self.main_hero_group.add(self.main_hero)
 
     def setup_background(self):
         texture_x = texture_y = 0
@@ -135,7 +154,7 @@ class Room(RoomTextures):
         else:
             texture = getattr(Room, self.floor_type.value.lower() + '_background')
         if isinstance(texture, list):
-            texture = random.choice(texture)
+            texture = self.rng.choice(texture)
         texture = texture.subsurface((texture_x, texture_y, consts.GAME_WIDTH // 2, consts.GAME_HEIGHT // 2))
 
         background = pg.Surface((consts.GAME_WIDTH, consts.GAME_HEIGHT))
@@ -169,7 +188,7 @@ class Room(RoomTextures):
             for x in range(consts.ROOM_WIDTH):
                 if y == centery or x == centerx:
                     continue
-                chance = random.random()
+                chance = self.rng.random()
                 if chance > 0.9:
                     Rock((x, y), self.floor_type, self.room_type, self.colliadble_group, self.rocks,
                          self.obstacles, self.blowable)
@@ -178,7 +197,7 @@ class Room(RoomTextures):
                 elif chance > 0.7:
                     Web((x, y), self.colliadble_group, self.webs, self.blowable)
                 elif chance > 0.6:
-                    fire_type = random.choices([consts.FirePlacesTypes.DEFAULT, consts.FirePlacesTypes.RED],
+                    fire_type = self.rng.choices([consts.FirePlacesTypes.DEFAULT, consts.FirePlacesTypes.RED],
                                                [0.9, 0.1])[0]
                     FirePlace((x, y), self.colliadble_group, self.fires, self.blowable, self.obstacles,
                               fire_type=fire_type,
@@ -214,16 +233,49 @@ class Room(RoomTextures):
         """
          Construir un gráfico de celdas vecinas en una habitación para el movimiento de oponentes.
         """
-        cells = [[consts.RoomsTypes.DEFAULT] * consts.ROOM_WIDTH for _ in range(consts.ROOM_HEIGHT)]
-
         if not self.fly_paths:
-            self.fly_paths = make_neighbors_graph(cells, use_diagonals=True)
+            self.fly_paths = GridGraph.from_blocked(consts.ROOM_WIDTH, consts.ROOM_HEIGHT, (), use_diagonals=True)
 
+        self.obstacle_cells = collections.defaultdict(list)
         for obj in self.obstacles.sprites():
             obj: BaseItem
-            if obj.collidable or obj.hurtable:
-                cells[obj.y][obj.x] = consts.RoomsTypes.EMPTY
-        self.paths = make_neighbors_graph(cells)
+            obj.obstacle_listener = self.mark_obstacle_changed
+            self.obstacle_cells[(obj.x, obj.y)].append(obj)
+        self.blocked_cells = {cell for cell in self.obstacle_cells if self.is_blocked(cell)}
+        self.paths = GridGraph.from_blocked(consts.ROOM_WIDTH, consts.ROOM_HEIGHT, self.blocked_cells)
+        self.dirty_cells.clear()
+        self.paths_version += 1
+
+    def is_blocked(self, cell: tuple[int, int]) -> bool:
+        """
+        :param cell: celda de la habitación.
+        :return: ¿Hay en la celda un obstáculo impenetrable o que hace daño?
+        """
+        return any(obj.collidable or obj.hurtable for obj in self.obstacle_cells.get(cell, ()))
+
+    def mark_obstacle_changed(self, obj: BaseItem):
+        """
+        Apuntar la celda de un obstáculo que cambió (roto, explotado, pinchos escondidos, etc.).
+
+        :param obj: obstáculo.
+        """
+        self.dirty_cells.add((obj.x, obj.y))
+
+    def update_graph(self) -> bool:
+        """
+        Aplicar al grafo de caminos los cambios de los obstáculos (solo cambia la máscara de celdas bloqueadas).
+
+        :return: ¿Cambió el grafo (nueva versión)?
+        """
+        changed = {cell for cell in self.dirty_cells if (cell in self.blocked_cells) != self.is_blocked(cell)}
+        self.dirty_cells.clear()
+        if not changed:
+            return False
+        self.blocked_cells ^= changed
+        # Grafo nuevo: los enemigos conservan el anterior hasta que se les avisa de la nueva versión
+        self.paths = self.paths.with_blocked(self.blocked_cells)
+        self.paths_version += 1
+        return True
 
     def setup_doors(self, doors: list[tuple[consts.DoorsCoords, consts.RoomsTypes]]):
         """
@@ -415,21 +467,27 @@ class Room(RoomTextures):
         self.paths_update_ticks += delta_t
         if self.paths_update_ticks >= self.paths_update_delay:
             self.paths_update_ticks = 0
-            self.setup_graph()
-            self.update_enemies_paths()
+            if self.update_graph():
+                self.update_enemies_paths()
         self.enemies.update(delta_t)
         self.bosses.update(delta_t)
 
     def update_enemies_paths(self):
         """
-        Actualiza el grafo de la habitación para los enemigos (útil después de romper el Poop).
+        Envía el grafo de la habitación a los enemigos (cuando cambia de versión, por ejemplo, al romper el Poop).
         """
         for enemy in self.enemies:
             enemy: BaseEnemy
             enemy.update_room_graph(self.paths)
+            if isinstance(enemy, MovingEnemy):
+                enemy.update_flow_field(self.flow_field)
+                enemy.update_fly_graph(self.fly_paths)
         for boss in self.bosses:
             if isinstance(boss, BaseEnemy):
                 boss.update_room_graph(self.paths)
+                if isinstance(boss, MovingEnemy):
+                    boss.update_flow_field(self.flow_field)
+                    boss.update_fly_graph(self.fly_paths)
 
     def win_room(self):
         """
@@ -482,7 +540,7 @@ class Room(RoomTextures):
                      (self.blowable, self.other, self.main_hero_group), self.other, xy_pixels=xy_pos)
 
     def set_pickable(self, xy_pos: tuple[int, int]):  # Celda
-        chance = random.random()
+        chance = self.rng.random()
         if chance > 0.75:
             PickMoney(xy_pos, (self.colliadble_group, self.movement_borders, self.other), self.other)
         elif chance > 0.50:
@@ -542,12 +600,12 @@ class Room(RoomTextures):
         if self.room_type == consts.RoomsTypes.TREASURE:
             pedestal = Pedestal((centerx, centery),
                                 self.obstacles, self.colliadble_group, self.other)
-            pedestal.set_artifact(random.choice(Room.artifacts), self.artifacts_group)
+            pedestal.set_artifact(self.rng.choice(Room.artifacts), self.artifacts_group)
             return
 
         if self.room_type == consts.RoomsTypes.SHOP:
             for i, items in zip(range(-2, 2 + 1, 2), (Room.artifacts, Room.loot, Room.loot)):
-                ShopItem((centerx + i, centery), random.choice(items), self.other)
+                ShopItem((centerx + i, centery), self.rng.choice(items), self.other)
             return
 
         if self.room_type == consts.RoomsTypes.SECRET:
@@ -563,7 +621,7 @@ class Room(RoomTextures):
         if(self.room_type != consts.RoomsTypes.DEFAULT):
             self.generate_special_rooms()
         else:
-            room = cellular_automatan()
+            room = cellular_automatan(numpy_rng(self.rng))
             centerx, centery = consts.ROOM_WIDTH // 2, consts.ROOM_HEIGHT // 2
             for y in range(consts.ROOM_HEIGHT):
                 for x in range(consts.ROOM_WIDTH):
@@ -577,7 +635,7 @@ class Room(RoomTextures):
                     elif room[y][x] == 3:
                         Web((x, y), self.colliadble_group, self.webs, self.blowable)
                     elif room[y][x] == 4:
-                        fire_type = random.choices([consts.FirePlacesTypes.DEFAULT, consts.FirePlacesTypes.RED],
+                        fire_type = self.rng.choices([consts.FirePlacesTypes.DEFAULT, consts.FirePlacesTypes.RED],
                                                    [0.9, 0.1])[0]
                         FirePlace((x, y), self.colliadble_group, self.fires, self.blowable, self.obstacles,
                                   fire_type=fire_type,
@@ -1,10 +1,19 @@
 import random
 import math
-import collections
 from enum import Enum
-from src.consts import RoomsTypes, Moves
-from src.utils.graph import make_neighbors_graph
+from typing import Callable, Iterable
+from src.tipos import RoomsTypes, Moves
+from src.utils.graph import GridGraph, make_path_to_cell
 import src.utils.comprobaciones as comprobaciones
+from src.utils.caracteristicas import LayoutAnalysis, extract_features
+from src.utils.conectividad import ConnectivityChecker, all_rooms_reachable, articulation_points
+from src.modules.levels.cacheAptitud import FitnessCache, layout_key
+from src.modules.levels.evaluacionParalela import FitnessEvaluator
+from src.modules.levels.criteriosParada import StoppingCriteria
+from src.modules.levels.reparacion import repair_layout, RepairStats
+from src.modules.levels.seleccion import ParentSelector
+from src.modules.levels.telemetria import GenerationReporter, GenerationEvent
+from src.utils.semillas import numpy_rng
 
 def all_rooms_have_path_to_start(rooms: list[list[RoomsTypes | str]], *, ignore_secret: bool = True) -> bool:
     """
@@ -14,19 +23,13 @@ def all_rooms_have_path_to_start(rooms: list[list[RoomsTypes | str]], *, ignore_
      :param ignore_secret: si se ignora la habitación secreta.
      :return: ¿Todas las habitaciones tienen un camino hacia la sala de inicio?
     """
-    graph = make_neighbors_graph(rooms, ignore_secret=ignore_secret)
-    ignored = (RoomsTypes.EMPTY, RoomsTypes.SECRET)
-    for y, row in enumerate(rooms):
-        for x, col in enumerate(row):
-            if rooms[y][x] not in ignored:
-                if not has_path_to_start((x, y), rooms, ignore_secret=ignore_secret, graph=graph):
-                    return False
-    return True
+    # Un único relleno por inundación desde la sala de inicio en lugar de un BFS por habitación
+    return all_rooms_reachable(rooms, ignore_secret=ignore_secret)
 
 
 def has_path_to_start(start_pos: tuple[int, int], rooms: list[list[RoomsTypes | str]],
                       *,
-                      ignore_secret: bool = True, graph: dict[tuple[int, int], list[tuple[int, int]]] = None) -> bool:
+                      ignore_secret: bool = True, graph: GridGraph | dict[tuple[int, int], list[tuple[int, int]]] = None) -> bool:
     """
      Comprobar si es posible caminar desde la celda hasta la sala de salida.
 
@@ -36,73 +39,73 @@ def has_path_to_start(start_pos: tuple[int, int], rooms: list[list[RoomsTypes |
      :param graph: un diccionario similar a un gráfico (transmitido para no recrearlo para verificar cada habitación).
      :return: ¿Todas las habitaciones tienen un camino hacia la sala de inicio?
      """
+    if graph is None and ignore_secret:
+        # Misma regla que la búsqueda desde el inicio de LayoutAnalysis
+        x, y = start_pos
+        return rooms[y][x] != RoomsTypes.EMPTY and LayoutAnalysis(rooms).has_path_to_start(start_pos)
     map_width, map_height = len(rooms[0]), len(rooms)
     end_pos = math.ceil(map_width / 2) - 1, math.ceil(map_height / 2) - 1,
     if graph is None:
-        graph = make_neighbors_graph(rooms, ignore_secret=ignore_secret)
-    queue = collections.deque([start_pos])
-    visited: dict[tuple[int, int], tuple[int, int]] = {start_pos: None}
-    while queue:
-        current_cell = queue.popleft()
-        if current_cell == end_pos:
-            break
-        next_cells = graph.get(current_cell, [])
-        for next_cell in next_cells:
-            if next_cell not in visited.keys():
-                queue.append(next_cell)
-                visited[next_cell] = current_cell
-    return end_pos in visited.keys()
+        graph = GridGraph.from_rooms(rooms, ignore_secret=ignore_secret)
+    return make_path_to_cell(graph, start_pos, end_pos) is not False
 
-def set_secret_room(rooms: list[list[RoomsTypes | str]]) -> bool:
+def set_secret_room(rooms: list[list[RoomsTypes | str]], rng: random.Random | None = None) -> bool:
     """
     Montar una habitación secreta.
 
     :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
     :return: ¿Se instaló correctamente la habitación secreta?
     """
-    graph = make_neighbors_graph(rooms)
-    is_okay = False
+    rng = rng or random
+    graph = GridGraph.from_rooms(rooms)
+
+    # Una habitación puede ser secreta si el mapa sigue conectado sin ella. Si solo hay habitaciones transitables:
+    #  - en un mapa conectado, basta con que no sea un punto de articulación (se calculan una sola vez);
+    #  - en un mapa sin conectar, tiene que ser la única habitación aislada.
+    # Con tesorería o tienda, la conectividad de cada candidato se comprueba de forma incremental.
+    connectivity = ConnectivityChecker(rooms)
+    if any(RoomsTypes.TREASURE in row or RoomsTypes.SHOP in row for row in rooms):
+        is_valid = lambda x, y: connectivity.try_cell(x, y, RoomsTypes.SECRET)
+    elif connectivity.is_connected():
+        articulations = articulation_points(rooms)
+        is_valid = lambda x, y: (x, y) not in articulations
+    else:
+        is_valid = lambda x, y: connectivity.orphans == {(x, y)}
 
     # Primero, coloca un secreto donde hay 4 vecinos, luego donde hay 3, luego donde hay 2.
-    # Ahora funciona más lento :)
     for neighbors_rooms in range(4, 1, -1):
         secrets = [room for room in graph if len(graph[room]) >= neighbors_rooms
-                   and rooms[room[1]][room[0]] == RoomsTypes.DEFAULT]
-        random.shuffle(secrets)
-        for x, y in secrets:
+                   and rooms[room[1]][room[0]] == RoomsTypes.DEFAULT and is_valid(*room)]
+        if secrets:
+            x, y = rng.choice(secrets)
             rooms[y][x] = RoomsTypes.SECRET
-            if all_rooms_have_path_to_start(rooms):
-                is_okay = True
-                break
-            else:
-                rooms[y][x] = RoomsTypes.DEFAULT
-        if is_okay:
-            break
-    return is_okay
+            return True
+    return False
 
 
-def set_special_rooms(rooms: list[list[RoomsTypes | str]]) -> bool:
+def set_special_rooms(rooms: list[list[RoomsTypes | str]], rng: random.Random | None = None) -> bool:
     """
     Disposición de salas especiales (tesorería, tienda, jefe).
 
     :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
     :return: ¿Se han instalado correctamente todas las salas especiales?
     """
+    rng = rng or random
     # Busque habitaciones con un vecino para configurar una tesorería, una tienda y una sala de jefe
-    graph = make_neighbors_graph(rooms, ignore_secret=True)
-    solo = [room for room in graph if len(graph[room]) == 1 and rooms[room[1]][room[0]] == RoomsTypes.DEFAULT]
+    analysis = LayoutAnalysis(rooms)
+    solo = [(x, y) for x, y in analysis.dead_ends if rooms[y][x] == RoomsTypes.DEFAULT]
     if len(solo) < 3:
         return False
 
-    # Configura la sala del jefe lo más lejos posible de la ubicación de generación
-    map_width, map_height = len(rooms[0]), len(rooms)
-    spawn_x, spawn_y = math.ceil(map_width / 2) - 1, math.ceil(map_height / 2) - 1
-    boss_x, boss_y = max(solo, key=lambda c: math.sqrt((spawn_x - c[0]) ** 2 + (spawn_y - c[1]) ** 2))
+    # Configura la sala del jefe lo más lejos posible (siguiendo los caminos) de la ubicación de generación
+    boss_x, boss_y = analysis.farthest_dead_end(solo)
     rooms[boss_y][boss_x] = RoomsTypes.BOSS
     solo.remove((boss_x, boss_y))
 
     # Colocación aleatoria de tienda y tesoro.
-    random.shuffle(solo)
+    rng.shuffle(solo)
     for coords, room_type in zip(solo, (RoomsTypes.SHOP, RoomsTypes.TREASURE)):
         x, y = coords
         rooms[y][x] = room_type
@@ -110,33 +113,35 @@ def set_special_rooms(rooms: list[list[RoomsTypes | str]]) -> bool:
     return True
 
 
-def set_other_rooms(rooms: list[list[RoomsTypes | str]]) -> bool:
+def set_other_rooms(rooms: list[list[RoomsTypes | str]], rng: random.Random | None = None) -> bool:
     """
      Disposición de salas distintas a las de generación y predeterminadas.
 
      :param rooms: matriz bidimensional de valores de RoomsTypes.
+     :param rng: generador de números aleatorios (por defecto, el módulo random).
      :return: ¿Se han instalado correctamente todas las salas?
     """
     # Configuración de la sala secreta
-    if not set_secret_room(rooms):
+    if not set_secret_room(rooms, rng):
         return False
 
     # Configuración de las salas especiales
-    if not set_special_rooms(rooms):
+    if not set_special_rooms(rooms, rng):
         return False
 
     return True
 
 
-def set_default_rooms(rooms: list[list[RoomsTypes | str]], room_numbers: int) -> None:
+def set_default_rooms(rooms: list[list[RoomsTypes | str]], room_numbers: int, rng: random.Random | None = None) -> None:
     """
      Colocar RoomsTypes.DEFAULT y RoomsTypes.SPAWN en un mapa vacío.
 
      :param rooms: una matriz bidimensional de valores de RoomsTypes (en este caso, RoomsTypes.EMPTY).
      :param room_numbers: cuántas habitaciones se deben llenar con el valor de habitación predeterminado.
+     :param rng: generador de números aleatorios (por defecto, el módulo random).
      :retorno: Ninguno
     """
-
+    rng = rng or random
     map_width, map_height = len(rooms[0]), len(rooms)
     cur_x, cur_y = math.ceil(map_width / 2) - 1, math.ceil(map_height / 2) - 1
     room_numbers -= 1
@@ -144,7 +149,7 @@ def set_default_rooms(rooms: list[list[RoomsTypes | str]], room_numbers: int) ->
     moves = [move.value for move in Moves]
     # Un intento de crear un algoritmo de "perro corriendo" a partir de un vídeo sobre la generación de niveles en Isaac
     while room_numbers > 0:
-        step_x, step_y = random.choice(moves)
+        step_x, step_y = rng.choice(moves)
         cur_x = max(0, min(map_width - 1, cur_x + step_x))
         cur_y = max(0, min(map_height - 1, cur_y + step_y))
         if rooms[cur_y][cur_x] == RoomsTypes.EMPTY:
@@ -152,13 +157,17 @@ def set_default_rooms(rooms: list[list[RoomsTypes | str]], room_numbers: int) ->
             rooms[cur_y][cur_x] = RoomsTypes.DEFAULT
 
 
-def generate_level(map_width: int, map_height: int, room_numbers: int) -> list[list[RoomsTypes | str]]:
+def generate_level(map_width: int, map_height: int, room_numbers: int,
+                   rng: random.Random | None = None,
+                   stats: RepairStats | None = None) -> list[list[RoomsTypes | str]]:
     """
      Generador de piso (nivel).
 
      :param map_width: ancho del piso.
      :param map_height: altura del piso.
      :param room_numbers: - número de habitaciones teniendo en cuenta la generación, la tienda, el jefe, etc.
+     :param rng: generador de números aleatorios (por defecto, el módulo random).
+     :param stats: contadores de mapas reparados y vueltos a generar (opcional).
      """
     assert 3 <= map_width <= 10                        # Comprobando el tamaño de la tarjeta
     assert 3 <= map_height <= 10                       # Comprobando el tamaño de la tarjeta
@@ -168,30 +177,66 @@ def generate_level(map_width: int, map_height: int, room_numbers: int) -> list[l
     rooms = []
     successful_generation = False
     while not successful_generation:
-        # Generación de niveles hasta que aparezca un diseño adecuado
         rooms = [[RoomsTypes.EMPTY] * map_width for _ in range(map_height)]
-        set_default_rooms(rooms, room_numbers)
-        successful_generation = set_other_rooms(rooms)
+        set_default_rooms(rooms, room_numbers, rng)
+        successful_generation = finish_level(rooms, rng, stats)
     assert rooms
     return rooms
 
 
-def generate_initial_population(population_size: int, map_width: int, map_height: int, room_numbers: int) -> list:
+def finish_level(rooms: list[list[RoomsTypes | str]], rng: random.Random | None = None,
+                 stats: RepairStats | None = None) -> bool:
+    """
+    Colocar las salas secreta y especiales en un mapa del paseo aleatorio.
+    Si el diseño no es adecuado se repara; solo hay que generar otro si no se puede reparar.
+
+    :param rooms: matriz bidimensional con la sala de inicio y habitaciones normales (se modifica).
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
+    :param stats: contadores en los que se suma el resultado (opcional).
+    :return: ¿Se colocaron todas las salas?
+    """
+    stats = stats if stats is not None else RepairStats()
+    stats.layouts += 1
+    if set_other_rooms(rooms, rng):
+        stats.first_try += 1
+        return True
+    if repair_layout(rooms, stats) and set_special_rooms(rooms, rng):
+        stats.repaired += 1
+        return True
+    stats.retries += 1
+    return False
+
+
+def generate_initial_population(population_size: int, map_width: int, map_height: int, room_numbers: int,
+                                rng: random.Random | None = None, stats: RepairStats | None = None) -> list:
     """
     Generar una población inicial de individuos.
+    Los paseos aleatorios de todos los individuos se hacen a la vez (genomaVectorizado.random_walk_batch).
 
     :param population_size: tamaño de la población.
     :param map_width: ancho del piso.
     :param map_height: altura del piso.
     :param room_numbers: número de habitaciones.
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
+    :param stats: contadores de mapas reparados y vueltos a generar (opcional).
 
     :return: población inicial de individuos.
     """
-    
+    # Importación aquí: genomaVectorizado importa este módulo
+    from src.modules.levels import genomaVectorizado
+
+    assert 3 <= map_width <= 10                        # Comprobando el tamaño de la tarjeta
+    assert 3 <= map_height <= 10                       # Comprobando el tamaño de la tarjeta
+    assert room_numbers >= 5                           # Generación, tienda, tesorería, jefe, habitación secreta.
+    assert room_numbers < map_width * map_height - 3   # Es posible generar todas las habitaciones.
+
+    rng = rng or random
     population = []
-    for _ in range(population_size):
-        rooms = generate_level(map_width, map_height, room_numbers)
-        population.append(rooms)
+    while len(population) < population_size:
+        # Solo se vuelven a generar los mapas que no se pudieron reparar
+        walks = genomaVectorizado.random_walk_batch(population_size - len(population), map_width, map_height,
+                                                    room_numbers, numpy_rng(rng))
+        population.extend(rooms for rooms in genomaVectorizado.decode_population(walks) if finish_level(rooms, rng, stats))
     return population
 
 def fitness(rooms: list[list[RoomsTypes]], nRooms: tuple[int,int]) -> float:
@@ -205,52 +250,75 @@ def fitness(rooms: list[list[RoomsTypes]], nRooms: tuple[int,int]) -> float:
     """
 
     puntuacion = 0
+    features = extract_features(rooms)
 
-    if all_rooms_have_path_to_start(rooms):
+    if features.connected:
         puntuacion += 100
 
-    if(comprobaciones.exists_special_room(rooms, RoomsTypes.BOSS)):
+    if features.exists(RoomsTypes.BOSS):
         puntuacion += 50
     
-    if(comprobaciones.get_number_of_roomtype(rooms, RoomsTypes.BOSS) > 1):
+    if features.count(RoomsTypes.BOSS) > 1:
         puntuacion -= 50
 
-    if comprobaciones.exists_special_room(rooms, RoomsTypes.TREASURE):
+    if features.exists(RoomsTypes.TREASURE):
         puntuacion += 10
     
-    if comprobaciones.exists_special_room(rooms, RoomsTypes.SHOP):
+    if features.exists(RoomsTypes.SHOP):
         puntuacion += 10
 
-    if comprobaciones.exists_special_room(rooms, RoomsTypes.SECRET):
+    if features.exists(RoomsTypes.SECRET):
         puntuacion += 10
-        if comprobaciones.get_number_of_roomtype(rooms, RoomsTypes.SECRET) > 1:
+        if features.count(RoomsTypes.SECRET) > 1:
             puntuacion += 10
 
-    if comprobaciones.exists_special_room(rooms, RoomsTypes.SPAWN):
+    if features.exists(RoomsTypes.SPAWN):
         puntuacion += 20
     
-    if nRooms[0] <= comprobaciones.count_rooms(rooms) <= nRooms[1]:
+    if nRooms[0] <= features.rooms <= nRooms[1]:
         puntuacion += 30
     
-    if comprobaciones.count_rooms(rooms) < nRooms[0]:
+    if features.rooms < nRooms[0]:
         puntuacion -= 30
 
-    if comprobaciones.distance_between_start_and_boss(rooms) > 10:
+    if features.boss_distance > 10:
         puntuacion += 30
     
     return puntuacion
 
-def crossover(parent1: list[list[RoomsTypes]], parent2: list[list[RoomsTypes]]) -> list[list[RoomsTypes]]:
+def cached_fitness(rooms: list[list[RoomsTypes]], nRooms: tuple[int,int], cache: FitnessCache | None = None) -> float:
+    """
+    Función de aptitud pasando por la caché (si se indica).
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :param nRooms: rango de número de habitaciones.
+    :param cache: caché de puntuaciones.
+
+    :return: puntuación de aptitud.
+    """
+    if cache is None:
+        return fitness(rooms, nRooms)
+    key = layout_key(rooms, nRooms)
+    score = cache.get(key)
+    if score is None:
+        score = fitness(rooms, nRooms)
+        cache.put(key, score)
+    return score
+
+def crossover(parent1: list[list[RoomsTypes]], parent2: list[list[RoomsTypes]],
+              rng: random.Random | None = None) -> list[list[RoomsTypes]]:
     """
     Cruce de dos padres para crear un hijo, mediante un punto de corte aleatorio.
 
     :param parent1: matriz bidimensional de valores de RoomsTypes.
     :param parent2: matriz bidimensional de valores de RoomsTypes.
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
 
     :return: matriz bidimensional de valores de RoomsTypes.
     """
-    crossover_point_x = random.randint(0, len(parent1[0]) - 1)
-    crossover_point_y = random.randint(0, len(parent1) - 1)
+    rng = rng or random
+    crossover_point_x = rng.randint(0, len(parent1[0]) - 1)
+    crossover_point_y = rng.randint(0, len(parent1) - 1)
 
     # Crear una nueva matriz para el hijo
     child = [[None] * len(parent1[0]) for _ in range(len(parent1))]
@@ -265,16 +333,19 @@ def crossover(parent1: list[list[RoomsTypes]], parent2: list[list[RoomsTypes]])
 
     return child
 
-def mutate(rooms: list[list[RoomsTypes]], mutation_prob: float, mutation_rate: float) -> list[list[RoomsTypes]]:
+def mutate(rooms: list[list[RoomsTypes]], mutation_prob: float, mutation_rate: float,
+           rng: random.Random | None = None) -> list[list[RoomsTypes]]:
     """
     Mutación de habitaciones. Cambia aleatoriamente el tipo de habitación en una fracción de las habitaciones.
 
     :param rooms: matriz bidimensional de valores de RoomsTypes.
     :param mutation_prob: probabilidad de mutación.
     :param mutation_rate: tasa de mutación.
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
 
     :return: matriz bidimensional de valores de RoomsTypes.
     """
+    rng = rng or random
 
     mutated_rooms = [row[:] for row in rooms]   # Copiar la matriz de habitaciones
 
@@ -282,30 +353,39 @@ def mutate(rooms: list[list[RoomsTypes]], mutation_prob: float, mutation_rate: f
     num_mutations = int(comprobaciones.count_rooms(rooms) * mutation_rate)
 
     for _ in range(num_mutations):
-        y = random.randint(0, len(rooms) - 1)
-        x = random.randint(0, len(rooms[0]) - 1)
-        if random.random() < mutation_prob:
+        y = rng.randint(0, len(rooms) - 1)
+        x = rng.randint(0, len(rooms[0]) - 1)
+        if rng.random() < mutation_prob:
             # Se cambia el tipo de habitación / o añade sala si antes era empty
             if rooms[y][x] != RoomsTypes.SPAWN:             # No se puede cambiar la sala de inicio si no da error
-                mutated_rooms[y][x] = random.choice([RoomsTypes.DEFAULT, RoomsTypes.TREASURE, RoomsTypes.SHOP])
+                mutated_rooms[y][x] = rng.choice([RoomsTypes.DEFAULT, RoomsTypes.TREASURE, RoomsTypes.SHOP])
     
     return mutated_rooms
 
-def select_parents_baker(population, fitness_scores):
+def select_parents_baker(population, fitness_scores, rng: random.Random | None = None):
     """
     Selección de padres mediante el método de la ruleta de Baker.
 
     :param population: población de individuos.
     :param fitness_scores: puntuaciones de aptitud de los individuos.
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
 
     :return: dos padres seleccionados.
     """
-    total_fitness = sum(score for _, score in fitness_scores)
-    normalized_weights = [score / total_fitness for _, score in fitness_scores]
-    parents = random.choices(population, weights=normalized_weights, k=2)
+    rng = rng or random
+    # Las puntuaciones negativas cuentan como cero; si todas son cero, la elección es uniforme
+    weights = [max(0.0, score) for _, score in fitness_scores]
+    parents = rng.choices(population, weights=weights if sum(weights) > 0 else None, k=2)
     return parents
 
-def steady_state_genetic_algorithm(population_size: int, map_width: int, map_height: int, room_numbers: tuple[int,int], generations: int) -> list[list[RoomsTypes]]:
+def steady_state_genetic_algorithm(population_size: int, map_width: int, map_height: int, room_numbers: tuple[int,int], generations: int,
+                                   cache: FitnessCache | None = None,
+                                   evaluator: FitnessEvaluator | None = None,
+                                   stopping: StoppingCriteria | None = None,
+                                   rng: random.Random | None = None,
+                                   selection: ParentSelector | None = None,
+                                   observers: Iterable[Callable[[GenerationEvent], None]] | None = None
+                                   ) -> list[list[RoomsTypes]]:
     """
     Algoritmo genético de estado estable.
 
@@ -314,27 +394,78 @@ def steady_state_genetic_algorithm(population_size: int, map_width: int, map_hei
     :param map_height: altura del piso.
     :param room_numbers: rango de número de habitaciones.
     :param generations: número de generaciones.
+    :param cache: caché de aptitud (si no se indica se usa una nueva para esta ejecución).
+    :param evaluator: ejecutor de la aptitud (en serie si no se indica).
+    :param stopping: criterios de parada anticipada (guarda la generación en la que se detuvo).
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
+    :param selection: selección de padres (por defecto, ruleta de Baker).
+    :param observers: funciones que reciben un GenerationEvent después de cada generación (ver telemetria).
 
     :return: matriz bidimensional de valores de RoomsTypes.
     """
-    
-    population = generate_initial_population(population_size, map_width, map_height, room_numbers[0])
-    for _ in range(generations):
-        fitness_scores = [(individual, fitness(individual, room_numbers)) for individual in population]
-        new_population = []
-
-        for _ in range(population_size):
-            parent1, parent2 = select_parents_baker(population, fitness_scores)
-            child = mutate(crossover(parent1, parent2), mutation_prob=0.05, mutation_rate=0.15)
-            new_population.append(child)
+    cache = cache if cache is not None else FitnessCache()
+    evaluator = evaluator if evaluator is not None else FitnessEvaluator()
+    repairs = RepairStats()
+    reporter = GenerationReporter('steady_state', observers, cache, evaluator, repairs) if observers else None
+    if stopping is not None:
+        stopping.reset()
+    population = generate_initial_population(population_size, map_width, map_height, room_numbers[0], rng, repairs)
+    scores = evaluator.evaluate(population, room_numbers, fitness, cache)
+    if reporter is not None:
+        reporter.emit(0, scores, population)
+    for generation in range(generations):
+        if stopping is not None and stopping.should_stop(generation, scores, population):
+            break
+        population, scores = steady_state_generation(population, scores, room_numbers, cache, evaluator, rng,
+                                                     selection)
+        if reporter is not None:
+            reporter.emit(generation + 1, scores, population)
+    if stopping is not None:
+        stopping.finish(generations)
+
+    return population[scores.index(max(scores))]
+
+def steady_state_generation(population: list, scores: list[float], room_numbers: tuple[int,int],
+                            cache: FitnessCache | None, evaluator: FitnessEvaluator,
+                            rng: random.Random | None = None,
+                            selection: ParentSelector | None = None) -> tuple[list, list[float]]:
+    """
+    Una generación del algoritmo genético de estado estable: se crean tantos hijos como individuos
+    y se conservan los mejores entre padres e hijos.
 
-        combined_population = population + new_population
-        fitness_scores = [(individual, fitness(individual, room_numbers)) for individual in combined_population]
-        population = sorted(combined_population, key=lambda individual: fitness(individual, room_numbers), reverse=True)[:population_size]
+    :param population: población de individuos.
+    :param scores: puntuaciones de aptitud de la población (mismo orden).
+    :param room_numbers: rango de número de habitaciones.
+    :param cache: caché de aptitud.
+    :param evaluator: ejecutor de la aptitud.
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
+    :param selection: selección de padres (por defecto, ruleta de Baker).
 
-    return max(population, key=lambda individual: fitness(individual, room_numbers))
+    :return: nueva población y sus puntuaciones, ordenadas de mejor a peor.
+    """
+    population_size = len(population)
+    selection = selection if selection is not None else ParentSelector()
+    selection.prepare(scores)
+    new_population = []
 
-def generational_genetic_algorithm(population_size: int, map_width: int, map_height: int, room_numbers: tuple[int,int], generations: int) -> list[list[RoomsTypes]]:
+    for _ in range(population_size):
+        parent1, parent2 = selection.select_parents(population, rng)
+        child = mutate(crossover(parent1, parent2, rng), mutation_prob=0.05, mutation_rate=0.15, rng=rng)
+        new_population.append(child)
+
+    combined_population = population + new_population
+    combined_scores = scores + evaluator.evaluate(new_population, room_numbers, fitness, cache)
+    best = sorted(range(len(combined_population)), key=lambda i: combined_scores[i], reverse=True)[:population_size]
+    return [combined_population[i] for i in best], [combined_scores[i] for i in best]
+
+def generational_genetic_algorithm(population_size: int, map_width: int, map_height: int, room_numbers: tuple[int,int], generations: int,
+                                   cache: FitnessCache | None = None,
+                                   evaluator: FitnessEvaluator | None = None,
+                                   stopping: StoppingCriteria | None = None,
+                                   rng: random.Random | None = None,
+                                   selection: ParentSelector | None = None,
+                                   observers: Iterable[Callable[[GenerationEvent], None]] | None = None
+                                   ) -> list[list[RoomsTypes]]:
     """
     Algoritmo genético generacional.
 
@@ -343,21 +474,46 @@ def generational_genetic_algorithm(population_size: int, map_width: int, map_hei
     :param map_height: altura del piso.
     :param room_numbers: rango de número de habitaciones.
     :param generations: número de generaciones.
+    :param cache: caché de aptitud (si no se indica se usa una nueva para esta ejecución).
+    :param evaluator: ejecutor de la aptitud (en serie si no se indica).
+    :param stopping: criterios de parada anticipada (guarda la generación en la que se detuvo).
+    :param rng: generador de números aleatorios (por defecto, el módulo random).
+    :param selection: selección de padres (por defecto, ruleta de Baker).
+    :param observers: funciones que reciben un GenerationEvent después de cada generación (ver telemetria).
 
     :return: matriz bidimensional de valores de RoomsTypes.
     """
-    
-    population = generate_initial_population(population_size, map_width, map_height, room_numbers[0])
-    for _ in range(generations):
-        fitness_scores = [(individual, fitness(individual, room_numbers)) for individual in population]
+    cache = cache if cache is not None else FitnessCache()
+    evaluator = evaluator if evaluator is not None else FitnessEvaluator()
+    selection = selection if selection is not None else ParentSelector()
+    repairs = RepairStats()
+    reporter = GenerationReporter('generational', observers, cache, evaluator, repairs) if observers else None
+    if stopping is not None:
+        stopping.reset()
+    population = generate_initial_population(population_size, map_width, map_height, room_numbers[0], rng, repairs)
+    scores = evaluator.evaluate(population, room_numbers, fitness, cache)
+    if reporter is not None:
+        reporter.emit(0, scores, population)
+    for generation in range(generations):
+        if stopping is not None and stopping.should_stop(generation, scores, population):
+            break
+        selection.prepare(scores)
+        # Los mejores pasan sin cambios (elitismo) y el resto de la generación son hijos
+        elite = selection.elite(scores)
         new_population = []
-        for _ in range(population_size):
-            parent1, parent2 = select_parents_baker(population, fitness_scores)
-            child = mutate(crossover(parent1, parent2), mutation_prob=0.05, mutation_rate=0.15)
+        for _ in range(population_size - len(elite)):
+            parent1, parent2 = selection.select_parents(population, rng)
+            child = mutate(crossover(parent1, parent2, rng), mutation_prob=0.05, mutation_rate=0.15, rng=rng)
             new_population.append(child)
-        population = new_population
-
-    return max(population, key=lambda individual: fitness(individual, room_numbers))
+        new_scores = evaluator.evaluate(new_population, room_numbers, fitness, cache)
+        population = [population[i] for i in elite] + new_population
+        scores = [scores[i] for i in elite] + new_scores
+        if reporter is not None:
+            reporter.emit(generation + 1, scores, population)
+    if stopping is not None:
+        stopping.finish(generations)
+
+    return population[scores.index(max(scores))]
 
 def print_rooms(rooms):
     for row in rooms:
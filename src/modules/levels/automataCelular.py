@@ -13,13 +13,22 @@ ENEMY_2 = 7
 ENEMY_3 = 8
 SPIKES = 9
 
-def cellular_automatan():
+ENEMIES = (ENEMY_1, ENEMY_2, ENEMY_3)
+NUM_TYPES = 10
+# Desplazamientos (dy, dx) de los ocho vecinos
+NEIGHBOR_OFFSETS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)]
+
+def cellular_automatan(rng: np.random.Generator | None = None, vectorized: bool = True):
     """
         Crea un mapa de celdas para la generación de entidades
         inspirado en el juego de la vida de Conway.
 
+        :param rng: generador de números aleatorios (por defecto, np.random).
+        :param vectorized: aplicar las reglas a toda la matriz a la vez (step_vectorized) en lugar de celda a celda.
+
         :return: matriz de celdas (la habitación).
     """
+    rng = rng if rng is not None else np.random
     
     step = 5
     initial_density = 0.5
@@ -28,54 +37,123 @@ def cellular_automatan():
 
     # entidades iniciales
     num_entities = int(initial_density * consts.ROOM_HEIGHT * consts.ROOM_WIDTH)
-    indices = np.random.choice(consts.ROOM_HEIGHT * consts.ROOM_WIDTH, num_entities, replace=False)
+    indices = rng.choice(consts.ROOM_HEIGHT * consts.ROOM_WIDTH, num_entities, replace=False)
     y, x = np.unravel_index(indices, (consts.ROOM_HEIGHT, consts.ROOM_WIDTH))
-    room[y,x] = np.random.choice([ROCK, POOP, WEB, FIRE, UNIQUE_OBJECT, ENEMY_1, ENEMY_2, ENEMY_3, SPIKES], num_entities)
+    room[y,x] = rng.choice([ROCK, POOP, WEB, FIRE, UNIQUE_OBJECT, ENEMY_1, ENEMY_2, ENEMY_3, SPIKES], num_entities)
 
     """print("Habitacion inicial")
     print(room)
     print("Numero de enemigos: ", count_enemy(room))"""
 
     for _ in range(step):
-        new_room = room.copy()
-        for y in range(consts.ROOM_HEIGHT):
-            for x in range(consts.ROOM_WIDTH):
-
-                neighbors = count_neighbors(room, y, x)
-                num_neighbors = count_neighbors_not_empty(room, y, x)
-
-                entity = room[y,x]
-                
-                if (y in [0, consts.ROOM_HEIGHT - 1]) and (x in [0, consts.ROOM_WIDTH - 1]):
-                    #esquina
-                    new_room[y, x] = FIRE
-                elif entity in [ENEMY_1, ENEMY_2, ENEMY_3]:
-                    # Reglas del juego de la vida de Conway para reducir el número de enemigos
-                    if num_neighbors < 2 or num_neighbors > 3:
-                        new_room[y,x] = EMPTY
-                    else:
-                        new_room[y,x] = entity
-                elif entity == EMPTY:
-                    if neighbors[ROCK] > 0 and np.random.random() > 0.9:
-                        new_room[y,x] = ROCK
-                    elif neighbors[POOP] > 0 and np.random.random() > 0.95:
-                        new_room[y,x] = POOP
-                    elif neighbors[UNIQUE_OBJECT] == 0 and np.random.random() > 0.99:
-                        new_room[y,x] =  UNIQUE_OBJECT
-                elif entity == UNIQUE_OBJECT:
-                    if neighbors[EMPTY] > 8:
-                        new_room[y,x] = np.random.choice([EMPTY, UNIQUE_OBJECT])
-                elif entity == POOP:
-                    if neighbors[POOP] > 2:
-                        new_room[y,x] = SPIKES
-                elif neighbors[WEB] == 0:
-                    new_room[y,x] = WEB
+        room = step_vectorized(room, rng) if vectorized else step_loop(room, rng)
+    
+    return room
+
+def step_loop(room, rng):
+    """
+        Un paso del autómata recorriendo las celdas una a una.
+
+        :param room: matriz de celdas.
+        :param rng: generador de números aleatorios.
+
+        :return: nueva matriz de celdas.
+    """
+    new_room = room.copy()
+    for y in range(consts.ROOM_HEIGHT):
+        for x in range(consts.ROOM_WIDTH):
+
+            neighbors = count_neighbors(room, y, x)
+            num_neighbors = count_neighbors_not_empty(room, y, x)
+
+            entity = room[y,x]
+            
+            if (y in [0, consts.ROOM_HEIGHT - 1]) and (x in [0, consts.ROOM_WIDTH - 1]):
+                #esquina
+                new_room[y, x] = FIRE
+            elif entity in [ENEMY_1, ENEMY_2, ENEMY_3]:
+                # Reglas del juego de la vida de Conway para reducir el número de enemigos
+                if num_neighbors < 2 or num_neighbors > 3:
+                    new_room[y,x] = EMPTY
                 else:
                     new_room[y,x] = entity
+            elif entity == EMPTY:
+                if neighbors[ROCK] > 0 and rng.random() > 0.9:
+                    new_room[y,x] = ROCK
+                elif neighbors[POOP] > 0 and rng.random() > 0.95:
+                    new_room[y,x] = POOP
+                elif neighbors[UNIQUE_OBJECT] == 0 and rng.random() > 0.99:
+                    new_room[y,x] =  UNIQUE_OBJECT
+            elif entity == UNIQUE_OBJECT:
+                if neighbors[EMPTY] > 8:
+                    new_room[y,x] = rng.choice([EMPTY, UNIQUE_OBJECT])
+            elif entity == POOP:
+                if neighbors[POOP] > 2:
+                    new_room[y,x] = SPIKES
+            elif neighbors[WEB] == 0:
+                new_room[y,x] = WEB
+            else:
+                new_room[y,x] = entity
+
+    return new_room
+
+def step_vectorized(room, rng):
+    """
+        Un paso del autómata con las mismas reglas que step_loop aplicadas a toda la matriz a la vez:
+        los vecinos salen de neighbor_counts y cada regla es una asignación con máscara.
+        Los números aleatorios se sacan de una vez (uno por celda y regla), así que la distribución
+        es la misma que la de step_loop, aunque con la misma semilla no se obtiene la misma habitación.
 
-        room = new_room
-    
-    return room
+        :param room: matriz de celdas.
+        :param rng: generador de números aleatorios.
+
+        :return: nueva matriz de celdas.
+    """
+    counts = neighbor_counts(room)
+    num_neighbors = counts[EMPTY + 1:].sum(axis=0)
+    draws = rng.random((3,) + room.shape)
+    new_room = room.copy()
+
+    # Reglas del juego de la vida de Conway para reducir el número de enemigos
+    new_room[np.isin(room, ENEMIES) & ((num_neighbors < 2) | (num_neighbors > 3))] = EMPTY
+
+    empty = room == EMPTY
+    rock = empty & (counts[ROCK] > 0) & (draws[0] > 0.9)
+    poop = empty & ~rock & (counts[POOP] > 0) & (draws[1] > 0.95)
+    unique = empty & ~rock & ~poop & (counts[UNIQUE_OBJECT] == 0) & (draws[2] > 0.99)
+    new_room[rock] = ROCK
+    new_room[poop] = POOP
+    new_room[unique] = UNIQUE_OBJECT
+
+    lonely = (room == UNIQUE_OBJECT) & (counts[EMPTY] > 8)
+    if lonely.any():
+        new_room[lonely] = rng.choice([EMPTY, UNIQUE_OBJECT], np.count_nonzero(lonely))
+
+    new_room[(room == POOP) & (counts[POOP] > 2)] = SPIKES
+    new_room[np.isin(room, (ROCK, WEB, FIRE, SPIKES)) & (counts[WEB] == 0)] = WEB
+
+    # esquinas
+    new_room[[0, 0, -1, -1], [0, -1, 0, -1]] = FIRE
+    return new_room
+
+def neighbor_counts(room):
+    """
+        Cuenta los vecinos de cada tipo de entidad de todas las celdas a la vez,
+        sumando la matriz de tipos (una capa por tipo) desplazada hacia los ocho vecinos.
+
+        :param room: matriz de celdas.
+
+        :return: matriz (tipo de entidad, y, x) con el número de vecinos de cada tipo.
+    """
+    height, width = room.shape
+    layers = np.zeros((NUM_TYPES, height + 2, width + 2), dtype=np.int8)
+    rows, cols = np.indices(room.shape)
+    layers[room, rows + 1, cols + 1] = 1
+
+    counts = np.zeros((NUM_TYPES, height, width), dtype=np.int8)
+    for dy, dx in NEIGHBOR_OFFSETS:
+        counts += layers[:, 1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+    return counts
 
 def count_neighbors(room, i, j):
     """
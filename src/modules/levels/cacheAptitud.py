@@ -0,0 +1,108 @@
+"""
+Caché de la función de aptitud del algoritmo genético.
+
+Los mapas se identifican por una clave canónica (rango de habitaciones, ancho y los tipos de todas las celdas),
+de modo que dos individuos iguales comparten la misma puntuación aunque sean listas distintas.
+"""
+
+import collections
+
+from src.tipos import RoomsTypes
+
+# Código de un byte para cada tipo de habitación
+_ROOM_CODES: dict[RoomsTypes, int] = {room_type: code for code, room_type in enumerate(RoomsTypes)}
+
+
+def layout_key(rooms: list[list[RoomsTypes]], nRooms: tuple[int, int]) -> tuple[tuple[int, int], int, bytes]:
+    """
+    Clave canónica de un mapa para la caché.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :param nRooms: rango de número de habitaciones (la aptitud depende de él).
+    :return: clave que se puede usar en un diccionario.
+    """
+    return tuple(nRooms), len(rooms[0]), bytes(_ROOM_CODES[room] for row in rooms for room in row)
+
+
+class FitnessCache:
+    """
+    Caché LRU de puntuaciones de aptitud con contadores de aciertos y fallos.
+
+    :param maxsize: número máximo de mapas guardados (los menos usados se descartan primero).
+    """
+    def __init__(self, maxsize: int = 4096):
+        assert maxsize > 0, "El tamaño de la caché debe ser positivo."
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.scores: collections.OrderedDict[tuple, float] = collections.OrderedDict()
+
+    def get(self, key: tuple) -> float | None:
+        """
+        Obtener la puntuación guardada.
+
+        :param key: clave del mapa (ver layout_key).
+        :return: puntuación o None si no está en la caché.
+        """
+        score = self.scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.scores.move_to_end(key)
+        return score
+
+    def put(self, key: tuple, score: float):
+        """
+        Guardar una puntuación, descartando la menos usada si la caché está llena.
+
+        :param key: clave del mapa (ver layout_key).
+        :param score: puntuación de aptitud.
+        """
+        self.scores[key] = score
+        self.scores.move_to_end(key)
+        if len(self.scores) > self.maxsize:
+            self.scores.popitem(last=False)
+
+    def update(self, scores: dict[tuple, float]):
+        """
+        Guardar puntuaciones ya calculadas (por ejemplo, las de otra caché), sin contar aciertos ni fallos.
+
+        :param scores: puntuaciones por clave del mapa (ver layout_key).
+        """
+        for key, score in scores.items():
+            self.put(key, score)
+
+    def clear(self):
+        """
+        Vaciar la caché y reiniciar los contadores.
+        """
+        self.scores.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Proporción de consultas que se han resuelto desde la caché.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Estadísticas de uso de la caché.
+
+        :return: diccionario con aciertos, fallos, tamaño actual, tamaño máximo y tasa de aciertos.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.scores),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        return len(self.scores)
@@ -0,0 +1,129 @@
+"""
+Criterios de parada anticipada de los algoritmos genéticos.
+
+Los algoritmos comprueban los criterios antes de cada generación y se detienen si:
+ - el mejor individuo alcanza la aptitud máxima conocida;
+ - el mejor individuo no mejora durante varias generaciones (estancamiento);
+ - la población es casi idéntica (diversidad mínima);
+ - se agota el tiempo disponible (generación "en cualquier momento": se devuelve el mejor encontrado hasta entonces).
+"""
+
+import time
+
+import numpy as np
+
+from src.modules.levels.cacheAptitud import layout_key
+
+# Puntuación máxima que puede dar algoritmoGenetico.fitness
+MAX_FITNESS = 270
+
+
+def population_diversity(population: list | np.ndarray) -> float:
+    """
+    Proporción de individuos distintos en la población.
+
+    :param population: lista de mapas de RoomsTypes o matriz (población, alto, ancho) de códigos.
+    :return: número de mapas distintos dividido por el tamaño de la población.
+    """
+    if not len(population):
+        return 0.0
+    if isinstance(population, np.ndarray):
+        distinct = len(np.unique(population.reshape(len(population), -1), axis=0))
+    else:
+        distinct = len({layout_key(rooms, (0, 0)) for rooms in population})
+    return distinct / len(population)
+
+
+class StoppingCriteria:
+    """
+    Criterios de parada de una ejecución. Después de la ejecución guarda en qué generación y por qué se detuvo.
+
+    :param max_fitness: detener al alcanzar esta aptitud (None para no usarlo).
+    :param stagnation: detener si el mejor no mejora durante estas generaciones (None para no usarlo).
+    :param min_diversity: detener si la diversidad de la población baja de este valor (None para no usarlo).
+    :param time_budget_ms: detener al pasar estos milisegundos desde reset(), contando la población inicial
+                           (None para no usarlo).
+    """
+    def __init__(self,
+                 max_fitness: float | None = MAX_FITNESS,
+                 stagnation: int | None = None,
+                 min_diversity: float | None = None,
+                 time_budget_ms: float | None = None):
+        self.max_fitness = max_fitness
+        self.stagnation = stagnation
+        self.min_diversity = min_diversity
+        self.time_budget_ms = time_budget_ms
+
+        self.stopped_at: int | None = None  # Generaciones ejecutadas
+        self.reason: str | None = None  # "max_fitness", "stagnation", "diversity", "time_budget" o "generations"
+        self.best_fitness: float | None = None
+        self.stagnant_generations = 0
+        self.started_at = time.perf_counter()
+
+    def reset(self):
+        """
+        Preparar los criterios para una nueva ejecución.
+        """
+        self.stopped_at = None
+        self.reason = None
+        self.best_fitness = None
+        self.stagnant_generations = 0
+        self.started_at = time.perf_counter()
+
+    def copy_result(self, other: 'StoppingCriteria'):
+        """
+        Guardar el resultado de una ejecución hecha con otros criterios (por ejemplo, una copia con otro límite de tiempo).
+
+        :param other: criterios con los que se hizo la ejecución.
+        """
+        self.stopped_at = other.stopped_at
+        self.reason = other.reason
+        self.best_fitness = other.best_fitness
+        self.stagnant_generations = other.stagnant_generations
+        self.started_at = other.started_at
+
+    def should_stop(self, generation: int, scores: list[float] | np.ndarray, population: list | np.ndarray) -> bool:
+        """
+        Comprobar los criterios antes de ejecutar una generación.
+
+        :param generation: número de generaciones ya ejecutadas.
+        :param scores: puntuaciones de aptitud de la población actual.
+        :param population: población actual.
+        :return: ¿Hay que detener la ejecución?
+        """
+        best = max(scores)
+        if self.best_fitness is None or best > self.best_fitness:
+            self.best_fitness = best
+            self.stagnant_generations = 0
+        else:
+            self.stagnant_generations += 1
+
+        if self.max_fitness is not None and best >= self.max_fitness:
+            self.reason = 'max_fitness'
+        elif self.stagnation is not None and self.stagnant_generations >= self.stagnation:
+            self.reason = 'stagnation'
+        elif self.min_diversity is not None and population_diversity(population) < self.min_diversity:
+            self.reason = 'diversity'
+        elif self.time_budget_ms is not None and self.elapsed_ms() >= self.time_budget_ms:
+            self.reason = 'time_budget'
+        else:
+            return False
+
+        self.stopped_at = generation
+        return True
+
+    def elapsed_ms(self) -> float:
+        """
+        :return: milisegundos desde el inicio de la ejecución (reset()).
+        """
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def finish(self, generations: int):
+        """
+        Marcar que la ejecución terminó todas las generaciones sin detenerse antes.
+
+        :param generations: número de generaciones ejecutadas.
+        """
+        if self.stopped_at is None:
+            self.stopped_at = generations
+            self.reason = 'generations'
@@ -0,0 +1,118 @@
+"""
+Evaluación de la aptitud de la población en serie, con hilos o con procesos.
+
+Los individuos se reparten en bloques para que cada tarea enviada al ejecutor evalúe varios mapas
+y el coste de comunicación entre procesos se reparta. El orden de las puntuaciones no depende del
+ejecutor, así que el resultado es idéntico al de la evaluación en serie.
+"""
+
+import concurrent.futures
+import itertools
+import math
+import os
+from typing import Callable
+
+from src.tipos import RoomsTypes
+from src.modules.levels.cacheAptitud import FitnessCache, layout_key
+
+BACKENDS = ('serial', 'thread', 'process')
+
+
+def _score_chunk(fitness_function: Callable, chunk: list[list[list[RoomsTypes]]],
+                 nRooms: tuple[int, int]) -> list[float]:
+    """
+    Evaluar un bloque de individuos (se ejecuta en el hilo o proceso trabajador).
+
+    :param fitness_function: función de aptitud.
+    :param chunk: bloque de individuos.
+    :param nRooms: rango de número de habitaciones.
+    :return: puntuaciones del bloque, en el mismo orden.
+    """
+    return [fitness_function(rooms, nRooms) for rooms in chunk]
+
+
+class FitnessEvaluator:
+    """
+    Ejecutor de la función de aptitud para poblaciones completas.
+
+    :param backend: "serial", "thread" (hilos) o "process" (procesos).
+    :param workers: número de trabajadores (por defecto, el número de núcleos).
+    :param chunksize: individuos por tarea (por defecto, se reparte la población entre los trabajadores).
+    """
+    def __init__(self, backend: str = 'serial', workers: int | None = None, chunksize: int | None = None):
+        assert backend in BACKENDS, f"Ejecutor desconocido: {backend}. Opciones: {BACKENDS}."
+
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.evaluations = 0  # Llamadas a la función de aptitud (sin contar los aciertos de la caché)
+        self.executor: concurrent.futures.Executor | None = None
+        if backend == 'thread':
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        elif backend == 'process':
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+
+    def evaluate(self, population: list[list[list[RoomsTypes]]], nRooms: tuple[int, int],
+                 fitness_function: Callable, cache: FitnessCache | None = None) -> list[float]:
+        """
+        Puntuaciones de aptitud de toda la población.
+
+        :param population: población de individuos.
+        :param nRooms: rango de número de habitaciones.
+        :param fitness_function: función de aptitud (debe poder enviarse a otro proceso).
+        :param cache: caché de aptitud; solo se evalúan los mapas que no estén en ella.
+        :return: puntuaciones en el mismo orden que la población.
+        """
+        scores: list[float | None] = [None] * len(population)
+        pending: dict[tuple, list[int]] = {}  # Clave del mapa -> posiciones en la población
+        pending_rooms = []
+        for i, rooms in enumerate(population):
+            key = layout_key(rooms, nRooms)
+            if key in pending:
+                pending[key].append(i)
+                continue
+            if cache is not None and (score := cache.get(key)) is not None:
+                scores[i] = score
+                continue
+            pending[key] = [i]
+            pending_rooms.append(rooms)
+
+        self.evaluations += len(pending_rooms)
+        for (key, positions), score in zip(pending.items(), self.map_scores(pending_rooms, nRooms, fitness_function)):
+            if cache is not None:
+                cache.put(key, score)
+            for i in positions:
+                scores[i] = score
+        return scores
+
+    def map_scores(self, population: list[list[list[RoomsTypes]]], nRooms: tuple[int, int],
+                   fitness_function: Callable) -> list[float]:
+        """
+        Evaluar los individuos en el ejecutor elegido, por bloques.
+
+        :param population: individuos a evaluar.
+        :param nRooms: rango de número de habitaciones.
+        :param fitness_function: función de aptitud.
+        :return: puntuaciones en el mismo orden.
+        """
+        if self.executor is None or len(population) < 2:
+            return _score_chunk(fitness_function, population, nRooms)
+
+        chunksize = self.chunksize or math.ceil(len(population) / self.workers)
+        chunks = [population[i:i + chunksize] for i in range(0, len(population), chunksize)]
+        results = self.executor.map(_score_chunk, itertools.repeat(fitness_function), chunks, itertools.repeat(nRooms))
+        return [score for chunk_scores in results for score in chunk_scores]
+
+    def close(self):
+        """
+        Detener los trabajadores.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self) -> 'FitnessEvaluator':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,161 @@
+"""
+Generación masiva de mapas de piso sin pygame.
+
+    python -m src.modules.levels.generacionMasiva --count 20000 --output mapas.jsonl
+
+Genera N mapas por tipo de piso repartidos entre varios procesos y los escribe, a medida que terminan,
+en un único archivo JSON Lines (un mapa por línea). Cada mapa usa una semilla derivada de (semilla, piso, índice),
+así que con la misma semilla se vuelve a generar el mismo corpus (salvo con límite de tiempo).
+Solo se ejecuta el algoritmo genético: no se importa pygame ni se crean habitaciones (Room).
+"""
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Iterable, TextIO
+
+from src.tipos import FloorsTypes, RoomsTypes
+from src.modules.levels.LevelGenerator import generate_level, FLOOR_ROOM_NUMBERS
+from src.utils.semillas import derive_seed, new_seed
+
+# Mismos símbolos que Level.download_level_map_to_file
+ROOM_SYMBOLS: dict[RoomsTypes, str] = {
+    RoomsTypes.EMPTY: '__',
+    RoomsTypes.DEFAULT: 'DE',
+    RoomsTypes.SECRET: 'SE',
+    RoomsTypes.SHOP: 'SH',
+    RoomsTypes.BOSS: 'BO',
+    RoomsTypes.TREASURE: 'TR',
+    RoomsTypes.SPAWN: 'SP',
+}
+SYMBOL_ROOMS: dict[str, RoomsTypes] = {symbol: room_type for room_type, symbol in ROOM_SYMBOLS.items()}
+
+
+def layout_to_rows(rooms: list[list[RoomsTypes]]) -> list[str]:
+    """
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :return: una cadena por fila con los símbolos de las habitaciones separados por comas.
+    """
+    return [','.join(ROOM_SYMBOLS[room] for room in row) for row in rooms]
+
+
+def layout_from_rows(rows: list[str]) -> list[list[RoomsTypes]]:
+    """
+    :param rows: filas escritas por layout_to_rows.
+    :return: matriz bidimensional de valores de RoomsTypes.
+    """
+    return [[SYMBOL_ROOMS[symbol] for symbol in row.split(',')] for row in rows]
+
+
+def generate_chunk(floor_type: FloorsTypes, start: int, count: int, seed: int, options: dict) -> list[str]:
+    """
+    Generar un bloque de mapas de un piso (se ejecuta en un proceso del grupo).
+
+    :param floor_type: tipo de piso.
+    :param start: índice del primer mapa del bloque.
+    :param count: número de mapas del bloque.
+    :param seed: semilla del corpus.
+    :param options: argumentos con nombre de generate_level (algoritmo, límite de tiempo, ...).
+    :return: una línea JSON por mapa.
+    """
+    options = dict(options)
+    map_width = options.pop('map_width', 10)
+    map_height = options.pop('map_height', 6)
+    lines = []
+    for index in range(start, start + count):
+        map_seed = derive_seed(seed, floor_type.value, index)
+        rooms = generate_level(map_width, map_height, FLOOR_ROOM_NUMBERS[floor_type], rng=random.Random(map_seed),
+                               **options)
+        lines.append(json.dumps({'floor': floor_type.value, 'index': index, 'seed': map_seed,
+                                 'rooms': layout_to_rows(rooms)}))
+    return lines
+
+
+def generate_corpus(file: TextIO, count: int, floors: Iterable[FloorsTypes] = FloorsTypes, seed: int | None = None,
+                    workers: int | None = None, chunk_size: int = 50,
+                    progress: Callable[[int, int, float], None] | None = None, **options) -> int:
+    """
+    Generar count mapas de cada piso en un grupo de procesos y escribirlos en el archivo a medida que terminan.
+
+    :param file: archivo de texto en el que se escribe una línea JSON por mapa (en el orden en que terminan).
+    :param count: número de mapas por tipo de piso.
+    :param floors: tipos de piso.
+    :param seed: semilla del corpus (por defecto, aleatoria).
+    :param workers: número de procesos (por defecto, uno por núcleo).
+    :param chunk_size: mapas que genera cada tarea; como mucho hay 2 * workers tareas pendientes en memoria.
+    :param progress: función que recibe (mapas escritos, total, segundos) después de cada bloque.
+    :param options: argumentos con nombre de generate_level (algorithm, vectorized, time_budget_ms, ...)
+                    y map_width/map_height.
+    :return: número de mapas escritos.
+    """
+    seed = seed if seed is not None else new_seed()
+    tasks = [(floor_type, start, min(chunk_size, count - start))
+             for floor_type in floors for start in range(0, count, chunk_size)]
+    total = sum(size for _, _, size in tasks)
+
+    written = 0
+    start_time = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    pending_tasks = iter(tasks)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        # Solo hay unos pocos bloques pendientes a la vez (dos por proceso): cada bloque terminado se escribe
+        # y se descarta, así que la memoria no crece con el tamaño del corpus
+        pending = set()
+        while True:
+            for floor_type, start, size in itertools.islice(pending_tasks, 2 * workers - len(pending)):
+                pending.add(executor.submit(generate_chunk, floor_type, start, size, seed, options))
+            if not pending:
+                break
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                lines = future.result()
+                file.write('\n'.join(lines) + '\n')
+                written += len(lines)
+                if progress is not None:
+                    progress(written, total, time.perf_counter() - start_time)
+    return written
+
+
+def print_progress(written: int, total: int, elapsed: float):
+    """
+    Mostrar el progreso y los mapas por segundo en la salida de errores.
+    """
+    rate = written / elapsed if elapsed > 0 else 0.0
+    end = '\n' if written == total else ''
+    print(f'\r{written}/{total} mapas ({written / total:.0%}), {rate:.1f} mapas/s', end=end, file=sys.stderr)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description='Generación masiva de mapas de piso con el algoritmo genético.')
+    parser.add_argument('--count', type=int, required=True, help='Número de mapas por tipo de piso')
+    parser.add_argument('--output', default='mapas.jsonl', help='Archivo JSON Lines de salida')
+    parser.add_argument('--floors', nargs='+', choices=[floor_type.value for floor_type in FloorsTypes],
+                        default=[floor_type.value for floor_type in FloorsTypes], help='Tipos de piso')
+    parser.add_argument('--workers', type=int, default=None, help='Número de procesos (por defecto, uno por núcleo)')
+    parser.add_argument('--seed', type=int, default=None, help='Semilla del corpus')
+    parser.add_argument('--chunk-size', type=int, default=50, help='Mapas que genera cada tarea')
+    parser.add_argument('--algorithm', type=int, default=0, choices=[0, 1],
+                        help='0 para estado estacionario, 1 para generacional')
+    parser.add_argument('--vectorized', action='store_true', help='Usar el motor NumPy del algoritmo genético')
+    parser.add_argument('--time-budget-ms', type=float, default=None, help='Tiempo máximo por mapa en milisegundos')
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else new_seed()
+    print(f'Semilla: {seed}', file=sys.stderr)
+    start_time = time.perf_counter()
+    with open(args.output, 'w') as file:
+        written = generate_corpus(file, args.count, [FloorsTypes(floor) for floor in args.floors], seed=seed,
+                                  workers=args.workers, chunk_size=args.chunk_size, progress=print_progress,
+                                  algorithm=args.algorithm, vectorized=args.vectorized,
+                                  time_budget_ms=args.time_budget_ms)
+    elapsed = time.perf_counter() - start_time
+    print(f'{written} mapas en {elapsed:.1f} s ({written / elapsed:.1f} mapas/s) -> {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
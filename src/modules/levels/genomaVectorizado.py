@@ -0,0 +1,467 @@
+"""
+Representación compacta (NumPy) del genoma de los niveles.
+
+Toda la población se guarda en una única matriz uint8 de forma (población, alto, ancho)
+y los operadores genéticos (cruce, mutación, recuento de salas, comprobación de salas especiales,
+conectividad y aptitud) se aplican a la vez sobre todos los individuos.
+La conversión a listas de RoomsTypes solo se hace en los bordes (generate_level, Level.setup_level).
+"""
+
+import math
+import random
+from typing import Callable, Iterable
+
+import numpy as np
+
+from src.tipos import RoomsTypes, Moves
+import src.modules.levels.algoritmoGenetico as ag
+from src.modules.levels.criteriosParada import StoppingCriteria
+from src.modules.levels.seleccion import ParentSelector
+from src.modules.levels.telemetria import GenerationReporter, GenerationEvent
+from src.modules.levels.reparacion import RepairStats
+
+# Código de cada tipo de habitación dentro del genoma
+ROOM_CODES: dict[RoomsTypes, int] = {room_type: code for code, room_type in enumerate(RoomsTypes)}
+CODE_ROOMS: tuple[RoomsTypes, ...] = tuple(RoomsTypes)
+
+EMPTY = ROOM_CODES[RoomsTypes.EMPTY]
+DEFAULT = ROOM_CODES[RoomsTypes.DEFAULT]
+SPAWN = ROOM_CODES[RoomsTypes.SPAWN]
+TREASURE = ROOM_CODES[RoomsTypes.TREASURE]
+SHOP = ROOM_CODES[RoomsTypes.SHOP]
+SECRET = ROOM_CODES[RoomsTypes.SECRET]
+BOSS = ROOM_CODES[RoomsTypes.BOSS]
+
+# Tipos que puede tomar una habitación al mutar (igual que en algoritmoGenetico.mutate)
+MUTATION_CODES = np.array([DEFAULT, TREASURE, SHOP], dtype=np.uint8)
+
+# Pasos del paseo aleatorio (igual que en algoritmoGenetico.set_default_rooms)
+WALK_MOVES = np.array([move.value for move in Moves], dtype=np.intp)
+
+
+def encode_layout(rooms: list[list[RoomsTypes]]) -> np.ndarray:
+    """
+    Convertir un mapa de RoomsTypes en una matriz uint8.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :return: matriz (alto, ancho) de códigos de habitación.
+    """
+    return np.array([[ROOM_CODES[room] for room in row] for row in rooms], dtype=np.uint8)
+
+
+def decode_layout(layout: np.ndarray) -> list[list[RoomsTypes]]:
+    """
+    Convertir una matriz uint8 en un mapa de RoomsTypes.
+
+    :param layout: matriz (alto, ancho) de códigos de habitación.
+    :return: matriz bidimensional de valores de RoomsTypes.
+    """
+    return [[CODE_ROOMS[code] for code in row] for row in layout.tolist()]
+
+
+def encode_population(population: list[list[list[RoomsTypes]]]) -> np.ndarray:
+    """
+    Convertir una población de mapas en una única matriz uint8.
+
+    :param population: lista de matrices bidimensionales de valores de RoomsTypes.
+    :return: matriz (población, alto, ancho) de códigos de habitación.
+    """
+    return np.stack([encode_layout(rooms) for rooms in population])
+
+
+def decode_population(population: np.ndarray) -> list[list[list[RoomsTypes]]]:
+    """
+    Convertir una matriz de población en una lista de mapas de RoomsTypes.
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :return: lista de matrices bidimensionales de valores de RoomsTypes.
+    """
+    return [decode_layout(layout) for layout in population]
+
+
+def spawn_coords(map_width: int, map_height: int) -> tuple[int, int]:
+    """
+    Coordenadas (x, y) de la sala de inicio (el centro del mapa).
+
+    :param map_width: ancho del piso.
+    :param map_height: altura del piso.
+    :return: coordenadas de la sala de inicio.
+    """
+    return math.ceil(map_width / 2) - 1, math.ceil(map_height / 2) - 1
+
+
+def random_walk_batch(population_size: int, map_width: int, map_height: int, room_numbers: int,
+                      rng: np.random.Generator) -> np.ndarray:
+    """
+    Paseo aleatorio ("perro corriendo") de toda la población a la vez: todos los caminantes dan un paso
+    en cada iteración hasta colocar sus habitaciones, igual que algoritmoGenetico.set_default_rooms.
+
+    :param population_size: tamaño de la población.
+    :param map_width: ancho del piso.
+    :param map_height: altura del piso.
+    :param room_numbers: número de habitaciones, contando la sala de inicio.
+    :param rng: generador de números aleatorios.
+    :return: matriz (población, alto, ancho) con la sala de inicio en el centro y habitaciones normales.
+    """
+    assert 1 <= room_numbers <= map_width * map_height
+
+    population = np.full((population_size, map_height, map_width), EMPTY, dtype=np.uint8)
+    spawn_x, spawn_y = spawn_coords(map_width, map_height)
+    population[:, spawn_y, spawn_x] = SPAWN
+
+    # Solo se guardan los caminantes que aún tienen habitaciones por colocar
+    walkers = np.arange(population_size)
+    xs = np.full(population_size, spawn_x)
+    ys = np.full(population_size, spawn_y)
+    remaining = np.full(population_size, room_numbers - 1)
+    active = remaining > 0
+    walkers, xs, ys, remaining = walkers[active], xs[active], ys[active], remaining[active]
+    while walkers.size:
+        steps = WALK_MOVES[rng.integers(len(WALK_MOVES), size=walkers.size)]
+        xs = np.clip(xs + steps[:, 0], 0, map_width - 1)
+        ys = np.clip(ys + steps[:, 1], 0, map_height - 1)
+        new_room = population[walkers, ys, xs] == EMPTY
+        population[walkers[new_room], ys[new_room], xs[new_room]] = DEFAULT
+        remaining -= new_room
+        active = remaining > 0
+        walkers, xs, ys, remaining = walkers[active], xs[active], ys[active], remaining[active]
+    return population
+
+
+def count_rooms_batch(population: np.ndarray) -> np.ndarray:
+    """
+    Número de habitaciones (no vacías) de cada individuo.
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :return: vector con el número de habitaciones por individuo.
+    """
+    return np.count_nonzero(population != EMPTY, axis=(1, 2))
+
+
+def count_roomtype_batch(population: np.ndarray, especial: RoomsTypes) -> np.ndarray:
+    """
+    Número de salas de un tipo en cada individuo.
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :param especial: tipo de sala a contar.
+    :return: vector con el número de salas del tipo por individuo.
+    """
+    return np.count_nonzero(population == ROOM_CODES[especial], axis=(1, 2))
+
+
+def exists_special_room_batch(population: np.ndarray, especial: RoomsTypes) -> np.ndarray:
+    """
+    Comprueba en cada individuo si existe una sala del tipo indicado.
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :param especial: tipo de sala a buscar.
+    :return: vector booleano por individuo.
+    """
+    return np.any(population == ROOM_CODES[especial], axis=(1, 2))
+
+
+def _shift_neighbors(mask: np.ndarray) -> np.ndarray:
+    """
+    Celdas con al menos un vecino (arriba, abajo, izquierda, derecha) marcado en la máscara.
+
+    :param mask: máscara booleana (población, alto, ancho).
+    :return: máscara booleana (población, alto, ancho).
+    """
+    result = np.zeros_like(mask)
+    result[:, 1:, :] |= mask[:, :-1, :]
+    result[:, :-1, :] |= mask[:, 1:, :]
+    result[:, :, 1:] |= mask[:, :, :-1]
+    result[:, :, :-1] |= mask[:, :, 1:]
+    return result
+
+
+def _flood_fill(passable: np.ndarray, start: tuple[int, int]) -> np.ndarray:
+    """
+    Relleno por inundación desde la celda de inicio para todos los individuos a la vez.
+
+    :param passable: máscara booleana (población, alto, ancho) de celdas por las que se puede pasar.
+    :param start: coordenadas (x, y) de la celda de inicio.
+    :return: máscara booleana de celdas alcanzables.
+    """
+    start_x, start_y = start
+    reached = np.zeros_like(passable)
+    reached[:, start_y, start_x] = passable[:, start_y, start_x]
+    while True:
+        expanded = reached | (_shift_neighbors(reached) & passable)
+        if np.array_equal(expanded, reached):
+            return reached
+        reached = expanded
+
+
+def all_rooms_have_path_to_start_batch(population: np.ndarray, *, ignore_secret: bool = True) -> np.ndarray:
+    """
+    Versión vectorizada de algoritmoGenetico.all_rooms_have_path_to_start.
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :param ignore_secret: si se ignora la habitación secreta (y con ella el tesoro y la tienda).
+    :return: vector booleano por individuo.
+    """
+    _, map_height, map_width = population.shape
+    start_x, start_y = spawn_coords(map_width, map_height)
+    ignored = [EMPTY, SECRET, TREASURE, SHOP] if ignore_secret else [EMPTY]
+    passable = ~np.isin(population, ignored)
+    reached = _flood_fill(passable, (start_x, start_y))
+
+    # Una sala llega al inicio si es el propio inicio o si tiene un vecino alcanzable
+    has_path = _shift_neighbors(reached)
+    has_path[:, start_y, start_x] = True
+    required = (population != EMPTY) & (population != SECRET)
+    return ~np.any(required & ~has_path, axis=(1, 2))
+
+
+def distance_between_start_and_boss_batch(population: np.ndarray) -> np.ndarray:
+    """
+    Versión vectorizada de comprobaciones.distance_between_start_and_boss.
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :return: vector con la distancia hasta la sala del jefe (0 si no hay camino).
+    """
+    size, map_height, map_width = population.shape
+    start_x, start_y = spawn_coords(map_width, map_height)
+    passable = (population != EMPTY) & (population != SECRET)
+    is_boss = population == BOSS
+
+    distances = np.zeros(size, dtype=np.int64)
+    pending = np.ones(size, dtype=bool)
+    frontier = np.zeros_like(passable)
+    frontier[:, start_y, start_x] = True
+    visited = frontier.copy()
+    distance = 0
+    while pending.any():
+        found = pending & np.any(frontier & is_boss, axis=(1, 2))
+        distances[found] = distance
+        pending &= ~found
+        frontier = _shift_neighbors(frontier) & passable & ~visited
+        frontier[~pending] = False
+        if not frontier.any():
+            break
+        visited |= frontier
+        distance += 1
+    return distances
+
+
+def fitness_batch(population: np.ndarray, nRooms: tuple[int, int]) -> np.ndarray:
+    """
+    Versión vectorizada de algoritmoGenetico.fitness.
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :param nRooms: rango de número de habitaciones.
+    :return: vector con la puntuación de aptitud de cada individuo.
+    """
+    number_of_rooms = count_rooms_batch(population)
+    number_of_bosses = count_roomtype_batch(population, RoomsTypes.BOSS)
+    number_of_secrets = count_roomtype_batch(population, RoomsTypes.SECRET)
+
+    puntuacion = np.zeros(len(population), dtype=np.int64)
+    puntuacion += 100 * all_rooms_have_path_to_start_batch(population)
+    puntuacion += 50 * (number_of_bosses > 0)
+    puntuacion -= 50 * (number_of_bosses > 1)
+    puntuacion += 10 * exists_special_room_batch(population, RoomsTypes.TREASURE)
+    puntuacion += 10 * exists_special_room_batch(population, RoomsTypes.SHOP)
+    puntuacion += 10 * (number_of_secrets > 0)
+    puntuacion += 10 * (number_of_secrets > 1)
+    puntuacion += 20 * exists_special_room_batch(population, RoomsTypes.SPAWN)
+    puntuacion += 30 * ((nRooms[0] <= number_of_rooms) & (number_of_rooms <= nRooms[1]))
+    puntuacion -= 30 * (number_of_rooms < nRooms[0])
+    puntuacion += 30 * (distance_between_start_and_boss_batch(population) > 10)
+    return puntuacion
+
+
+def crossover_batch(parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Cruce por un punto de corte aleatorio de cada pareja de padres (ver algoritmoGenetico.crossover).
+
+    :param parents1: matriz (n, alto, ancho) con los primeros padres.
+    :param parents2: matriz (n, alto, ancho) con los segundos padres.
+    :param rng: generador de números aleatorios.
+    :return: matriz (n, alto, ancho) con los hijos.
+    """
+    size, map_height, map_width = parents1.shape
+    crossover_point_x = rng.integers(0, map_width, size)
+    crossover_point_y = rng.integers(0, map_height, size)
+    cut = crossover_point_y * map_width + crossover_point_x
+
+    # Las celdas hasta el punto de corte (en orden de lectura) vienen del primer padre
+    from_parent1 = np.arange(map_width * map_height)[None, :] <= cut[:, None]
+    children = np.where(from_parent1.reshape(size, map_height, map_width), parents1, parents2)
+    return children.astype(np.uint8)
+
+
+def mutate_batch(population: np.ndarray, mutation_prob: float, mutation_rate: float,
+                 rng: np.random.Generator) -> np.ndarray:
+    """
+    Mutación de todos los individuos a la vez (ver algoritmoGenetico.mutate).
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :param mutation_prob: probabilidad de mutación.
+    :param mutation_rate: tasa de mutación.
+    :param rng: generador de números aleatorios.
+    :return: matriz (población, alto, ancho) con los individuos mutados.
+    """
+    size, map_height, map_width = population.shape
+    mutated = population.copy()
+    num_mutations = (count_rooms_batch(population) * mutation_rate).astype(np.int64)
+    max_mutations = int(num_mutations.max(initial=0))
+    if max_mutations == 0:
+        return mutated
+
+    ys = rng.integers(0, map_height, (size, max_mutations))
+    xs = rng.integers(0, map_width, (size, max_mutations))
+    chances = rng.random((size, max_mutations))
+    new_rooms = rng.choice(MUTATION_CODES, (size, max_mutations))
+    individuals = np.broadcast_to(np.arange(size)[:, None], ys.shape)
+
+    # La sala de inicio no se puede cambiar (se compara con el individuo original)
+    active = ((np.arange(max_mutations)[None, :] < num_mutations[:, None])
+              & (chances < mutation_prob)
+              & (population[individuals, ys, xs] != SPAWN))
+    mutated[individuals[active], ys[active], xs[active]] = new_rooms[active]
+    return mutated
+
+
+def select_parents_baker_batch(fitness_scores: np.ndarray, pairs: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Selección de parejas de padres por la ruleta de Baker para toda la generación.
+
+    :param fitness_scores: vector de puntuaciones de aptitud.
+    :param pairs: número de parejas a seleccionar.
+    :param rng: generador de números aleatorios.
+    :return: matriz (parejas, 2) con los índices de los padres.
+    """
+    return ParentSelector('roulette').select_batch(fitness_scores, pairs, rng)
+
+
+def generate_initial_population(population_size: int, map_width: int, map_height: int, room_numbers: int,
+                                rng: np.random.Generator | None = None,
+                                stats: RepairStats | None = None) -> np.ndarray:
+    """
+    Generar una población inicial ya codificada.
+
+    :param population_size: tamaño de la población.
+    :param map_width: ancho del piso.
+    :param map_height: altura del piso.
+    :param room_numbers: número de habitaciones.
+    :param rng: generador de números aleatorios.
+    :param stats: contadores de mapas reparados y vueltos a generar (opcional).
+    :return: matriz (población, alto, ancho) de códigos de habitación.
+    """
+    python_rng = random.Random(int(rng.integers(2 ** 63))) if rng is not None else None
+    return encode_population(ag.generate_initial_population(population_size, map_width, map_height, room_numbers,
+                                                            python_rng, stats))
+
+
+def _breed(population: np.ndarray, fitness_scores: np.ndarray, rng: np.random.Generator,
+           selection: ParentSelector, children: int | None = None) -> np.ndarray:
+    """
+    Crear una nueva generación de hijos (selección, cruce y mutación).
+
+    :param population: matriz (población, alto, ancho) de códigos de habitación.
+    :param fitness_scores: puntuaciones de aptitud de la población.
+    :param rng: generador de números aleatorios.
+    :param selection: selección de padres.
+    :param children: número de hijos (por defecto, el tamaño de la población).
+    :return: matriz (hijos, alto, ancho) con los hijos.
+    """
+    children = len(population) if children is None else children
+    parents = selection.select_batch(fitness_scores, children, rng)
+    offspring = crossover_batch(population[parents[:, 0]], population[parents[:, 1]], rng)
+    return mutate_batch(offspring, mutation_prob=0.05, mutation_rate=0.15, rng=rng)
+
+
+def steady_state_genetic_algorithm(population_size: int, map_width: int, map_height: int,
+                                   room_numbers: tuple[int, int], generations: int,
+                                   rng: np.random.Generator | None = None,
+                                   stopping: StoppingCriteria | None = None,
+                                   selection: ParentSelector | None = None,
+                                   observers: Iterable[Callable[[GenerationEvent], None]] | None = None
+                                   ) -> list[list[RoomsTypes]]:
+    """
+    Algoritmo genético de estado estable sobre la población vectorizada.
+
+    :param population_size: tamaño de la población.
+    :param map_width: ancho del piso.
+    :param map_height: altura del piso.
+    :param room_numbers: rango de número de habitaciones.
+    :param generations: número de generaciones.
+    :param rng: generador de números aleatorios.
+    :param stopping: criterios de parada anticipada (guarda la generación en la que se detuvo).
+    :param selection: selección de padres (por defecto, ruleta de Baker).
+    :param observers: funciones que reciben un GenerationEvent después de cada generación (ver telemetria).
+    :return: matriz bidimensional de valores de RoomsTypes.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    selection = selection if selection is not None else ParentSelector()
+    repairs = RepairStats()
+    reporter = GenerationReporter('steady_state_vectorized', observers, repairs=repairs) if observers else None
+    if stopping is not None:
+        stopping.reset()
+    population = generate_initial_population(population_size, map_width, map_height, room_numbers[0], rng, repairs)
+    fitness_scores = fitness_batch(population, room_numbers)
+    if reporter is not None:
+        reporter.emit(0, fitness_scores, population, len(population))
+    for generation in range(generations):
+        if stopping is not None and stopping.should_stop(generation, fitness_scores, population):
+            break
+        children = _breed(population, fitness_scores, rng, selection)
+        combined_population = np.concatenate((population, children))
+        combined_scores = np.concatenate((fitness_scores, fitness_batch(children, room_numbers)))
+        best = np.argsort(-combined_scores, kind='stable')[:population_size]
+        population, fitness_scores = combined_population[best], combined_scores[best]
+        if reporter is not None:
+            reporter.emit(generation + 1, fitness_scores, population, len(children))
+    if stopping is not None:
+        stopping.finish(generations)
+
+    return decode_layout(population[np.argmax(fitness_scores)])
+
+
+def generational_genetic_algorithm(population_size: int, map_width: int, map_height: int,
+                                   room_numbers: tuple[int, int], generations: int,
+                                   rng: np.random.Generator | None = None,
+                                   stopping: StoppingCriteria | None = None,
+                                   selection: ParentSelector | None = None,
+                                   observers: Iterable[Callable[[GenerationEvent], None]] | None = None
+                                   ) -> list[list[RoomsTypes]]:
+    """
+    Algoritmo genético generacional sobre la población vectorizada.
+
+    :param population_size: tamaño de la población.
+    :param map_width: ancho del piso.
+    :param map_height: altura del piso.
+    :param room_numbers: rango de número de habitaciones.
+    :param generations: número de generaciones.
+    :param rng: generador de números aleatorios.
+    :param stopping: criterios de parada anticipada (guarda la generación en la que se detuvo).
+    :param selection: selección de padres (por defecto, ruleta de Baker).
+    :param observers: funciones que reciben un GenerationEvent después de cada generación (ver telemetria).
+    :return: matriz bidimensional de valores de RoomsTypes.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    selection = selection if selection is not None else ParentSelector()
+    repairs = RepairStats()
+    reporter = GenerationReporter('generational_vectorized', observers, repairs=repairs) if observers else None
+    if stopping is not None:
+        stopping.reset()
+    population = generate_initial_population(population_size, map_width, map_height, room_numbers[0], rng, repairs)
+    fitness_scores = fitness_batch(population, room_numbers)
+    if reporter is not None:
+        reporter.emit(0, fitness_scores, population, len(population))
+    for generation in range(generations):
+        if stopping is not None and stopping.should_stop(generation, fitness_scores, population):
+            break
+        # Los mejores pasan sin cambios (elitismo) y el resto de la generación son hijos
+        elite = np.array(selection.elite(fitness_scores), dtype=np.intp)
+        children = _breed(population, fitness_scores, rng, selection, population_size - len(elite))
+        population = np.concatenate((population[elite], children))
+        fitness_scores = np.concatenate((fitness_scores[elite], fitness_batch(children, room_numbers)))
+        if reporter is not None:
+            reporter.emit(generation + 1, fitness_scores, population, len(children))
+    if stopping is not None:
+        stopping.finish(generations)
+
+    return decode_layout(population[np.argmax(fitness_scores)])
@@ -0,0 +1,156 @@
+"""
+Algoritmo genético de islas.
+
+Varias subpoblaciones (islas) evolucionan con el algoritmo de estado estable en procesos separados
+y cada cierto número de generaciones intercambian sus mejores mapas (migración).
+Cada isla conserva su caché de aptitud entre épocas: el proceso la devuelve con la población y la recibe de nuevo
+en la época siguiente, junto con las puntuaciones de los emigrantes que llegan.
+"""
+
+import concurrent.futures
+import math
+import os
+import random
+import time
+
+from src.tipos import RoomsTypes
+import src.modules.levels.algoritmoGenetico as ag
+from src.modules.levels.criteriosParada import StoppingCriteria
+from src.modules.levels.cacheAptitud import layout_key
+from src.modules.levels.seleccion import ParentSelector
+
+TOPOLOGIES = ('ring', 'fully_connected')
+
+
+def _evolve_island(population: list | None, scores: list[float] | None, cached: dict[tuple, float] | None,
+                   population_size: int, map_width: int, map_height: int, room_numbers: tuple[int, int],
+                   generations: int, seed: int,
+                   selection: ParentSelector | None = None,
+                   deadline: float | None = None) -> tuple[list, list[float], dict[tuple, float]]:
+    """
+    Evolucionar una isla durante varias generaciones (se ejecuta en un proceso trabajador).
+
+    :param population: población de la isla (None para crear la población inicial).
+    :param scores: puntuaciones de la población.
+    :param cached: puntuaciones de la caché de la isla en la época anterior (None en la primera).
+    :param population_size: tamaño de la población de la isla.
+    :param map_width: ancho del piso.
+    :param map_height: altura del piso.
+    :param room_numbers: rango de número de habitaciones.
+    :param generations: generaciones hasta la siguiente migración.
+    :param seed: semilla de la isla para esta época.
+    :param selection: selección de padres.
+    :param deadline: momento (time.time(), comparable entre procesos) en el que se agota el tiempo de la ejecución;
+                     la isla deja de evolucionar aunque no haya llegado a la siguiente migración (None para no limitarlo).
+    :return: población y puntuaciones, ordenadas de mejor a peor, y puntuaciones de la caché de la isla.
+    """
+    rng = random.Random(seed)
+    cache = ag.FitnessCache()
+    cache.update(cached or {})
+    evaluator = ag.FitnessEvaluator()
+    if population is None:
+        population = ag.generate_initial_population(population_size, map_width, map_height, room_numbers[0], rng)
+        scores = evaluator.evaluate(population, room_numbers, ag.fitness, cache)
+    else:
+        # Los emigrantes llegan con su puntuación
+        cache.update({layout_key(rooms, room_numbers): score for rooms, score in zip(population, scores)})
+    for _ in range(generations):
+        if deadline is not None and time.time() >= deadline:
+            break
+        population, scores = ag.steady_state_generation(population, scores, room_numbers, cache, evaluator, rng,
+                                                        selection)
+    return population, scores, dict(cache.scores)
+
+
+def migrate(islands: list[tuple[list, list[float]]], migrants: int, topology: str) -> list[tuple[list, list[float]]]:
+    """
+    Intercambio de los mejores individuos entre islas. Los emigrantes sustituyen a los peores de la isla de destino.
+
+    :param islands: lista de (población, puntuaciones) de cada isla, ordenadas de mejor a peor.
+    :param migrants: número de individuos que envía cada isla.
+    :param topology: "ring" (cada isla envía a la siguiente) o "fully_connected" (cada isla envía a todas).
+    :return: islas después de la migración, de nuevo ordenadas de mejor a peor.
+    """
+    assert topology in TOPOLOGIES, f"Topología desconocida: {topology}. Opciones: {TOPOLOGIES}."
+
+    size = len(islands)
+    incoming: list[list[tuple[list, float]]] = [[] for _ in range(size)]
+    for i, (population, scores) in enumerate(islands):
+        best = list(zip(population[:migrants], scores[:migrants]))
+        if topology == 'ring':
+            destinations = [(i + 1) % size]
+        else:
+            destinations = [j for j in range(size) if j != i]
+        for j in destinations:
+            incoming[j].extend(best)
+
+    migrated = []
+    for (population, scores), arrivals in zip(islands, incoming):
+        keep = max(0, len(population) - len(arrivals))
+        combined = list(zip(population[:keep], scores[:keep])) + arrivals[:len(population)]
+        combined.sort(key=lambda individual: individual[1], reverse=True)
+        migrated.append(([individual for individual, _ in combined], [score for _, score in combined]))
+    return migrated
+
+
+def island_genetic_algorithm(population_size: int, map_width: int, map_height: int, room_numbers: tuple[int, int],
+                             generations: int, islands: int = 4, migration_interval: int = 5, migrants: int = 1,
+                             topology: str = 'ring', workers: int | None = None,
+                             seed: int | None = None,
+                             stopping: StoppingCriteria | None = None,
+                             selection: ParentSelector | None = None) -> list[list[RoomsTypes]]:
+    """
+    Algoritmo genético de islas sobre varios núcleos.
+
+    :param population_size: tamaño de la población de cada isla.
+    :param map_width: ancho del piso.
+    :param map_height: altura del piso.
+    :param room_numbers: rango de número de habitaciones.
+    :param generations: número de generaciones.
+    :param islands: número de islas.
+    :param migration_interval: generaciones entre migraciones.
+    :param migrants: individuos que envía cada isla en cada migración.
+    :param topology: "ring" o "fully_connected".
+    :param workers: número de procesos (por defecto, uno por isla hasta el número de núcleos).
+    :param seed: semilla de la ejecución (para repetir los resultados).
+    :param stopping: criterios de parada anticipada, comprobados en cada migración sobre todas las islas.
+                     El límite de tiempo (time_budget_ms) también lo comprueba cada isla en cada generación,
+                     pero no cubre el arranque de los procesos ni la población inicial de cada isla.
+    :param selection: selección de padres de todas las islas (por defecto, ruleta de Baker).
+    :return: matriz bidimensional de valores de RoomsTypes.
+    """
+    assert islands >= 1 and migration_interval >= 1
+    assert topology in TOPOLOGIES, f"Topología desconocida: {topology}. Opciones: {TOPOLOGIES}."
+
+    seeds = random.Random(seed if seed is not None else random.getrandbits(64))
+    workers = workers or min(islands, os.cpu_count() or 1)
+    states: list[tuple[list | None, list[float] | None]] = [(None, None)] * islands
+    caches: list[dict[tuple, float] | None] = [None] * islands
+    if stopping is not None:
+        stopping.reset()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for epoch in range(max(1, math.ceil(generations / migration_interval))):
+            if (stopping is not None and epoch > 0
+                    and stopping.should_stop(epoch * migration_interval,
+                                             [score for _, scores in states for score in scores],
+                                             [rooms for population, _ in states for rooms in population])):
+                break
+            epoch_generations = min(migration_interval, generations - epoch * migration_interval)
+            deadline = None
+            if stopping is not None and stopping.time_budget_ms is not None:
+                deadline = time.time() + (stopping.time_budget_ms - stopping.elapsed_ms()) / 1000
+            futures = [executor.submit(_evolve_island, population, scores, cached, population_size, map_width,
+                                       map_height, room_numbers, max(0, epoch_generations), seeds.getrandbits(64),
+                                       selection, deadline)
+                       for (population, scores), cached in zip(states, caches)]
+            results = [future.result() for future in futures]
+            states = [(population, scores) for population, scores, _ in results]
+            caches = [cached for _, _, cached in results]
+            if islands > 1 and (epoch + 1) * migration_interval < generations:
+                states = migrate(states, migrants, topology)
+    if stopping is not None:
+        stopping.finish(generations)
+
+    best_population, best_scores = max(states, key=lambda state: state[1][0])
+    return best_population[0]
@@ -0,0 +1,181 @@
+"""
+Reparación de mapas que no cumplen las condiciones para colocar las salas especiales.
+
+En lugar de descartar el mapa y generar otro, se corrige de forma determinista:
+ - las habitaciones sin camino hasta el inicio se conectan con el camino más corto de habitaciones nuevas;
+ - si no hay sitio para la habitación secreta, se coloca en la celda vacía con más vecinos;
+ - si hay menos de tres habitaciones sin salida (un solo vecino), se añaden al final de los pasillos.
+"""
+
+import collections
+
+from src.tipos import RoomsTypes
+from src.utils.conectividad import ConnectivityChecker, NEIGHBOR_MOVES, spawn_position
+from src.utils.graph import GridGraph
+
+# Salas especiales que necesitan una habitación sin salida: jefe, tienda y tesoro
+DEAD_ENDS_NEEDED = 3
+
+
+class RepairStats:
+    """
+    Contadores de la generación de mapas: cuántos se repararon en lugar de volver a generarse.
+    No hay contadores globales: cada ejecución crea los suyos y los pasa a las funciones que generan mapas
+    (así no se comparten entre hilos y los de cada proceso se devuelven con su resultado).
+    """
+    def __init__(self):
+        self.layouts = 0  # Mapas generados con el paseo aleatorio
+        self.first_try = 0  # Mapas válidos sin reparar
+        self.repaired = 0  # Mapas reparados (reintentos evitados)
+        self.retries = 0  # Mapas descartados que hubo que volver a generar
+        self.reconnected_rooms = 0  # Habitaciones añadidas para reconectar habitaciones aisladas
+        self.secret_rooms = 0  # Habitaciones secretas colocadas en una celda vacía
+        self.dead_ends = 0  # Habitaciones sin salida añadidas
+
+    def reset(self):
+        """
+        Poner todos los contadores a cero.
+        """
+        self.__init__()
+
+    def stats(self) -> dict[str, int]:
+        """
+        :return: diccionario con todos los contadores.
+        """
+        return dict(vars(self))
+
+
+def reconnect_orphans(rooms: list[list[RoomsTypes | str]]) -> int:
+    """
+    Conectar las habitaciones sin camino hasta la sala de inicio añadiendo habitaciones en las celdas vacías
+    del camino más corto hasta la zona alcanzable.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes (se modifica).
+    :return: número de habitaciones añadidas.
+    """
+    connectivity = ConnectivityChecker(rooms)
+    added = 0
+    while connectivity.orphans:
+        orphan = min(connectivity.orphans, key=lambda cell: (cell[1], cell[0]))
+        path = _path_to_reached(connectivity, orphan)
+        for x, y in path:
+            if rooms[y][x] == RoomsTypes.EMPTY:
+                connectivity.set_cell(x, y, RoomsTypes.DEFAULT)
+                added += 1
+    return added
+
+
+def _path_to_reached(connectivity: ConnectivityChecker, start: tuple[int, int]) -> list[tuple[int, int]]:
+    """
+    Camino más corto (BFS) desde una habitación aislada hasta una celda alcanzable desde el inicio.
+
+    :param connectivity: conectividad del mapa.
+    :param start: habitación aislada.
+    :return: celdas del camino, sin la habitación aislada ni la celda alcanzable.
+    """
+    previous: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
+    queue = collections.deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in NEIGHBOR_MOVES:
+            cell = (x + dx, y + dy)
+            if not (0 <= cell[0] < connectivity.width and 0 <= cell[1] < connectivity.height) or cell in previous:
+                continue
+            if cell in connectivity.reached:
+                path = []
+                while (x, y) != start:
+                    path.append((x, y))
+                    x, y = previous[(x, y)]
+                return path
+            # Solo se atraviesan celdas vacías y habitaciones normales
+            if connectivity.rooms[cell[1]][cell[0]] in (RoomsTypes.EMPTY, RoomsTypes.DEFAULT):
+                previous[cell] = (x, y)
+                queue.append(cell)
+    raise AssertionError(f"No hay camino de celdas vacías o habitaciones normales desde {start} "
+                         f"hasta una habitación alcanzable desde la sala de inicio.")
+
+
+def place_secret_room(rooms: list[list[RoomsTypes | str]]) -> bool:
+    """
+    Colocar la habitación secreta en la celda vacía con más vecinos (al menos dos).
+    Una celda vacía no forma parte de ningún camino, así que la conectividad no cambia.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes (se modifica).
+    :return: ¿Se colocó la habitación secreta?
+    """
+    map_width, map_height = len(rooms[0]), len(rooms)
+    best, best_neighbors = None, 1
+    for y in range(map_height):
+        for x in range(map_width):
+            if rooms[y][x] != RoomsTypes.EMPTY:
+                continue
+            neighbors = sum(1 for dx, dy in NEIGHBOR_MOVES
+                            if 0 <= x + dx < map_width and 0 <= y + dy < map_height
+                            and rooms[y + dy][x + dx] in (RoomsTypes.DEFAULT, RoomsTypes.SPAWN))
+            if neighbors > best_neighbors:
+                best, best_neighbors = (x, y), neighbors
+    if best is None:
+        return False
+    rooms[best[1]][best[0]] = RoomsTypes.SECRET
+    return True
+
+
+def add_dead_ends(rooms: list[list[RoomsTypes | str]], needed: int = DEAD_ENDS_NEEDED) -> int:
+    """
+    Añadir habitaciones sin salida hasta tener las necesarias para las salas especiales.
+    Cada habitación nueva se coloca junto a una sola habitación que ya tenga otra salida,
+    empezando por las celdas más alejadas de la sala de inicio.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes (se modifica).
+    :param needed: número de habitaciones sin salida necesarias.
+    :return: número de habitaciones añadidas, o -1 si no hay sitio para todas.
+    """
+    map_width, map_height = len(rooms[0]), len(rooms)
+    spawn_x, spawn_y = spawn_position(rooms)
+    added = 0
+    while True:
+        graph = GridGraph.from_rooms(rooms, ignore_secret=True)
+        solo = sum(1 for (x, y), neighbors in graph.items()
+                   if len(neighbors) == 1 and rooms[y][x] == RoomsTypes.DEFAULT)
+        if solo >= needed:
+            return added
+
+        candidates = []
+        for y in range(map_height):
+            for x in range(map_width):
+                if rooms[y][x] != RoomsTypes.EMPTY:
+                    continue
+                neighbors = [(x + dx, y + dy) for dx, dy in NEIGHBOR_MOVES
+                             if 0 <= x + dx < map_width and 0 <= y + dy < map_height
+                             and rooms[y + dy][x + dx] not in (RoomsTypes.EMPTY, RoomsTypes.SECRET)]
+                # Si el vecino ya no tenía salida, dejaría de serlo y no se ganaría nada
+                if (len(neighbors) == 1 and rooms[neighbors[0][1]][neighbors[0][0]] in (RoomsTypes.DEFAULT, RoomsTypes.SPAWN)
+                        and len(graph[neighbors[0]]) != 1):
+                    candidates.append((x, y))
+        if not candidates:
+            return -1
+        x, y = max(candidates, key=lambda c: ((spawn_x - c[0]) ** 2 + (spawn_y - c[1]) ** 2, -c[1], -c[0]))
+        rooms[y][x] = RoomsTypes.DEFAULT
+        added += 1
+
+
+def repair_layout(rooms: list[list[RoomsTypes | str]], stats: RepairStats | None = None) -> bool:
+    """
+    Reparar un mapa del paseo aleatorio para que se puedan colocar las salas especiales.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes (se modifica).
+    :param stats: contadores en los que se suman las reparaciones (opcional).
+    :return: ¿Se pudo reparar? Si es False, hay que generar otro mapa.
+    """
+    stats = stats if stats is not None else RepairStats()
+    stats.reconnected_rooms += reconnect_orphans(rooms)
+    if not any(RoomsTypes.SECRET in row for row in rooms):
+        if not place_secret_room(rooms):
+            return False
+        stats.secret_rooms += 1
+
+    dead_ends = add_dead_ends(rooms)
+    if dead_ends < 0:
+        return False
+    stats.dead_ends += dead_ends
+    return True
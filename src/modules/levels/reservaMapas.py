@@ -0,0 +1,210 @@
+"""
+Reserva persistente de mapas de piso ya generados.
+
+Los mapas se guardan en una base de datos SQLite, separados por tipo de piso y rango de número de habitaciones.
+Al crear un nivel se toma un mapa de la reserva (tiempo constante) en lugar de ejecutar el algoritmo genético,
+y un hilo en segundo plano vuelve a llenar la reserva cuando quedan pocos mapas.
+"""
+
+import contextlib
+import os
+import random
+import sqlite3
+import sys
+import threading
+
+import numpy as np
+
+from src.tipos import FloorsTypes, RoomsTypes
+from src.modules.levels.genomaVectorizado import encode_layout, decode_layout, spawn_coords, BOSS, SPAWN, \
+    SECRET, TREASURE, SHOP
+from src.utils.conectividad import all_rooms_reachable
+
+# Salas que el paseo aleatorio siempre coloca (finish_level): Level no las añade a los mapas de la reserva
+SPECIAL_ROOMS = (SECRET, TREASURE, SHOP)
+
+
+def default_path() -> str:
+    """
+    Ruta de la reserva junto al juego (o junto al ejecutable si está empaquetado),
+    para que no dependa de la carpeta desde la que se lanza.
+
+    :return: ruta del archivo de la base de datos.
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+    return os.path.join(base_path, 'layouts.sqlite')
+
+
+def is_valid_layout(rooms: list[list[RoomsTypes]]) -> bool:
+    """
+    Comprobar que un mapa se puede usar en el juego: sala de inicio en el centro, una sala del jefe,
+    las salas secreta, tesorería y tienda, y todas las habitaciones con camino hasta el inicio.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :return: ¿Es un mapa válido?
+    """
+    layout = encode_layout(rooms)
+    spawn_x, spawn_y = spawn_coords(layout.shape[1], layout.shape[0])
+    return (layout[spawn_y, spawn_x] == SPAWN
+            and np.count_nonzero(layout == SPAWN) == 1
+            and np.count_nonzero(layout == BOSS) == 1
+            and all(np.any(layout == code) for code in SPECIAL_ROOMS)
+            and all_rooms_reachable(rooms))
+
+
+class LayoutPool:
+    """
+    Reserva de mapas en disco.
+
+    :param path: ruta del archivo de la base de datos (por defecto, default_path()).
+    :param map_width: ancho de los mapas.
+    :param map_height: altura de los mapas.
+    :param capacity: número de mapas que se guardan por tipo de piso y rango de habitaciones.
+    :param low_water: con tantos mapas o menos se empieza a llenar la reserva en segundo plano.
+    :param algorithm: algoritmo genético con el que se generan los mapas (ver LevelGenerator.generate_level).
+    """
+    def __init__(self, path: str | None = None, map_width: int = 10, map_height: int = 6,
+                 capacity: int = 8, low_water: int = 2, algorithm: int = 0):
+        assert 0 <= low_water < capacity
+
+        self.path = path or default_path()
+        self.map_width = map_width
+        self.map_height = map_height
+        self.capacity = capacity
+        self.low_water = low_water
+        self.algorithm = algorithm
+        self.refills: dict[tuple[str, tuple[int, int]], threading.Thread] = {}
+        self.lock = threading.Lock()
+
+        with self.connect() as con:
+            con.execute("""
+                    CREATE TABLE IF NOT EXISTS layouts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    floor_type STRING,
+                    min_rooms INT,
+                    max_rooms INT,
+                    width INT,
+                    height INT,
+                    codes BLOB);
+                    """)
+
+    def connect(self) -> contextlib.closing:
+        """
+        Nueva conexión a la base de datos (cada hilo usa sus propias conexiones).
+
+        :return: conexión que se cierra al salir del bloque with.
+        """
+        con = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        return contextlib.closing(con)
+
+    def count(self, floor_type: FloorsTypes, room_numbers: tuple[int, int]) -> int:
+        """
+        Número de mapas guardados.
+
+        :param floor_type: tipo de piso.
+        :param room_numbers: rango de número de habitaciones.
+        :return: número de mapas.
+        """
+        with self.connect() as con:
+            return con.execute("""SELECT COUNT(*) FROM layouts
+                                  WHERE floor_type = ? AND min_rooms = ? AND max_rooms = ? AND width = ? AND height = ?""",
+                               self._key(floor_type, room_numbers)).fetchone()[0]
+
+    def put(self, floor_type: FloorsTypes, room_numbers: tuple[int, int], rooms: list[list[RoomsTypes]]) -> bool:
+        """
+        Guardar un mapa en la reserva (los mapas no válidos se descartan).
+
+        :param floor_type: tipo de piso.
+        :param room_numbers: rango de número de habitaciones.
+        :param rooms: matriz bidimensional de valores de RoomsTypes.
+        :return: ¿Se guardó el mapa?
+        """
+        if (len(rooms), len(rooms[0])) != (self.map_height, self.map_width) or not is_valid_layout(rooms):
+            return False
+        with self.connect() as con:
+            con.execute("""INSERT INTO layouts (floor_type, min_rooms, max_rooms, width, height, codes)
+                           VALUES (?, ?, ?, ?, ?, ?)""",
+                        (*self._key(floor_type, room_numbers), encode_layout(rooms).tobytes()))
+        return True
+
+    def take(self, floor_type: FloorsTypes, room_numbers: tuple[int, int],
+             rng: random.Random | None = None) -> list[list[RoomsTypes]] | None:
+        """
+        Sacar un mapa de la reserva. Si quedan pocos, se empieza a llenar la reserva en segundo plano.
+
+        :param floor_type: tipo de piso.
+        :param room_numbers: rango de número de habitaciones.
+        :param rng: generador de números aleatorios para elegir el mapa.
+        :return: matriz bidimensional de valores de RoomsTypes, o None si la reserva está vacía.
+        """
+        rng = rng or random
+        key = self._key(floor_type, room_numbers)
+        rooms = None
+        with self.connect() as con:
+            con.execute("BEGIN IMMEDIATE")
+            ids = con.execute("""SELECT id FROM layouts
+                                 WHERE floor_type = ? AND min_rooms = ? AND max_rooms = ? AND width = ? AND height = ?""",
+                              key).fetchall()
+            if ids:
+                layout_id = rng.choice(ids)[0]
+                codes = con.execute("SELECT codes FROM layouts WHERE id = ?", (layout_id,)).fetchone()[0]
+                con.execute("DELETE FROM layouts WHERE id = ?", (layout_id,))
+                rooms = decode_layout(np.frombuffer(codes, dtype=np.uint8).reshape(self.map_height, self.map_width))
+            con.execute("COMMIT")
+
+        if len(ids) - 1 <= self.low_water:
+            self.refill_async(floor_type, room_numbers)
+        return rooms
+
+    def refill(self, floor_type: FloorsTypes, room_numbers: tuple[int, int]) -> int:
+        """
+        Generar mapas hasta llenar la reserva.
+
+        :param floor_type: tipo de piso.
+        :param room_numbers: rango de número de habitaciones.
+        :return: número de mapas añadidos.
+        """
+        # Importación aquí: LevelGenerator no debe cargarse solo para leer la reserva
+        from src.modules.levels.LevelGenerator import generate_level
+
+        added = 0
+        while self.count(floor_type, room_numbers) < self.capacity:
+            rooms = generate_level(self.map_width, self.map_height, room_numbers, self.algorithm)
+            added += self.put(floor_type, room_numbers, rooms)
+        return added
+
+    def refill_async(self, floor_type: FloorsTypes, room_numbers: tuple[int, int]) -> threading.Thread:
+        """
+        Llenar la reserva en un hilo en segundo plano (no se inicia otro si ya hay uno para esta clave).
+
+        :param floor_type: tipo de piso.
+        :param room_numbers: rango de número de habitaciones.
+        :return: hilo que llena la reserva.
+        """
+        key = (self._floor_name(floor_type), tuple(room_numbers))
+        with self.lock:
+            thread = self.refills.get(key)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(target=self.refill, args=(floor_type, room_numbers), daemon=True)
+                self.refills[key] = thread
+                thread.start()
+        return thread
+
+    def wait(self):
+        """
+        Esperar a que terminen los hilos que llenan la reserva.
+        """
+        with self.lock:
+            threads = list(self.refills.values())
+        for thread in threads:
+            thread.join()
+
+    def _key(self, floor_type: FloorsTypes, room_numbers: tuple[int, int]) -> tuple:
+        return self._floor_name(floor_type), room_numbers[0], room_numbers[1], self.map_width, self.map_height
+
+    @staticmethod
+    def _floor_name(floor_type: FloorsTypes | str) -> str:
+        return floor_type.value if isinstance(floor_type, FloorsTypes) else str(floor_type)
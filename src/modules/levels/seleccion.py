@@ -0,0 +1,135 @@
+"""
+Selección de padres de los algoritmos genéticos.
+
+La ruleta se prepara una vez por generación con una tabla de alias de Walker, así que elegir cada padre cuesta O(1)
+en lugar de recorrer toda la población. También se puede elegir por torneo y conservar a los k mejores (elitismo).
+Las puntuaciones negativas cuentan como cero; si todas son cero, la elección es uniforme.
+"""
+
+import random
+
+import numpy as np
+
+SELECTIONS = ('roulette', 'tournament')
+
+
+class AliasTable:
+    """
+    Tabla de alias de Walker (método de Vose) para elegir índices con probabilidad proporcional a su peso.
+
+    :param weights: pesos de los índices (los negativos cuentan como cero).
+    """
+    def __init__(self, weights: list[float] | np.ndarray):
+        size = len(weights)
+        assert size > 0, "No se puede elegir en una población vacía."
+
+        weights = [max(0.0, float(weight)) for weight in weights]
+        total = sum(weights)
+        self.size = size
+        self.probabilities = [1.0] * size
+        self.aliases = list(range(size))
+        if total <= 0:
+            return
+
+        scaled = [weight * size / total for weight in weights]
+        small = [i for i, probability in enumerate(scaled) if probability < 1]
+        large = [i for i, probability in enumerate(scaled) if probability >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        # Los que quedan tienen probabilidad 1 (salvo errores de redondeo)
+        for i in small + large:
+            self.probabilities[i] = 1.0
+
+    def sample(self, rng: random.Random | None = None) -> int:
+        """
+        Elegir un índice en O(1).
+
+        :param rng: generador de números aleatorios (por defecto, el módulo random).
+        :return: índice elegido.
+        """
+        rng = rng or random
+        i = rng.randrange(self.size)
+        return i if rng.random() < self.probabilities[i] else self.aliases[i]
+
+
+class ParentSelector:
+    """
+    Estrategia de selección de padres.
+
+    :param strategy: "roulette" (ruleta de Baker con tabla de alias) o "tournament" (torneo).
+    :param tournament_size: individuos que participan en cada torneo.
+    :param elitism: número de mejores individuos que pasan sin cambios a la siguiente generación
+                    (en el algoritmo de estado estable los mejores ya se conservan siempre).
+    """
+    def __init__(self, strategy: str = 'roulette', tournament_size: int = 3, elitism: int = 0):
+        assert strategy in SELECTIONS, f"Selección desconocida: {strategy}. Opciones: {SELECTIONS}."
+        assert tournament_size >= 1 and elitism >= 0
+
+        self.strategy = strategy
+        self.tournament_size = tournament_size
+        self.elitism = elitism
+        self.scores: list[float] = []
+        self.table: AliasTable | None = None
+
+    def prepare(self, scores: list[float] | np.ndarray):
+        """
+        Preparar la selección para una generación (se llama una vez antes de elegir los padres).
+
+        :param scores: puntuaciones de aptitud de la población.
+        """
+        self.scores = list(scores)
+        self.table = AliasTable(self.scores) if self.strategy == 'roulette' else None
+
+    def select(self, rng: random.Random | None = None) -> int:
+        """
+        Elegir un individuo de la generación preparada.
+
+        :param rng: generador de números aleatorios (por defecto, el módulo random).
+        :return: índice del individuo.
+        """
+        rng = rng or random
+        if self.table is not None:
+            return self.table.sample(rng)
+        contenders = [rng.randrange(len(self.scores)) for _ in range(self.tournament_size)]
+        return max(contenders, key=lambda i: self.scores[i])
+
+    def select_parents(self, population: list, rng: random.Random | None = None) -> list:
+        """
+        Elegir dos padres (con reemplazo, como random.choices).
+
+        :param population: población de la generación preparada.
+        :param rng: generador de números aleatorios (por defecto, el módulo random).
+        :return: dos padres seleccionados.
+        """
+        return [population[self.select(rng)], population[self.select(rng)]]
+
+    def select_batch(self, scores: np.ndarray, pairs: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Elegir las parejas de padres de toda una generación de la población vectorizada.
+
+        :param scores: vector de puntuaciones de aptitud.
+        :param pairs: número de parejas.
+        :param rng: generador de números aleatorios de NumPy.
+        :return: matriz (parejas, 2) con los índices de los padres.
+        """
+        if self.strategy == 'roulette':
+            weights = np.clip(scores, 0, None).astype(np.float64)
+            total = weights.sum()
+            return rng.choice(len(scores), (pairs, 2), p=weights / total if total > 0 else None)
+        contenders = rng.integers(len(scores), size=(pairs, 2, self.tournament_size))
+        winners = np.argmax(np.asarray(scores)[contenders], axis=2)
+        return np.take_along_axis(contenders, winners[..., np.newaxis], axis=2)[..., 0]
+
+    def elite(self, scores: list[float] | np.ndarray) -> list[int]:
+        """
+        Índices de los mejores individuos que se conservan.
+
+        :param scores: puntuaciones de aptitud de la población.
+        :return: índices de los k mejores, de mejor a peor.
+        """
+        best = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+        return best[:min(self.elitism, len(scores))]
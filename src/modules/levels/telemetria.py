@@ -0,0 +1,179 @@
+"""
+Telemetría por generación de los algoritmos genéticos.
+
+Los algoritmos aceptan una lista de observadores (cualquier función que reciba un GenerationEvent).
+Después de evaluar la población inicial y cada generación se envía un evento con la aptitud (mejor, media, peor),
+la diversidad, las evaluaciones de la función de aptitud, la caché, las reparaciones del paseo aleatorio y el tiempo.
+CsvSink y JsonLinesSink guardan los eventos en archivos CSV o JSON Lines.
+"""
+
+import csv
+import json
+import statistics
+import time
+from typing import Callable, Iterable, TextIO
+
+import numpy as np
+
+from src.modules.levels.cacheAptitud import FitnessCache
+from src.modules.levels.criteriosParada import population_diversity
+from src.modules.levels.evaluacionParalela import FitnessEvaluator
+from src.modules.levels.reparacion import RepairStats
+
+
+class GenerationEvent:
+    """
+    Datos de una generación.
+
+    :param algorithm: algoritmo que emite el evento ("steady_state", "generational", "island", ...).
+    :param generation: número de generaciones ejecutadas (0 para la población inicial).
+    :param best: mejor aptitud de la población.
+    :param mean: aptitud media.
+    :param worst: peor aptitud.
+    :param diversity: proporción de individuos distintos.
+    :param evaluations: llamadas a la función de aptitud en esta generación.
+    :param cache_hit_rate: tasa de aciertos de la caché de aptitud en la ejecución (None si no hay caché).
+    :param repairs: mapas reparados en la ejecución (en lugar de volver a generarse).
+    :param retries: mapas que hubo que volver a generar en la ejecución.
+    :param generation_time: segundos que tardó esta generación.
+    :param elapsed: segundos desde el inicio de la ejecución.
+    """
+    __slots__ = ('algorithm', 'generation', 'best', 'mean', 'worst', 'diversity', 'evaluations',
+                 'cache_hit_rate', 'repairs', 'retries', 'generation_time', 'elapsed')
+
+    def __init__(self, algorithm: str, generation: int, best: float, mean: float, worst: float, diversity: float,
+                 evaluations: int, cache_hit_rate: float | None, repairs: int, retries: int,
+                 generation_time: float, elapsed: float):
+        self.algorithm = algorithm
+        self.generation = generation
+        self.best = best
+        self.mean = mean
+        self.worst = worst
+        self.diversity = diversity
+        self.evaluations = evaluations
+        self.cache_hit_rate = cache_hit_rate
+        self.repairs = repairs
+        self.retries = retries
+        self.generation_time = generation_time
+        self.elapsed = elapsed
+
+    def as_dict(self) -> dict:
+        """
+        :return: diccionario con todos los campos del evento.
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class GenerationReporter:
+    """
+    Construye los eventos de una ejecución y los envía a los observadores.
+
+    :param algorithm: nombre del algoritmo.
+    :param observers: funciones que reciben cada GenerationEvent.
+    :param cache: caché de aptitud de la ejecución.
+    :param evaluator: ejecutor de la aptitud, del que se cuentan las evaluaciones de cada generación.
+    :param repairs: contadores de reparaciones de la ejecución (los que recibe generate_initial_population).
+    """
+    def __init__(self, algorithm: str, observers: Iterable[Callable[[GenerationEvent], None]],
+                 cache: FitnessCache | None = None, evaluator: FitnessEvaluator | None = None,
+                 repairs: RepairStats | None = None):
+        self.algorithm = algorithm
+        self.observers = list(observers)
+        self.cache = cache
+        self.evaluator = evaluator
+        self.evaluations = evaluator.evaluations if evaluator is not None else 0
+        self.repairs = repairs if repairs is not None else RepairStats()
+        self.start = self.last = time.perf_counter()
+
+    def emit(self, generation: int, scores: list[float] | np.ndarray, population: list | np.ndarray,
+             evaluations: int | None = None):
+        """
+        Enviar el evento de una generación.
+
+        :param generation: número de generaciones ejecutadas.
+        :param scores: puntuaciones de aptitud de la población.
+        :param population: población (lista de mapas o matriz de la población vectorizada).
+        :param evaluations: llamadas a la función de aptitud en esta generación (por defecto, las del ejecutor).
+        """
+        now = time.perf_counter()
+        if evaluations is None and self.evaluator is not None:
+            evaluations = self.evaluator.evaluations - self.evaluations
+            self.evaluations = self.evaluator.evaluations
+        scores = [float(score) for score in scores]
+        event = GenerationEvent(self.algorithm, generation, max(scores), statistics.fmean(scores), min(scores),
+                                population_diversity(population), evaluations or 0,
+                                self.cache.hit_rate if self.cache is not None else None,
+                                self.repairs.repaired, self.repairs.retries,
+                                now - self.last, now - self.start)
+        self.last = now
+        for observer in self.observers:
+            observer(event)
+
+
+class _FileSink:
+    """
+    Observador que escribe los eventos en un archivo.
+
+    :param file: ruta del archivo o archivo ya abierto.
+    :param context: campos que se añaden a cada fila (por ejemplo, la ejecución o el tamaño de la población).
+    """
+    def __init__(self, file: str | TextIO, context: dict | None = None):
+        self.owns_file = isinstance(file, str)
+        self.file = open(file, 'w', newline='') if self.owns_file else file
+        self.context = dict(context or {})
+
+    def set_context(self, **context):
+        """
+        Cambiar los campos que se añaden a las siguientes filas.
+        """
+        self.context.update(context)
+
+    def row(self, event: GenerationEvent) -> dict:
+        return {**self.context, **event.as_dict()}
+
+    def close(self):
+        """
+        Cerrar el archivo (solo si lo abrió el observador).
+        """
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvSink(_FileSink):
+    """
+    Observador que escribe una fila CSV por generación.
+    Las columnas se fijan al crearlo: los campos del contexto inicial, los de fields y los del evento.
+    Los campos que se añadan después con set_context sin declararlos en fields no se escriben,
+    y los que falten en una fila quedan vacíos.
+
+    :param file: ruta del archivo o archivo ya abierto.
+    :param context: campos que se añaden a cada fila.
+    :param fields: otros campos de contexto que se darán más tarde con set_context.
+    """
+    def __init__(self, file: str | TextIO, context: dict | None = None, fields: Iterable[str] = ()):
+        super().__init__(file, context)
+        fieldnames = list(dict.fromkeys([*self.context, *fields, *GenerationEvent.__slots__]))
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames, extrasaction='ignore')
+        self.header_written = False
+
+    def __call__(self, event: GenerationEvent):
+        if not self.header_written:
+            self.writer.writeheader()
+            self.header_written = True
+        self.writer.writerow(self.row(event))
+
+
+class JsonLinesSink(_FileSink):
+    """
+    Observador que escribe un objeto JSON por línea y generación.
+    """
+    def __call__(self, event: GenerationEvent):
+        self.file.write(json.dumps(self.row(event)) + '\n')
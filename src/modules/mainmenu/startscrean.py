@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import pygame
 import src.consts
@@ -86,6 +87,39 @@ def start_screen(screen):
         pygame.display.flip()
 
 
+def loading_screen(screen, coroutine):
+    """
+    Pantalla de carga: dibuja una animación y procesa los eventos mientras se espera la corrutina
+    (por ejemplo, Game.load_async()), para que la ventana no se congele.
+
+    :param screen: lienzo sobre el que dibujar.
+    :param coroutine: corrutina que se espera.
+    :return: resultado de la corrutina.
+    """
+    return asyncio.run(_loading(screen, coroutine))
+
+
+async def _loading(screen, coroutine):
+    fon = pygame.transform.scale(load_image('images/menu/fon.png'), (WIDTH, HEIGHT))
+    frames = [pygame.sprite.Group(), pygame.sprite.Group()]
+    MenuSprite(load_image("images/menu/isaac1.png", -1), 365, 300, 500, 500, frames[0])
+    MenuSprite(load_image("images/menu/isaac2.png", -1), 365, 300, 500, 500, frames[1])
+    text = UpheavalFont().write_text('loading')
+    task = asyncio.create_task(coroutine)
+    i = 0
+    while not task.done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                terminate()
+        screen.blit(fon, (0, 0))
+        frames[i // 10 % 2].draw(screen)
+        screen.blit(text, ((WIDTH - text.get_width()) // 2, 150))
+        pygame.display.flip()
+        i += 1
+        await asyncio.sleep(1 / 40)
+    return task.result()
+
+
 def create_sprite(lst: list, hero_choise_sprites: pygame.sprite.Group):
     MenuSprite(load_image(lst[0], -1), 610, 450, 80, 90, hero_choise_sprites)
     MenuSprite(load_image(lst[1], -1), 510, 360, 80, 90, hero_choise_sprites)
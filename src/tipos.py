@@ -0,0 +1,75 @@
+"""
+Enumeraciones del juego que no dependen de pygame.
+
+src.consts las vuelve a exportar; los módulos de generación de niveles las importan desde aquí
+para poder usarse sin pygame (por ejemplo, en la generación masiva de mapas).
+"""
+
+from enum import Enum
+
+
+class FloorsTypes(Enum):
+    """
+    Constantes de tipos de pisos.
+    """
+    BASEMENT: str = "basement"
+    CAVES: str = "caves"
+    CATACOMBS: str = "catacombs"
+    DEPTHS: str = "depths"
+    BLUEWOMB: str = "bluewomb"
+    WOMB: str = "womb"
+
+
+class RoomsTypes(Enum):
+    """
+    Constantes de tipos de habitaciones (¿cambiar a algún valor aleatorio?).
+    """
+    EMPTY: str = "empty"
+    DEFAULT: str = "default"
+    SPAWN: str = "spawn"
+    TREASURE: str = "treasure"
+    SHOP: str = "shop"
+    SECRET: str = "secret"
+    BOSS: str = "boss"
+
+
+class Moves(Enum):
+    """
+     Posibles direcciones (x, y) (hacer suma).
+     La esquina superior izquierda es el origen.
+    """
+    UP = (0, -1)
+    DOWN = (0, 1)
+    RIGHT = (1, 0)
+    LEFT = (-1, 0)
+    TOPLEFT = (-1, -1)
+    TOPRIGHT = (1, -1)
+    BOTTOMRIGHT = (1, 1)
+    BOTTOMLEFT = (-1, 1)
+
+
+class DoorsCoords(Enum):
+    """
+    Posibles coordenadas de las puertas en la habitación (x, y)
+    """
+    UP = (6, -1)
+    DOWN = (6, 7)
+    RIGHT = (13, 3)
+    LEFT = (-1, 3)
+
+
+class FirePlacesTypes(Enum):
+    """
+    Tipos de fogatas.
+    """
+    DEFAULT = 'default'
+    RED = 'red'
+
+
+class HeartsTypes(Enum):
+    """
+    Tipos de corazones del personaje.
+    """
+    RED = 'red'
+    BLUE = 'blue'
+    BLACK = 'black'
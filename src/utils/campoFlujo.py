@@ -0,0 +1,83 @@
+"""
+Campo de flujo (flow field) hacia el personaje principal dentro de una habitación.
+
+En lugar de que cada enemigo terrestre busque su propio camino (graph.make_path_to_cell) en cada recálculo,
+la habitación guarda una única búsqueda en anchura desde la celda del personaje principal.
+Cada celda alcanzable apunta a su vecina más cercana al objetivo, así que el siguiente paso de cualquier enemigo
+se lee en tiempo constante. El campo solo se recalcula cuando el personaje cambia de celda o cambia el grafo.
+Con un graph.GridGraph, el campo es una fila de la tabla de siguiente paso compartida (tablaSaltos),
+que se calcula una sola vez por disposición de obstáculos y destino.
+"""
+
+import collections
+
+from src.utils.graph import GridGraph
+from src.utils.tablaSaltos import NextHopTable, next_hop_table
+
+
+class FlowField:
+    """
+    Distancias y siguiente paso de cada celda hacia una celda objetivo.
+
+    :param graph: grafo de la habitación (graph.GridGraph o diccionario celda: lista de celdas vecinas).
+    """
+    def __init__(self, graph: dict[tuple[int, int], list[tuple[int, int]]] | None = None):
+        self.graph = graph if graph is not None else {}
+        self.target: tuple[int, int] | None = None
+        self.distances: dict[tuple[int, int], int] = {}
+        self.next_cells: dict[tuple[int, int], tuple[int, int]] = {}
+        self.table: NextHopTable | None = None  # Tabla compartida si el grafo es un GridGraph
+        self.updates = 0  # Número de veces que se recalculó el campo
+
+    def update(self, graph: dict[tuple[int, int], list[tuple[int, int]]], target: tuple[int, int] | None) -> bool:
+        """
+        Recalcular el campo si cambió el grafo (otro objeto) o la celda objetivo.
+
+        :param graph: grafo de la habitación.
+        :param target: celda objetivo (la del personaje principal); None si está fuera de la habitación.
+        :return: ¿Se recalculó el campo?
+        """
+        if graph is self.graph and target == self.target and self.updates:
+            return False
+        self.graph = graph
+        self.target = target
+        self.distances = {}
+        self.next_cells = {}
+        self.table = None
+        self.updates += 1
+        if target is None:
+            return True
+        if isinstance(graph, GridGraph):
+            self.table = next_hop_table(graph)
+            return True
+
+        # El grafo de la habitación es simétrico: los vecinos de una celda son también sus predecesores
+        self.distances[target] = 0
+        queue = collections.deque([target])
+        while queue:
+            cell = queue.popleft()
+            distance = self.distances[cell] + 1
+            for next_cell in graph.get(cell, []):
+                if next_cell not in self.distances:
+                    self.distances[next_cell] = distance
+                    self.next_cells[next_cell] = cell
+                    queue.append(next_cell)
+        return True
+
+    def next_cell(self, xy: tuple[int, int]) -> tuple[int, int] | None:
+        """
+        :param xy: celda actual.
+        :return: siguiente celda del camino más corto hacia el objetivo (None si ya está en él o no hay camino).
+        """
+        if self.table is not None:
+            return self.table.next_cell(xy, self.target)
+        return self.next_cells.get(xy)
+
+    def distance(self, xy: tuple[int, int]) -> int | None:
+        """
+        :param xy: celda.
+        :return: pasos hasta el objetivo (None si no hay camino).
+        """
+        if self.table is not None:
+            return self.table.distance(xy, self.target)
+        return self.distances.get(xy)
@@ -0,0 +1,202 @@
+"""
+Características de un mapa de piso calculadas de una sola vez.
+
+En lugar de recorrer el mapa una vez por cada comprobación (comprobaciones.py, conectividad.py),
+se hace una búsqueda en anchura desde la sala de inicio y un único recorrido de la matriz (LayoutAnalysis).
+El resultado se guarda en un registro compacto (LayoutFeatures) que leen la función de aptitud y los análisis.
+"""
+
+import collections
+
+from src.tipos import RoomsTypes
+from src.utils.conectividad import NEIGHBOR_MOVES, spawn_position
+
+# Posición de cada tipo de habitación en LayoutFeatures.counts
+ROOM_INDEX: dict[RoomsTypes, int] = {room_type: i for i, room_type in enumerate(RoomsTypes)}
+
+# Tipos por los que no pasa el camino hasta el jefe (comprobaciones.distance_between_start_and_boss)
+_BLOCKED = (RoomsTypes.EMPTY, RoomsTypes.SECRET)
+# Tipos por los que además no pasa el camino de la conectividad (conectividad.ignored_rooms)
+_SKIPPED = (RoomsTypes.TREASURE, RoomsTypes.SHOP)
+_CLOSED = _BLOCKED + _SKIPPED
+
+
+class LayoutFeatures:
+    """
+    Registro de las características de un mapa.
+
+    :param counts: número de habitaciones de cada tipo, en el orden de RoomsTypes.
+    :param rooms: número de habitaciones (celdas no vacías).
+    :param connected: ¿Todas las habitaciones tienen un camino hacia la sala de inicio?
+    :param boss_distance: salas que hay que recorrer desde el inicio hasta el jefe (0 si no hay camino).
+    """
+    __slots__ = ('counts', 'rooms', 'connected', 'boss_distance')
+
+    def __init__(self, counts: tuple[int, ...], rooms: int, connected: bool, boss_distance: int):
+        self.counts = counts
+        self.rooms = rooms
+        self.connected = connected
+        self.boss_distance = boss_distance
+
+    def count(self, room_type: RoomsTypes) -> int:
+        """
+        :param room_type: tipo de habitación.
+        :return: número de habitaciones de ese tipo.
+        """
+        return self.counts[ROOM_INDEX[room_type]]
+
+    def exists(self, room_type: RoomsTypes) -> bool:
+        """
+        :param room_type: tipo de habitación.
+        :return: ¿Hay alguna habitación de ese tipo?
+        """
+        return self.counts[ROOM_INDEX[room_type]] > 0
+
+    def __repr__(self):
+        counts = ', '.join(f'{room_type.name}={count}' for room_type, count in zip(RoomsTypes, self.counts) if count)
+        return (f'LayoutFeatures({counts}, rooms={self.rooms}, connected={self.connected}, '
+                f'boss_distance={self.boss_distance})')
+
+
+class LayoutAnalysis:
+    """
+    Análisis de un mapa a partir de una única búsqueda en anchura desde la sala de inicio.
+    Lo comparten el generador (colocación del jefe en algoritmoGenetico.set_special_rooms)
+    y la función de aptitud (extract_features).
+
+    La búsqueda guarda, para cada celda, si se llega a ella sin pasar por la tesorería ni la tienda (conectividad)
+    y la distancia más corta pasando por ellas (distancia hasta el jefe). Ningún camino pasa por la sala secreta.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    """
+    def __init__(self, rooms: list[list[RoomsTypes | str]]):
+        self.width, self.height = len(rooms[0]), len(rooms)
+        self.start = spawn_position(rooms)
+        self.distances: dict[tuple[int, int], int] = {}  # Salas desde el inicio hasta cada celda alcanzable
+        self.reached: set[tuple[int, int]] = set()  # Celdas alcanzables sin pasar por la tesorería ni la tienda
+        self.connected = True  # ¿Todas las habitaciones tienen un camino hacia la sala de inicio?
+        # Habitaciones (sin contar el inicio) con un solo vecino transitable para la conectividad, por filas
+        self.dead_ends: list[tuple[int, int]] = []
+        self.counts: tuple[int, ...] = ()  # Número de habitaciones de cada tipo, en el orden de RoomsTypes
+        self.boss_distance = 0  # Salas desde el inicio hasta el jefe más cercano (0 si no hay camino)
+        self._search(rooms)
+        self._scan(rooms)
+
+    def _search(self, rooms: list[list[RoomsTypes | str]]):
+        map_width, map_height = self.width, self.height
+        start = self.start
+        start_type = rooms[start[1]][start[0]]
+
+        # Estados (celda, ¿camino sin tesorería ni tienda?); el inicio se expande aunque no sea transitable
+        start_state = (start, start_type not in _BLOCKED and start_type not in _SKIPPED)
+        distances, reached = self.distances, self.reached
+        distances[start] = 0
+        if start_state[1]:
+            reached.add(start)
+        visited = {start_state}
+        queue = collections.deque([(start_state, 0)])
+        while queue:
+            ((x, y), strict), distance = queue.popleft()
+            for dx, dy in NEIGHBOR_MOVES:
+                next_x, next_y = x + dx, y + dy
+                if not (0 <= next_x < map_width and 0 <= next_y < map_height):
+                    continue
+                room = rooms[next_y][next_x]
+                if room in _BLOCKED:
+                    continue
+                state = ((next_x, next_y), strict and room not in _SKIPPED)
+                if state in visited:
+                    continue
+                visited.add(state)
+                distances.setdefault(state[0], distance + 1)
+                if state[1]:
+                    reached.add(state[0])
+                queue.append((state, distance + 1))
+
+    def _scan(self, rooms: list[list[RoomsTypes | str]]):
+        map_width, map_height = self.width, self.height
+        start, reached, distances = self.start, self.reached, self.distances
+        counts = [0] * len(ROOM_INDEX)
+        boss_distances = []
+        for y, row in enumerate(rooms):
+            for x, room in enumerate(row):
+                counts[ROOM_INDEX[room]] += 1
+                if room in _BLOCKED:
+                    continue
+                if room == RoomsTypes.BOSS and (x, y) in distances:
+                    boss_distances.append(distances[(x, y)])
+                if (x, y) == start:
+                    continue
+                # Una habitación tiene camino si es el inicio o si tiene un vecino alcanzable
+                open_neighbors = 0
+                linked = False
+                for dx, dy in NEIGHBOR_MOVES:
+                    next_x, next_y = x + dx, y + dy
+                    if (0 <= next_x < map_width and 0 <= next_y < map_height
+                            and rooms[next_y][next_x] not in _CLOSED):
+                        open_neighbors += 1
+                        linked = linked or (next_x, next_y) in reached
+                if not linked:
+                    self.connected = False
+                if open_neighbors == 1:
+                    self.dead_ends.append((x, y))
+        self.counts = tuple(counts)
+        self.boss_distance = min(boss_distances, default=0)
+
+    @property
+    def rooms(self) -> int:
+        """
+        :return: número de habitaciones (celdas no vacías).
+        """
+        return self.width * self.height - self.counts[ROOM_INDEX[RoomsTypes.EMPTY]]
+
+    def distance(self, xy: tuple[int, int]) -> int | None:
+        """
+        :param xy: celda.
+        :return: salas que hay que recorrer desde el inicio (None si no se llega).
+        """
+        return self.distances.get(xy)
+
+    def is_reachable(self, xy: tuple[int, int]) -> bool:
+        """
+        :param xy: celda.
+        :return: ¿Se llega a la celda desde el inicio (pudiendo pasar por la tesorería y la tienda)?
+        """
+        return xy in self.distances
+
+    def has_path_to_start(self, xy: tuple[int, int]) -> bool:
+        """
+        Igual que algoritmoGenetico.has_path_to_start: el camino no pasa por la secreta, la tesorería ni la tienda.
+
+        :param xy: celda de una habitación.
+        :return: ¿La habitación tiene un camino hasta la sala de inicio?
+        """
+        x, y = xy
+        return xy == self.start or any((x + dx, y + dy) in self.reached for dx, dy in NEIGHBOR_MOVES)
+
+    def farthest_dead_end(self, dead_ends: list[tuple[int, int]] | None = None) -> tuple[int, int] | None:
+        """
+        Callejón sin salida más lejano del inicio siguiendo los caminos (no en línea recta).
+        A igual distancia se elige el primero por filas.
+
+        :param dead_ends: candidatos (por defecto, todos los callejones sin salida).
+        :return: coordenadas del callejón sin salida o None si no hay ninguno.
+        """
+        dead_ends = self.dead_ends if dead_ends is None else dead_ends
+        return max(dead_ends, key=lambda xy: self.distances.get(xy, -1), default=None)
+
+    def features(self) -> LayoutFeatures:
+        """
+        :return: registro compacto de las características que lee la función de aptitud.
+        """
+        return LayoutFeatures(self.counts, self.rooms, self.connected, self.boss_distance)
+
+
+def extract_features(rooms: list[list[RoomsTypes | str]]) -> LayoutFeatures:
+    """
+    Calcular todas las características del mapa con una búsqueda en anchura y un recorrido de la matriz.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :return: características del mapa.
+    """
+    return LayoutAnalysis(rooms).features()
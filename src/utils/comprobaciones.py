@@ -1,5 +1,5 @@
 import math
-from src.consts import RoomsTypes, Moves
+from src.tipos import RoomsTypes, Moves
 from collections import deque
 
 def distance_between_start_and_boss(rooms: list[list[RoomsTypes]]) -> int:
@@ -13,12 +13,11 @@ def distance_between_start_and_boss(rooms: list[list[RoomsTypes]]) -> int:
     """
     map_width, map_height = len(rooms[0]), len(rooms)
     start_pos = math.ceil(map_width / 2) - 1, math.ceil(map_height / 2) - 1
-    visited = set()  # Para evitar visitar la misma sala más de una vez
+    visited = {start_pos}  # Para evitar visitar la misma sala más de una vez (se marca al añadirla a la cola)
     queue = deque([(start_pos, 0)])  # Iniciar la cola con la posición de inicio y la distancia 0
 
     while queue:
         (x, y), distance = queue.popleft()
-        visited.add((x, y))
 
         # Si encontramos la sala del jefe, devolvemos la distancia
         if rooms[y][x] == RoomsTypes.BOSS:
@@ -31,6 +30,7 @@ def distance_between_start_and_boss(rooms: list[list[RoomsTypes]]) -> int:
         # Añadir vecinos no visitados a la cola
         for neighbor in neighbors:
             if neighbor not in visited:
+                visited.add(neighbor)
                 queue.append((neighbor, distance + 1))
 
     # Si no se encuentra un camino hasta la sala del jefe se devuelve 0
@@ -0,0 +1,233 @@
+"""
+Comprobación de la conectividad del mapa del piso.
+
+En lugar de buscar un camino (BFS) desde cada habitación hasta la sala de inicio,
+se hace un único relleno por inundación desde la sala de inicio:
+una habitación tiene camino hasta el inicio si es el propio inicio o si tiene un vecino alcanzable.
+"""
+
+import collections
+import math
+
+from src.tipos import RoomsTypes
+
+# Movimientos arriba, abajo, derecha, izquierda
+NEIGHBOR_MOVES = ((0, -1), (0, 1), (1, 0), (-1, 0))
+
+
+def spawn_position(rooms: list[list[RoomsTypes | str]]) -> tuple[int, int]:
+    """
+    Coordenadas (x, y) de la sala de inicio (el centro del mapa).
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :return: coordenadas de la sala de inicio.
+    """
+    map_width, map_height = len(rooms[0]), len(rooms)
+    return math.ceil(map_width / 2) - 1, math.ceil(map_height / 2) - 1
+
+
+def ignored_rooms(ignore_secret: bool = True) -> tuple[RoomsTypes, ...]:
+    """
+    Tipos de habitación por los que no puede pasar un camino (igual que graph.get_neighbors_coords).
+
+    :param ignore_secret: si se ignora la habitación secreta (y con ella el tesoro y la tienda).
+    :return: tupla de tipos de habitación.
+    """
+    if ignore_secret:
+        return RoomsTypes.EMPTY, RoomsTypes.SECRET, RoomsTypes.TREASURE, RoomsTypes.SHOP
+    return (RoomsTypes.EMPTY,)
+
+
+def flood_fill_from_spawn(rooms: list[list[RoomsTypes | str]], *, ignore_secret: bool = True,
+                          start: tuple[int, int] | None = None,
+                          reached: set[tuple[int, int]] | None = None) -> set[tuple[int, int]]:
+    """
+    Relleno por inundación de las celdas transitables alcanzables desde la sala de inicio.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :param ignore_secret: si se ignora la habitación secreta.
+    :param start: celda desde la que se inunda (por defecto, la sala de inicio).
+    :param reached: conjunto de celdas ya alcanzadas que se amplía (para comprobaciones incrementales).
+    :return: conjunto de celdas alcanzables.
+    """
+    map_width, map_height = len(rooms[0]), len(rooms)
+    ignored = ignored_rooms(ignore_secret)
+    start = start if start is not None else spawn_position(rooms)
+    reached = reached if reached is not None else set()
+    if rooms[start[1]][start[0]] in ignored or start in reached:
+        return reached
+
+    reached.add(start)
+    queue = collections.deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in NEIGHBOR_MOVES:
+            next_x, next_y = x + dx, y + dy
+            if (0 <= next_x < map_width and 0 <= next_y < map_height
+                    and (next_x, next_y) not in reached and rooms[next_y][next_x] not in ignored):
+                reached.add((next_x, next_y))
+                queue.append((next_x, next_y))
+    return reached
+
+
+def all_rooms_reachable(rooms: list[list[RoomsTypes | str]], *, ignore_secret: bool = True) -> bool:
+    """
+    Comprobar en una sola pasada si todas las habitaciones tienen camino hasta la sala de inicio.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :param ignore_secret: si se ignora la habitación secreta.
+    :return: ¿Todas las habitaciones tienen un camino hacia la sala de inicio?
+    """
+    return not ConnectivityChecker(rooms, ignore_secret=ignore_secret).orphans
+
+
+def articulation_points(rooms: list[list[RoomsTypes | str]], *, ignore_secret: bool = True) -> set[tuple[int, int]]:
+    """
+    Puntos de articulación (algoritmo de Tarjan) de las celdas transitables alcanzables desde la sala de inicio:
+    celdas que, al quitarlas, dejan alguna otra celda sin camino hasta el inicio.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes.
+    :param ignore_secret: si se ignora la habitación secreta.
+    :return: conjunto de coordenadas de los puntos de articulación.
+    """
+    map_width, map_height = len(rooms[0]), len(rooms)
+    ignored = ignored_rooms(ignore_secret)
+    start = spawn_position(rooms)
+    if rooms[start[1]][start[0]] in ignored:
+        return set()
+
+    def neighbors(cell: tuple[int, int]) -> list[tuple[int, int]]:
+        return [(cell[0] + dx, cell[1] + dy) for dx, dy in NEIGHBOR_MOVES
+                if 0 <= cell[0] + dx < map_width and 0 <= cell[1] + dy < map_height
+                and rooms[cell[1] + dy][cell[0] + dx] not in ignored]
+
+    order = {start: 0}  # Orden de descubrimiento en el DFS
+    low = {start: 0}  # Menor orden alcanzable desde el subárbol
+    points = set()
+    root_children = 0
+    stack = [(start, None, iter(neighbors(start)))]
+    while stack:
+        cell, parent, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if parent is not None:
+                low[parent] = min(low[parent], low[cell])
+                if parent != start and low[cell] >= order[parent]:
+                    points.add(parent)
+        elif child not in order:
+            order[child] = low[child] = len(order)
+            if cell == start:
+                root_children += 1
+            stack.append((child, cell, iter(neighbors(child))))
+        elif child != parent:
+            low[cell] = min(low[cell], order[child])
+    if root_children > 1:
+        points.add(start)
+    return points
+
+
+class ConnectivityChecker:
+    """
+    Conectividad del mapa con comprobaciones incrementales al cambiar una celda.
+
+    :param rooms: matriz bidimensional de valores de RoomsTypes (se modifica en set_cell/try_cell).
+    :param ignore_secret: si se ignora la habitación secreta.
+    """
+    def __init__(self, rooms: list[list[RoomsTypes | str]], *, ignore_secret: bool = True):
+        self.rooms = rooms
+        self.ignore_secret = ignore_secret
+        self.ignored = ignored_rooms(ignore_secret)
+        self.width, self.height = len(rooms[0]), len(rooms)
+        self.spawn = spawn_position(rooms)
+        self.reached: set[tuple[int, int]] = set()
+        self.orphans: set[tuple[int, int]] = set()  # Habitaciones sin camino hasta el inicio
+        self.recompute()
+
+    def recompute(self):
+        """
+        Recalcular la conectividad de todo el mapa (un relleno por inundación y un recorrido).
+        """
+        self.reached = flood_fill_from_spawn(self.rooms, ignore_secret=self.ignore_secret, start=self.spawn)
+        self.orphans = set()
+        for y, row in enumerate(self.rooms):
+            for x in range(len(row)):
+                self.update_orphan(x, y)
+
+    def is_connected(self) -> bool:
+        """
+        :return: ¿Todas las habitaciones tienen un camino hacia la sala de inicio?
+        """
+        return not self.orphans
+
+    def has_path(self, x: int, y: int) -> bool:
+        """
+        Comprobar si la celda tiene camino hasta la sala de inicio.
+
+        :param x: coordenada de la columna.
+        :param y: coordenada de la fila.
+        :return: ¿Hay camino?
+        """
+        if (x, y) == self.spawn:
+            return True
+        return any((x + dx, y + dy) in self.reached for dx, dy in NEIGHBOR_MOVES)
+
+    def update_orphan(self, x: int, y: int):
+        """
+        Actualizar si la celda es una habitación sin camino hasta el inicio.
+
+        :param x: coordenada de la columna.
+        :param y: coordenada de la fila.
+        """
+        if self.rooms[y][x] not in (RoomsTypes.EMPTY, RoomsTypes.SECRET) and not self.has_path(x, y):
+            self.orphans.add((x, y))
+        else:
+            self.orphans.discard((x, y))
+
+    def set_cell(self, x: int, y: int, room_type: RoomsTypes):
+        """
+        Cambiar el tipo de una celda y actualizar la conectividad sin recalcular todo el mapa si no es necesario.
+
+        :param x: coordenada de la columna.
+        :param y: coordenada de la fila.
+        :param room_type: nuevo tipo de habitación.
+        """
+        was_passable = self.rooms[y][x] not in self.ignored
+        self.rooms[y][x] = room_type
+        is_passable = room_type not in self.ignored
+
+        if was_passable == is_passable:
+            # Las celdas alcanzables no cambian, solo puede cambiar la propia celda
+            self.update_orphan(x, y)
+        elif is_passable:
+            if (x, y) == self.spawn or self.has_path(x, y):
+                # La nueva celda amplía la zona alcanzable
+                before = set(self.reached)
+                flood_fill_from_spawn(self.rooms, ignore_secret=self.ignore_secret, start=(x, y), reached=self.reached)
+                for cell_x, cell_y in self.reached - before:
+                    self.update_orphan(cell_x, cell_y)
+                    for dx, dy in NEIGHBOR_MOVES:
+                        if 0 <= cell_x + dx < self.width and 0 <= cell_y + dy < self.height:
+                            self.update_orphan(cell_x + dx, cell_y + dy)
+            else:
+                self.update_orphan(x, y)
+        elif (x, y) in self.reached:
+            # Quitar una celda alcanzable puede desconectar el mapa
+            self.recompute()
+        else:
+            self.update_orphan(x, y)
+
+    def try_cell(self, x: int, y: int, room_type: RoomsTypes) -> bool:
+        """
+        Comprobar si el mapa sigue conectado con otro tipo en la celda (el mapa no se modifica).
+
+        :param x: coordenada de la columna.
+        :param y: coordenada de la fila.
+        :param room_type: tipo de habitación a probar.
+        :return: ¿Todas las habitaciones tendrían camino hasta la sala de inicio?
+        """
+        previous = self.rooms[y][x]
+        self.set_cell(x, y, room_type)
+        is_okay = self.is_connected()
+        self.set_cell(x, y, previous)
+        return is_okay
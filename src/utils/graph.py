@@ -1,6 +1,12 @@
 import collections
+import collections.abc
+import functools
+import heapq
+import itertools
+import math
+from typing import Iterable, Iterator
 
-from src import consts
+from src.tipos import RoomsTypes
 
 
 def valid_coords(x: int, y: int, width: int, height: int) -> bool:
@@ -16,7 +22,7 @@ def valid_coords(x: int, y: int, width: int, height: int) -> bool:
     return width > x >= 0 and height > y >= 0
 
 
-def get_neighbors_coords(x: int, y: int, rooms: list[list[consts.RoomsTypes | str]],
+def get_neighbors_coords(x: int, y: int, rooms: list[list[RoomsTypes | str]],
                          *,
                          ignore_secret: bool = False,
                          use_diagonals: bool = False) -> list[tuple[int, int]]:
@@ -34,11 +40,11 @@ def get_neighbors_coords(x: int, y: int, rooms: list[list[consts.RoomsTypes | st
     if use_diagonals:
         moves += [(1, 1), (-1, -1), (1, -1), (-1, 1)]
     map_width, map_height = len(rooms[0]), len(rooms)
-    ignored = [consts.RoomsTypes.EMPTY]
+    ignored = [RoomsTypes.EMPTY]
     if ignore_secret:
-        ignored.append(consts.RoomsTypes.SECRET)
-        ignored.append(consts.RoomsTypes.TREASURE)
-        ignored.append(consts.RoomsTypes.SHOP)
+        ignored.append(RoomsTypes.SECRET)
+        ignored.append(RoomsTypes.TREASURE)
+        ignored.append(RoomsTypes.SHOP)
     return [(x + i, y + j) for i, j in moves if
             valid_coords(x + i, y + j, map_width, map_height) and rooms[y + j][x + i] not in ignored]
 
@@ -56,6 +62,9 @@ def make_path_to_cell(graph: dict[tuple[int, int]],
     :param xy_end: Celda de destino.
     :return: Lista de celdas del camino o False.
     """
+    if isinstance(graph, GridGraph):
+        return graph.path(xy_start, xy_end)
+
     queue = collections.deque([xy_start])
     visited: dict[tuple[int, int], tuple[int, int]] = {xy_start: None}
     while queue:
@@ -80,7 +89,7 @@ def make_path_to_cell(graph: dict[tuple[int, int]],
     return way
 
 
-def make_neighbors_graph(rooms: list[list[consts.RoomsTypes | str]],
+def make_neighbors_graph(rooms: list[list[RoomsTypes | str]],
                          ignore_secret: bool = False,
                          use_diagonals: bool = False) -> dict[tuple[int, int], list[tuple[int, int]]]:
     """
@@ -99,7 +108,373 @@ def make_neighbors_graph(rooms: list[list[consts.RoomsTypes | str]],
     # Celda -> Lista de vecinos a los que se puede acceder
     for y, row in enumerate(rooms):
         for x, col in enumerate(row):
-            if col != consts.RoomsTypes.EMPTY:
+            if col != RoomsTypes.EMPTY:
                 graph[(x, y)].extend(get_neighbors_coords(x, y, rooms,
                                                           ignore_secret=ignore_secret, use_diagonals=use_diagonals))
     return graph
+
+
+# Movimientos en el mismo orden que get_neighbors_coords
+MOVES_4 = ((0, -1), (0, 1), (1, 0), (-1, 0))
+MOVES_8 = MOVES_4 + ((1, 1), (-1, -1), (1, -1), (-1, 1))
+
+# Cada GridGraph recibe una versión distinta: como el grafo no se modifica, la versión identifica su contenido
+_graph_versions = itertools.count(1)
+
+
+@functools.lru_cache(maxsize=None)
+def neighbor_table(width: int, height: int, use_diagonals: bool = False) -> tuple[tuple[int, ...], ...]:
+    """
+    Tabla de vecinos de una cuadrícula con índices planos (i = y * width + x), calculada una vez por tamaño.
+
+    :param width: ancho de la cuadrícula.
+    :param height: altura de la cuadrícula.
+    :param use_diagonals: incluir los vecinos en diagonal.
+    :return: para cada índice, los índices de las celdas vecinas dentro de la cuadrícula.
+    """
+    moves = MOVES_8 if use_diagonals else MOVES_4
+    return tuple(tuple((y + j) * width + x + i for i, j in moves if valid_coords(x + i, y + j, width, height))
+                 for y in range(height) for x in range(width))
+
+
+@functools.lru_cache(maxsize=None)
+def cell_coords(width: int, height: int) -> tuple[tuple[int, int], ...]:
+    """
+    :param width: ancho de la cuadrícula.
+    :param height: altura de la cuadrícula.
+    :return: coordenadas (x, y) de cada índice plano.
+    """
+    return tuple((i % width, i // width) for i in range(width * height))
+
+
+class GridGraph(collections.abc.Mapping):
+    """
+    Grafo de vecinos de una cuadrícula (el mapa del piso o las celdas de una habitación) con índices planos.
+
+    En lugar de un diccionario de listas, guarda dos máscaras de bits: las celdas que son nodos del grafo y las celdas
+    a las que se puede pasar. Los vecinos salen de una tabla precalculada (neighbor_table) filtrada por la máscara.
+    Se puede usar como el diccionario de make_neighbors_graph (get, in, iteración, graph[celda]),
+    y las búsquedas (path, distances, flood_fill) trabajan directamente con los índices.
+
+    :param width: ancho de la cuadrícula.
+    :param height: altura de la cuadrícula.
+    :param passable: máscara de bits de las celdas a las que se puede pasar (bit y * width + x).
+    :param nodes: máscara de bits de las celdas que tienen vecinos en el grafo (por defecto, las transitables).
+    :param use_diagonals: utilizar movimientos diagonales.
+    """
+    def __init__(self, width: int, height: int, passable: int, nodes: int | None = None, use_diagonals: bool = False):
+        self.width = width
+        self.height = height
+        self.passable = passable
+        self.nodes = passable if nodes is None else nodes
+        self.use_diagonals = use_diagonals
+        self.table = neighbor_table(width, height, use_diagonals)
+        self.coords = cell_coords(width, height)
+        self.version = next(_graph_versions)  # Clave de las cachés de caminos (PathCache)
+
+    @classmethod
+    def from_rooms(cls, rooms: list[list[RoomsTypes | str]], ignore_secret: bool = False,
+                   use_diagonals: bool = False) -> 'GridGraph':
+        """
+        Construir el grafo con las mismas reglas que make_neighbors_graph.
+
+        :param rooms: matriz bidimensional de valores de tipos de habitaciones.
+        :param ignore_secret: no pasar por la habitación secreta, la tesorería ni la tienda.
+        :param use_diagonals: utilizar movimientos diagonales.
+        :return: grafo de la cuadrícula.
+        """
+        ignored = ((RoomsTypes.EMPTY, RoomsTypes.SECRET, RoomsTypes.TREASURE, RoomsTypes.SHOP) if ignore_secret
+                   else (RoomsTypes.EMPTY,))
+        nodes = passable = 0
+        bit = 1
+        for row in rooms:
+            for room in row:
+                if room != RoomsTypes.EMPTY:
+                    nodes |= bit
+                    if room not in ignored:
+                        passable |= bit
+                bit <<= 1
+        return cls(len(rooms[0]), len(rooms), passable, nodes, use_diagonals)
+
+    @classmethod
+    def from_blocked(cls, width: int, height: int, blocked: Iterable[tuple[int, int]],
+                     use_diagonals: bool = False) -> 'GridGraph':
+        """
+        Grafo de una cuadrícula en la que se puede pasar por todas las celdas salvo las bloqueadas.
+
+        :param width: ancho de la cuadrícula.
+        :param height: altura de la cuadrícula.
+        :param blocked: celdas por las que no se puede pasar.
+        :param use_diagonals: utilizar movimientos diagonales.
+        :return: grafo de la cuadrícula.
+        """
+        mask = (1 << width * height) - 1
+        for x, y in blocked:
+            mask &= ~(1 << y * width + x)
+        return cls(width, height, mask, use_diagonals=use_diagonals)
+
+    def with_blocked(self, blocked: Iterable[tuple[int, int]]) -> 'GridGraph':
+        """
+        :param blocked: celdas por las que no se puede pasar.
+        :return: grafo nuevo del mismo tamaño con esas celdas bloqueadas (este no se modifica).
+        """
+        return GridGraph.from_blocked(self.width, self.height, blocked, self.use_diagonals)
+
+    def index(self, xy: tuple[int, int]) -> int | None:
+        """
+        :param xy: coordenadas de la celda.
+        :return: índice plano de la celda (None si está fuera de la cuadrícula).
+        """
+        if xy is None:
+            return None
+        x, y = xy
+        if not valid_coords(x, y, self.width, self.height):
+            return None
+        return y * self.width + x
+
+    def neighbors(self, i: int) -> list[int]:
+        """
+        :param i: índice de un nodo.
+        :return: índices de los vecinos a los que se puede pasar.
+        """
+        passable = self.passable
+        return [j for j in self.table[i] if passable >> j & 1]
+
+    def __getitem__(self, xy: tuple[int, int]) -> list[tuple[int, int]]:
+        i = self.index(xy)
+        if i is None or not self.nodes >> i & 1:
+            raise KeyError(xy)
+        coords = self.coords
+        return [coords[j] for j in self.neighbors(i)]
+
+    def __contains__(self, xy) -> bool:
+        i = self.index(xy)
+        return i is not None and bool(self.nodes >> i & 1)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        nodes = self.nodes
+        return (xy for i, xy in enumerate(self.coords) if nodes >> i & 1)
+
+    def __len__(self) -> int:
+        return bin(self.nodes).count('1')
+
+    def distances(self, xy_start: tuple[int, int]) -> list[int]:
+        """
+        Búsqueda en anchura desde una celda.
+
+        :param xy_start: celda de inicio.
+        :return: distancia de cada índice plano a la celda de inicio (-1 si no se llega).
+        """
+        distances = [-1] * (self.width * self.height)
+        start = self.index(xy_start)
+        if start is None:
+            return distances
+        distances[start] = 0
+        queue = collections.deque([start])
+        nodes, passable, table = self.nodes, self.passable, self.table
+        while queue:
+            i = queue.popleft()
+            if not nodes >> i & 1:
+                continue
+            for j in table[i]:
+                if distances[j] < 0 and passable >> j & 1:
+                    distances[j] = distances[i] + 1
+                    queue.append(j)
+        return distances
+
+    def flood_fill(self, xy_start: tuple[int, int]) -> int:
+        """
+        :param xy_start: celda de inicio.
+        :return: máscara de bits de las celdas alcanzables desde la celda de inicio (incluida).
+        """
+        start = self.index(xy_start)
+        if start is None:
+            return 0
+        reached = 1 << start
+        stack = [start]
+        nodes, passable, table = self.nodes, self.passable, self.table
+        while stack:
+            i = stack.pop()
+            if not nodes >> i & 1:
+                continue
+            for j in table[i]:
+                bit = 1 << j
+                if not reached & bit and passable & bit:
+                    reached |= bit
+                    stack.append(j)
+        return reached
+
+    def path(self, xy_start: tuple[int, int], xy_end: tuple[int, int]) -> bool | list[tuple[int, int]]:
+        """
+        Camino más corto entre dos celdas (igual que make_path_to_cell).
+
+        :param xy_start: celda de inicio.
+        :param xy_end: celda de destino.
+        :return: lista de celdas del camino o False.
+        """
+        if xy_start == xy_end:
+            return [xy_start]
+        start, end = self.index(xy_start), self.index(xy_end)
+        if start is None or end is None:
+            return False
+        parents = [-1] * (self.width * self.height)
+        parents[start] = start
+        queue = collections.deque([start])
+        nodes, passable, table = self.nodes, self.passable, self.table
+        while queue:
+            i = queue.popleft()
+            if i == end:
+                break
+            if not nodes >> i & 1:
+                continue
+            for j in table[i]:
+                if parents[j] < 0 and passable >> j & 1:
+                    parents[j] = i
+                    queue.append(j)
+        if parents[end] < 0:
+            return False
+
+        way = [end]
+        while way[-1] != start:
+            way.append(parents[way[-1]])
+        coords = self.coords
+        return [coords[i] for i in reversed(way)]
+
+    def astar(self, xy_start: tuple[int, int], xy_end: tuple[int, int],
+              use_diagonals: bool | None = None) -> bool | list[tuple[int, int]]:
+        """
+        Camino más corto entre dos celdas con A*.
+        Sin diagonales, con la distancia Manhattan como heurística (los caminos miden lo mismo que los de path).
+        Con diagonales, cada paso en diagonal cuesta sqrt(2), se usa la distancia octil y no se cortan esquinas:
+        solo se pasa en diagonal si las dos celdas ortogonales del paso también son transitables.
+
+        :param xy_start: celda de inicio.
+        :param xy_end: celda de destino.
+        :param use_diagonals: permitir pasos en diagonal (por defecto, los del grafo).
+        :return: lista de celdas del camino o False.
+        """
+        if xy_start == xy_end:
+            return [xy_start]
+        start, end = self.index(xy_start), self.index(xy_end)
+        if start is None or end is None or not self.passable >> end & 1:
+            return False
+        if use_diagonals is None:
+            use_diagonals = self.use_diagonals
+
+        width, nodes, passable, coords = self.width, self.nodes, self.passable, self.coords
+        table = neighbor_table(self.width, self.height, use_diagonals)
+        end_x, end_y = xy_end
+        diagonal_step = math.sqrt(2)
+        if use_diagonals:
+            # Distancia octil
+            heuristic = [max(dx, dy) + (diagonal_step - 1) * min(dx, dy)
+                         for dx, dy in ((abs(x - end_x), abs(y - end_y)) for x, y in coords)]
+        else:
+            # Distancia Manhattan
+            heuristic = [abs(x - end_x) + abs(y - end_y) for x, y in coords]
+
+        costs = [math.inf] * len(coords)
+        parents = [-1] * len(coords)
+        costs[start] = 0
+        parents[start] = start
+        closed = 0
+        # (coste estimado, heurística, índice): a igual coste se expande primero la celda más cercana al destino
+        heap = [(heuristic[start], heuristic[start], start)]
+        while heap:
+            _, _, i = heapq.heappop(heap)
+            if i == end:
+                break
+            if closed >> i & 1 or not nodes >> i & 1:
+                continue
+            closed |= 1 << i
+            x, y = coords[i]
+            for j in table[i]:
+                if not passable >> j & 1:
+                    continue
+                step = 1
+                jx, jy = coords[j]
+                if jx != x and jy != y:
+                    if not (passable >> y * width + jx & 1 and passable >> jy * width + x & 1):
+                        continue
+                    step = diagonal_step
+                cost = costs[i] + step
+                if cost < costs[j]:
+                    costs[j] = cost
+                    parents[j] = i
+                    heapq.heappush(heap, (cost + heuristic[j], heuristic[j], j))
+        if parents[end] < 0:
+            return False
+
+        way = [end]
+        while way[-1] != start:
+            way.append(parents[way[-1]])
+        return [coords[i] for i in reversed(way)]
+
+
+class PathCache:
+    """
+    Caché LRU de caminos de A* (GridGraph.astar) por (inicio, destino, versión del grafo, diagonales).
+
+    Al calcular un camino también se guardan sus sufijos: cuando el enemigo avanza una celda,
+    el camino desde la siguiente celda hasta el mismo destino ya está en la caché.
+    Los caminos devueltos se comparten entre llamadas y no se deben modificar.
+
+    :param maxsize: número máximo de caminos guardados.
+    """
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.paths: collections.OrderedDict[tuple, bool | list[tuple[int, int]]] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, graph: GridGraph, xy_start: tuple[int, int], xy_end: tuple[int, int],
+             use_diagonals: bool | None = None) -> bool | list[tuple[int, int]]:
+        """
+        :param graph: grafo de la cuadrícula.
+        :param xy_start: celda de inicio.
+        :param xy_end: celda de destino.
+        :param use_diagonals: permitir pasos en diagonal (por defecto, los del grafo).
+        :return: lista de celdas del camino o False.
+        """
+        if use_diagonals is None:
+            use_diagonals = graph.use_diagonals
+        key = (xy_start, xy_end, graph.version, use_diagonals)
+        if key in self.paths:
+            self.hits += 1
+            self.paths.move_to_end(key)
+            return self.paths[key]
+
+        self.misses += 1
+        way = graph.astar(xy_start, xy_end, use_diagonals)
+        if way:
+            # Un tramo final de un camino más corto también es un camino más corto hasta el mismo destino
+            for k in range(len(way) - 1, 0, -1):
+                self.paths[(way[k], xy_end, graph.version, use_diagonals)] = way[k:]
+        self.paths[key] = way
+        while len(self.paths) > self.maxsize:
+            self.paths.popitem(last=False)
+        return way
+
+    def clear(self):
+        self.paths.clear()
+
+
+path_cache = PathCache()  # Caché compartida por los enemigos
+
+
+def find_path(graph: GridGraph | dict[tuple[int, int], list[tuple[int, int]]],
+              xy_start: tuple[int, int], xy_end: tuple[int, int],
+              use_diagonals: bool | None = None) -> bool | list[tuple[int, int]]:
+    """
+    Camino entre dos celdas: A* con la caché compartida (path_cache) para GridGraph
+    y make_path_to_cell para los grafos en forma de diccionario.
+
+    :param graph: grafo de la habitación.
+    :param xy_start: celda de inicio.
+    :param xy_end: celda de destino.
+    :param use_diagonals: permitir pasos en diagonal (solo GridGraph; por defecto, los del grafo).
+    :return: lista de celdas del camino o False.
+    """
+    if isinstance(graph, GridGraph):
+        return path_cache.path(graph, xy_start, xy_end, use_diagonals)
+    return make_path_to_cell(graph, xy_start, xy_end)
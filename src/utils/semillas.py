@@ -0,0 +1,42 @@
+"""
+Semillas reproducibles para la generación procedimental.
+
+A partir de una semilla de partida se derivan semillas hijas estables (por piso, por habitación, etc.),
+de modo que un par (semilla, piso) genera siempre el mismo resultado en cualquier proceso o máquina.
+"""
+
+import hashlib
+import random
+
+import numpy as np
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """
+    Derivar una semilla hija a partir de la semilla de partida y unas claves.
+
+    :param seed: semilla de partida.
+    :param keys: claves que identifican el flujo (por ejemplo, tipo de piso y coordenadas de la habitación).
+    :return: semilla de 64 bits (no depende de hash() ni del proceso).
+    """
+    data = repr((seed, *(str(key) for key in keys))).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def new_seed() -> int:
+    """
+    Semilla de partida aleatoria.
+
+    :return: semilla de 64 bits.
+    """
+    return random.SystemRandom().getrandbits(64)
+
+
+def numpy_rng(rng: random.Random) -> np.random.Generator:
+    """
+    Generador de NumPy que continúa el flujo de un generador de random.
+
+    :param rng: generador de random.
+    :return: generador de NumPy.
+    """
+    return np.random.default_rng(rng.getrandbits(64))
@@ -0,0 +1,109 @@
+"""
+Tabla de siguiente paso entre todas las parejas de celdas de una habitación.
+
+Una habitación tiene 13x7 = 91 celdas, así que para cada disposición de obstáculos cabe en 91x91 bytes
+la siguiente celda del camino más corto desde cualquier celda hacia cualquier otra.
+Las tablas se guardan en una caché por la máscara de bits de los obstáculos (GridGraph.passable):
+solo cambian cuando cambian los obstáculos, y las comparten todos los enemigos (y todas las habitaciones
+con la misma disposición), sea cual sea su objetivo.
+Cada fila (un destino) se calcula con una búsqueda en anchura la primera vez que se consulta.
+"""
+
+import collections
+import functools
+
+from src.utils.graph import GridGraph
+
+NO_CELL = 255  # Sin siguiente paso / sin distancia
+
+
+class NextHopTable:
+    """
+    Siguiente paso y distancia hacia cada destino en un grafo de menos de 255 celdas.
+    El byte target * cells + i es el índice de la siguiente celda desde i hacia target (NO_CELL si no hay camino).
+
+    :param graph: grafo de la cuadrícula.
+    """
+    def __init__(self, graph: GridGraph):
+        self.cells = graph.width * graph.height
+        if self.cells >= NO_CELL:
+            raise ValueError(f'La tabla de siguiente paso admite menos de {NO_CELL} celdas, no {self.cells}')
+        self.graph = graph
+        self.hops = bytearray([NO_CELL]) * (self.cells * self.cells)
+        self.distances = bytearray([NO_CELL]) * (self.cells * self.cells)
+        self.rows = 0  # Máscara de bits de los destinos ya calculados
+
+    def row(self, target: int) -> int:
+        """
+        Calcular (si hace falta) la fila de un destino.
+
+        :param target: índice plano del destino.
+        :return: desplazamiento de la fila en hops y distances.
+        """
+        offset = target * self.cells
+        if self.rows >> target & 1:
+            return offset
+        self.rows |= 1 << target
+
+        graph = self.graph
+        hops, distances = self.hops, self.distances
+        nodes, passable, table = graph.nodes, graph.passable, graph.table
+        distances[offset + target] = 0
+        queue = collections.deque([target])
+        while queue:
+            i = queue.popleft()
+            # Solo se llega a i desde sus vecinos si se puede pasar por i
+            if not passable >> i & 1:
+                continue
+            distance = distances[offset + i] + 1
+            for j in table[i]:
+                if distances[offset + j] == NO_CELL and nodes >> j & 1:
+                    distances[offset + j] = distance
+                    hops[offset + j] = i
+                    queue.append(j)
+        return offset
+
+    def fill(self) -> 'NextHopTable':
+        """
+        Calcular todas las filas.
+        """
+        for target in range(self.cells):
+            self.row(target)
+        return self
+
+    def next_cell(self, xy: tuple[int, int], xy_target: tuple[int, int] | None) -> tuple[int, int] | None:
+        """
+        :param xy: celda actual.
+        :param xy_target: celda de destino.
+        :return: siguiente celda del camino más corto (None si ya está en el destino o no hay camino).
+        """
+        i, target = self.graph.index(xy), self.graph.index(xy_target)
+        if i is None or target is None:
+            return None
+        hop = self.hops[self.row(target) + i]
+        return self.graph.coords[hop] if hop != NO_CELL else None
+
+    def distance(self, xy: tuple[int, int], xy_target: tuple[int, int] | None) -> int | None:
+        """
+        :param xy: celda.
+        :param xy_target: celda de destino.
+        :return: pasos hasta el destino (None si no hay camino).
+        """
+        i, target = self.graph.index(xy), self.graph.index(xy_target)
+        if i is None or target is None:
+            return None
+        distance = self.distances[self.row(target) + i]
+        return distance if distance != NO_CELL else None
+
+
+@functools.lru_cache(maxsize=64)
+def _next_hop_table(width: int, height: int, nodes: int, passable: int, use_diagonals: bool) -> NextHopTable:
+    return NextHopTable(GridGraph(width, height, passable, nodes, use_diagonals))
+
+
+def next_hop_table(graph: GridGraph) -> NextHopTable:
+    """
+    :param graph: grafo de la cuadrícula.
+    :return: tabla compartida por todos los grafos con la misma disposición de obstáculos.
+    """
+    return _next_hop_table(graph.width, graph.height, graph.nodes, graph.passable, graph.use_diagonals)
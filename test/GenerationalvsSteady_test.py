@@ -4,6 +4,7 @@ import unittest
 import time
 import csv
 import statistics
+import tempfile
 
 # Obtener la ruta del directorio raíz
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -12,6 +13,10 @@ root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(root_dir)
 
 import src.modules.levels.algoritmoGenetico as ag
+from src.modules.levels.telemetria import JsonLinesSink
+
+# Carpeta del registro por generación (varios MB): por defecto, la carpeta temporal
+GENERATIONS_DIR = os.environ.get('GENERATIONS_DIR', tempfile.gettempdir())
 
 class TestAlgoritmoGenetico(unittest.TestCase):
     """def test_multiple_runs_generational(self):
@@ -23,26 +28,30 @@ class TestAlgoritmoGenetico(unittest.TestCase):
         population_sizes = [10, 20, 30]
         generations_list = [50, 100]
 
-        with open('generational_results.csv', mode='w', newline='') as file:
+        with open('generational_results.csv', mode='w', newline='') as file, JsonLinesSink(os.path.join(GENERATIONS_DIR, 'generational_generations.jsonl')) as generations_log:
             writer = csv.writer(file)
-            writer.writerow(['Algorithm', 'Population Size', 'Generations', 'Average Execution Time (s)', 'Execution Time Std Dev (s)', 'Average Fitness Score', 'Fitness Score Std Dev', 'Connectivity Percentage', 'Connectivity Std Dev'])
+            writer.writerow(['Algorithm', 'Population Size', 'Generations', 'Average Execution Time (s)', 'Execution Time Std Dev (s)', 'Average Fitness Score', 'Fitness Score Std Dev', 'Connectivity Percentage', 'Connectivity Std Dev', 'Average Cache Hit Rate'])
 
             for population_size in population_sizes:
                 for generations in generations_list:
                     execution_times = []
                     fitness_scores = []
                     connected_maps = []
+                    cache_hit_rates = []
 
-                    for _ in range(num_maps):
+                    for run in range(num_maps):
+                        cache = ag.FitnessCache()
+                        generations_log.set_context(population_size=population_size, generations=generations, run=run)
                         start_time = time.time()
-                        best_individual = ag.generational_genetic_algorithm(population_size, map_width, map_height, room_numbers, generations)
+                        best_individual = ag.generational_genetic_algorithm(population_size, map_width, map_height, room_numbers, generations, cache=cache, observers=[generations_log])
                         end_time = time.time()
 
                         execution_time = end_time - start_time
                         execution_times.append(execution_time)
 
-                        best_fitness = ag.fitness(best_individual, room_numbers)
+                        best_fitness = ag.cached_fitness(best_individual, room_numbers, cache)
                         fitness_scores.append(best_fitness)
+                        cache_hit_rates.append(cache.hit_rate)
 
                         # Comprobación de la conectividad del mapa resultante
                         is_connected = ag.all_rooms_have_path_to_start(best_individual)
@@ -57,7 +66,9 @@ class TestAlgoritmoGenetico(unittest.TestCase):
                     connectivity_percentage = (sum(connected_maps) / num_maps) * 100
                     connectivity_std_dev = statistics.stdev(connected_maps) * 100  # Escalar a porcentaje
 
-                    writer.writerow(['Generational', population_size, generations, average_execution_time, execution_time_std_dev, average_fitness_score, fitness_score_std_dev, connectivity_percentage, connectivity_std_dev])
+                    average_cache_hit_rate = sum(cache_hit_rates) / num_maps
+
+                    writer.writerow(['Generational', population_size, generations, average_execution_time, execution_time_std_dev, average_fitness_score, fitness_score_std_dev, connectivity_percentage, connectivity_std_dev, average_cache_hit_rate])
 """
     def test_multiple_runs_steady_state(self):
         num_maps = 30
@@ -68,26 +79,30 @@ class TestAlgoritmoGenetico(unittest.TestCase):
         population_sizes = [10, 20, 30]
         generations_list = [50, 100]
 
-        with open('steady_state_results.csv', mode='w', newline='') as file:
+        with open('steady_state_results.csv', mode='w', newline='') as file, JsonLinesSink(os.path.join(GENERATIONS_DIR, 'steady_state_generations.jsonl')) as generations_log:
             writer = csv.writer(file)
-            writer.writerow(['Algorithm', 'Population Size', 'Generations', 'Average Execution Time (s)', 'Execution Time Std Dev (s)', 'Average Fitness Score', 'Fitness Score Std Dev', 'Connectivity Percentage', 'Connectivity Std Dev'])
+            writer.writerow(['Algorithm', 'Population Size', 'Generations', 'Average Execution Time (s)', 'Execution Time Std Dev (s)', 'Average Fitness Score', 'Fitness Score Std Dev', 'Connectivity Percentage', 'Connectivity Std Dev', 'Average Cache Hit Rate'])
 
             for population_size in population_sizes:
                 for generations in generations_list:
                     execution_times = []
                     fitness_scores = []
                     connected_maps = []
+                    cache_hit_rates = []
 
-                    for _ in range(num_maps):
+                    for run in range(num_maps):
+                        cache = ag.FitnessCache()
+                        generations_log.set_context(population_size=population_size, generations=generations, run=run)
                         start_time = time.time()
-                        best_individual = ag.steady_state_genetic_algorithm(population_size, map_width, map_height, room_numbers, generations)
+                        best_individual = ag.steady_state_genetic_algorithm(population_size, map_width, map_height, room_numbers, generations, cache=cache, observers=[generations_log])
                         end_time = time.time()
 
                         execution_time = end_time - start_time
                         execution_times.append(execution_time)
 
-                        best_fitness = ag.fitness(best_individual, room_numbers)
+                        best_fitness = ag.cached_fitness(best_individual, room_numbers, cache)
                         fitness_scores.append(best_fitness)
+                        cache_hit_rates.append(cache.hit_rate)
 
                         # Comprobación de la conectividad del mapa resultante
                         is_connected = ag.all_rooms_have_path_to_start(best_individual)
@@ -102,7 +117,9 @@ class TestAlgoritmoGenetico(unittest.TestCase):
                     connectivity_percentage = (sum(connected_maps) / num_maps) * 100
                     connectivity_std_dev = statistics.stdev(connected_maps) * 100  # Escalar a porcentaje
 
-                    writer.writerow(['Steady State', population_size, generations, average_execution_time, execution_time_std_dev, average_fitness_score, fitness_score_std_dev, connectivity_percentage, connectivity_std_dev])
+                    average_cache_hit_rate = sum(cache_hit_rates) / num_maps
+
+                    writer.writerow(['Steady State', population_size, generations, average_execution_time, execution_time_std_dev, average_fitness_score, fitness_score_std_dev, connectivity_percentage, connectivity_std_dev, average_cache_hit_rate])
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,10 @@
 import sys
 import os
 import unittest
+import io
+import csv
+import json
+import random
 from unittest.mock import patch
 
 # Obtener la ruta del directorio raíz
@@ -67,7 +71,119 @@ class TestAlgoritmoGenetico(unittest.TestCase):
         
         self.assertEqual(parent1, population[0], "El primer padre seleccionado no es el esperado.")
         self.assertEqual(parent2, population[1], "El segundo padre seleccionado no es el esperado.")
+
+    def test_fitness_cache(self):
+        rooms = [[consts.RoomsTypes.DEFAULT for _ in range(5)] for _ in range(5)]
+        rooms[2][2] = consts.RoomsTypes.SPAWN
+        copy_rooms = [row[:] for row in rooms]
+        cache = ag.FitnessCache(maxsize=1)
+
+        score = ag.cached_fitness(rooms, (5, 10), cache)
+        self.assertEqual(score, ag.fitness(rooms, (5, 10)), "La caché no devuelve la aptitud original.")
+        self.assertEqual(ag.cached_fitness(copy_rooms, (5, 10), cache), score, "Un mapa igual debe compartir la clave.")
+        self.assertEqual((cache.hits, cache.misses), (1, 1), "Los contadores de la caché no son los esperados.")
+
+        ag.cached_fitness(rooms, (6, 10), cache)
+        self.assertEqual(len(cache), 1, "La caché no ha descartado la entrada menos usada.")
+        self.assertEqual(cache.stats()['hit_rate'], 1 / 3, "La tasa de aciertos no es la esperada.")
+
+    def test_fitness_evaluator_backends(self):
+        population = ag.generate_initial_population(8, 10, 6, 15)
+        expected = [ag.fitness(individual, (15, 20)) for individual in population]
+
+        for backend in ('serial', 'thread', 'process'):
+            with ag.FitnessEvaluator(backend, workers=2, chunksize=3) as evaluator:
+                scores = evaluator.evaluate(population, (15, 20), ag.fitness, ag.FitnessCache())
+            self.assertEqual(scores, expected, f"El ejecutor {backend} no da las mismas puntuaciones que en serie.")
         
+    def test_stopping_criteria(self):
+        stopping = ag.StoppingCriteria(max_fitness=None, stagnation=3)
+
+        best_map = ag.steady_state_genetic_algorithm(5, 10, 6, (12, 17), 200, stopping=stopping)
+
+        self.assertIsNotNone(best_map, "El algoritmo debe devolver un mapa.")
+        self.assertEqual(stopping.reason, 'stagnation', "La ejecución debería detenerse por estancamiento.")
+        self.assertLess(stopping.stopped_at, 200, "La ejecución debería detenerse antes de la última generación.")
+
+        stopping = ag.StoppingCriteria(max_fitness=0)
+        ag.generational_genetic_algorithm(5, 10, 6, (12, 17), 10, stopping=stopping)
+        self.assertEqual((stopping.stopped_at, stopping.reason), (0, 'max_fitness'),
+                         "La ejecución debería detenerse antes de la primera generación.")
+
+    def test_time_budget(self):
+        from src.modules.levels.LevelGenerator import generate_level
+        from src.modules.levels.reservaMapas import is_valid_layout
+
+        for algorithm, vectorized in ((0, False), (1, False), (0, True), (2, False)):
+            stopping = ag.StoppingCriteria(max_fitness=None)
+            rooms = generate_level(10, 6, (12, 17), algorithm, vectorized=vectorized, stopping=stopping,
+                                   rng=random.Random(0), time_budget_ms=20, workers=2)
+
+            self.assertTrue(is_valid_layout(rooms), "Con límite de tiempo se debe devolver un mapa válido.")
+            self.assertEqual(stopping.reason, 'time_budget', "La ejecución debería detenerse al agotar el tiempo.")
+            self.assertGreaterEqual(stopping.elapsed_ms(), 20)
+            self.assertIsNone(stopping.time_budget_ms, "No se deben cambiar los criterios del llamador.")
+
+    def test_generate_level_async(self):
+        import asyncio
+        from src.modules.levels.LevelGenerator import generate_level, generate_level_async
+
+        async def generate_while_animating():
+            frames = 0
+            task = asyncio.create_task(generate_level_async(10, 6, (12, 17), rng=random.Random(3)))
+            while not task.done():
+                frames += 1
+                await asyncio.sleep(0)
+            return await task, frames
+
+        rooms, frames = asyncio.run(generate_while_animating())
+        self.assertEqual(rooms, generate_level(10, 6, (12, 17), rng=random.Random(3)),
+                         "La versión asíncrona debe generar el mismo mapa.")
+        self.assertGreater(frames, 0, "El bucle de eventos debe seguir libre mientras se genera el mapa.")
+
+    def test_rng_streams(self):
+        from src.utils.semillas import derive_seed
+
+        seed = derive_seed(1234, consts.FloorsTypes.BASEMENT.value)
+        rooms = ag.steady_state_genetic_algorithm(5, 10, 6, (12, 17), 5, rng=random.Random(seed))
+        same_rooms = ag.steady_state_genetic_algorithm(5, 10, 6, (12, 17), 5, rng=random.Random(seed))
+
+        self.assertEqual(rooms, same_rooms, "Con la misma semilla se debe generar el mismo mapa.")
+        self.assertEqual(seed, derive_seed(1234, consts.FloorsTypes.BASEMENT.value), "La semilla derivada debe ser estable.")
+        self.assertNotEqual(seed, derive_seed(1234, consts.FloorsTypes.CAVES.value), "Cada piso debe tener su semilla.")
+        
+    def test_telemetry(self):
+        from src.modules.levels.telemetria import CsvSink, JsonLinesSink
+
+        events = []
+        csv_file, json_file = io.StringIO(), io.StringIO()
+        with CsvSink(csv_file, context={'run': 1}) as csv_sink, JsonLinesSink(json_file) as json_sink:
+            ag.generational_genetic_algorithm(6, 10, 6, (12, 17), 3, rng=random.Random(0),
+                                              observers=[events.append, csv_sink, json_sink])
+
+        self.assertEqual([event.generation for event in events], [0, 1, 2, 3], "Debe haber un evento por generación.")
+        self.assertEqual(events[0].evaluations, 6, "La población inicial se evalúa entera.")
+        self.assertTrue(all(event.worst <= event.mean <= event.best for event in events))
+        self.assertEqual(len(csv_file.getvalue().splitlines()), 5, "Cabecera y una fila por generación.")
+        self.assertTrue(csv_file.getvalue().startswith('run,algorithm,generation'))
+        self.assertEqual(json.loads(json_file.getvalue().splitlines()[-1])['generation'], 3)
+
+    def test_csv_sink_mixed_context(self):
+        from src.modules.levels.telemetria import CsvSink
+
+        csv_file = io.StringIO()
+        with CsvSink(csv_file, context={'run': 1}, fields=['population_size']) as sink:
+            ag.generational_genetic_algorithm(6, 10, 6, (12, 17), 1, rng=random.Random(0), observers=[sink])
+            sink.set_context(population_size=6, extra='no declarado')
+            ag.steady_state_genetic_algorithm(6, 10, 6, (12, 17), 1, rng=random.Random(0), observers=[sink])
+
+        rows = list(csv.DictReader(io.StringIO(csv_file.getvalue())))
+        self.assertEqual(len(rows), 4, "Una fila por generación de las dos ejecuciones.")
+        self.assertEqual([row['algorithm'] for row in rows], ['generational'] * 2 + ['steady_state'] * 2)
+        self.assertEqual([row['population_size'] for row in rows], ['', '', '6', '6'],
+                         "Los campos declarados se rellenan cuando llegan.")
+        self.assertNotIn('extra', rows[0], "Los campos sin declarar no se escriben.")
+
 if __name__ == '__main__':
     unittest.main()
     
@@ -27,6 +27,11 @@ class TestCellularAutomata(unittest.TestCase):
         # Verificar que las dimensiones de la habitación son correctas
         self.assertEqual(room.shape, (consts.ROOM_HEIGHT, consts.ROOM_WIDTH))
 
+    def test_rng_stream(self):
+        room = ac.cellular_automatan(np.random.default_rng(7))
+        same_room = ac.cellular_automatan(np.random.default_rng(7))
+        self.assertTrue(np.array_equal(room, same_room), "Con la misma semilla se debe generar la misma habitación.")
+
     def test_count_neighbors(self):
         room = np.zeros((consts.ROOM_HEIGHT, consts.ROOM_WIDTH), dtype=int)
         room[0, 0] = ac.ROCK
@@ -83,5 +88,43 @@ class TestCellularAutomata(unittest.TestCase):
         # Verificar que el tamaño de la habitación evolucionada es correcto
         self.assertEqual(evolved_room.shape, (consts.ROOM_HEIGHT, consts.ROOM_WIDTH))
 
+    def test_neighbor_counts(self):
+        rng = np.random.default_rng(0)
+        room = rng.integers(0, ac.NUM_TYPES, (consts.ROOM_HEIGHT, consts.ROOM_WIDTH))
+        counts = ac.neighbor_counts(room)
+        for y in range(consts.ROOM_HEIGHT):
+            for x in range(consts.ROOM_WIDTH):
+                neighbors = ac.count_neighbors(room, y, x)
+                self.assertEqual([counts[entity, y, x] for entity in range(ac.NUM_TYPES)],
+                                 [neighbors[entity] for entity in range(ac.NUM_TYPES)],
+                                 "Los vecinos deben ser los mismos que los de count_neighbors.")
+
+    def test_step_vectorized(self):
+        class ConstantRng:
+            # Todas las reglas aleatorias se cumplen (1.0) o ninguna (0.0)
+            def __init__(self, value):
+                self.value = value
+
+            def random(self, size=None):
+                return self.value if size is None else np.full(size, self.value)
+
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            room = rng.integers(0, ac.NUM_TYPES, (consts.ROOM_HEIGHT, consts.ROOM_WIDTH))
+            for value in (0.0, 1.0):
+                self.assertTrue(np.array_equal(ac.step_vectorized(room, ConstantRng(value)),
+                                               ac.step_loop(room, ConstantRng(value))),
+                                "Las reglas vectorizadas deben dar el mismo resultado que celda a celda.")
+
+    def test_vectorized_distribution(self):
+        rooms = 150
+        totals = {}
+        for vectorized in (False, True):
+            rng = np.random.default_rng(11)
+            totals[vectorized] = sum(np.bincount(ac.cellular_automatan(rng, vectorized).ravel(), minlength=ac.NUM_TYPES)
+                                     for _ in range(rooms)) / rooms
+        self.assertTrue(np.allclose(totals[True], totals[False], atol=2.0),
+                        "El número medio de entidades de cada tipo debe ser el mismo.")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
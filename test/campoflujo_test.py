@@ -0,0 +1,54 @@
+import sys
+import os
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.tipos import RoomsTypes
+from src.utils.campoFlujo import FlowField
+from src.utils.graph import make_neighbors_graph, make_path_to_cell
+
+class TestCampoFlujo(unittest.TestCase):
+
+    def setUp(self):
+        # Habitación de 13x7 con una pared que obliga a rodearla
+        cells = [[RoomsTypes.DEFAULT] * 13 for _ in range(7)]
+        for y in range(6):
+            cells[y][6] = RoomsTypes.EMPTY
+        cells[3][9] = RoomsTypes.EMPTY
+        self.graph = make_neighbors_graph(cells)
+
+    def test_matches_bfs(self):
+        field = FlowField()
+        target = (10, 1)
+        field.update(self.graph, target)
+        for start in list(self.graph):
+            path = make_path_to_cell(self.graph, start, target)
+            self.assertEqual(field.distance(start), len(path) - 1, "La distancia debe ser la del camino más corto.")
+
+            # Seguir el campo debe llegar al objetivo en el mismo número de pasos
+            cell, steps = start, 0
+            while (next_cell := field.next_cell(cell)) is not None:
+                self.assertIn(next_cell, self.graph[cell], "El siguiente paso debe ser una celda vecina.")
+                cell, steps = next_cell, steps + 1
+            self.assertEqual((cell, steps), (target, len(path) - 1))
+
+        self.assertIsNone(field.next_cell((6, 0)), "Desde un obstáculo no hay camino.")
+
+    def test_recomputed_only_on_change(self):
+        field = FlowField()
+        self.assertTrue(field.update(self.graph, (0, 0)))
+        self.assertFalse(field.update(self.graph, (0, 0)), "Con el mismo grafo y objetivo no se recalcula.")
+        self.assertTrue(field.update(self.graph, (1, 0)), "Si el personaje cambia de celda se recalcula.")
+        self.assertTrue(field.update(dict(self.graph), (1, 0)), "Si cambia el grafo se recalcula.")
+        self.assertEqual(field.updates, 3)
+
+        field.update(self.graph, None)
+        self.assertIsNone(field.next_cell((0, 0)), "Sin objetivo no hay camino.")
+
+if __name__ == '__main__':
+    unittest.main()
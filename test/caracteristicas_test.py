@@ -0,0 +1,78 @@
+import sys
+import os
+import random
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.consts import RoomsTypes
+import src.modules.levels.algoritmoGenetico as ag
+import src.utils.comprobaciones as comprobaciones
+from src.utils.caracteristicas import LayoutAnalysis, extract_features
+from src.utils.graph import GridGraph
+
+class TestCaracteristicas(unittest.TestCase):
+
+    def setUp(self):
+        # Pasillo desde la sala de inicio hasta el jefe que pasa por la tienda
+        self.rooms = [[RoomsTypes.EMPTY] * 5 for _ in range(5)]
+        self.rooms[2][2] = RoomsTypes.SPAWN
+        self.rooms[2][3] = RoomsTypes.SHOP
+        self.rooms[2][4] = RoomsTypes.BOSS
+        self.rooms[1][2] = RoomsTypes.SECRET
+
+    def test_extract_features(self):
+        features = extract_features(self.rooms)
+
+        self.assertEqual(features.rooms, 4, "Hay cuatro habitaciones.")
+        self.assertEqual(features.count(RoomsTypes.BOSS), 1)
+        self.assertFalse(features.exists(RoomsTypes.TREASURE), "No hay tesorería.")
+        self.assertEqual(features.boss_distance, 2, "El camino hasta el jefe puede pasar por la tienda.")
+        self.assertFalse(features.connected, "El camino de la conectividad no puede pasar por la tienda.")
+        with self.assertRaises(AttributeError, msg="El registro solo tiene los campos de __slots__."):
+            features.other = 1
+
+    def test_matches_comprobaciones(self):
+        rng = random.Random(0)
+        population = ag.generate_initial_population(20, 10, 6, 15, rng)
+        for rooms in population + [ag.mutate(rooms, 1.0, 0.5, rng) for rooms in population]:
+            features = extract_features(rooms)
+            self.assertEqual(features.connected, ag.all_rooms_have_path_to_start(rooms))
+            self.assertEqual(features.boss_distance, comprobaciones.distance_between_start_and_boss(rooms))
+            self.assertEqual(features.rooms, comprobaciones.count_rooms(rooms))
+            for room_type in RoomsTypes:
+                self.assertEqual(features.count(room_type), comprobaciones.get_number_of_roomtype(rooms, room_type))
+
+    def test_layout_analysis(self):
+        # Pasillo en U: el callejón (3, 0) está cerca en línea recta, pero es el más lejano siguiendo el camino
+        rooms = [[RoomsTypes.EMPTY] * 7 for _ in range(5)]
+        for x, y in [(3, 2), (4, 2), (5, 2), (5, 1), (5, 0), (4, 0), (3, 0), (2, 2), (1, 2), (0, 2), (3, 3), (3, 4)]:
+            rooms[y][x] = RoomsTypes.DEFAULT
+        rooms[2][3] = RoomsTypes.SPAWN
+
+        analysis = LayoutAnalysis(rooms)
+        self.assertEqual(analysis.dead_ends, [(3, 0), (0, 2), (3, 4)])
+        self.assertEqual([analysis.distance(cell) for cell in analysis.dead_ends], [6, 3, 2])
+        self.assertEqual(analysis.farthest_dead_end(), (3, 0))
+        self.assertIsNone(analysis.distance((0, 0)))
+        self.assertTrue(analysis.connected)
+
+        self.assertTrue(ag.set_special_rooms(rooms, random.Random(0)))
+        self.assertEqual(rooms[0][3], RoomsTypes.BOSS, "El jefe debe ir al callejón más lejano por el camino.")
+
+    def test_has_path_to_start(self):
+        rng = random.Random(1)
+        for rooms in [ag.mutate(rooms, 1.0, 0.5, rng) for rooms in ag.generate_initial_population(10, 10, 6, 15, rng)]:
+            graph = GridGraph.from_rooms(rooms, ignore_secret=True)
+            for y, row in enumerate(rooms):
+                for x, room in enumerate(row):
+                    self.assertEqual(ag.has_path_to_start((x, y), rooms),
+                                     ag.has_path_to_start((x, y), rooms, graph=graph),
+                                     "El análisis debe dar el mismo resultado que la búsqueda en el grafo.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import sys
+import os
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.consts import RoomsTypes
+from src.utils import conectividad
+
+class TestConectividad(unittest.TestCase):
+
+    def setUp(self):
+        # Pasillo horizontal con la sala de inicio en el centro y una sala aislada
+        self.rooms = [[RoomsTypes.EMPTY] * 5 for _ in range(5)]
+        for x in range(5):
+            self.rooms[2][x] = RoomsTypes.DEFAULT
+        self.rooms[2][2] = RoomsTypes.SPAWN
+        self.rooms[0][0] = RoomsTypes.DEFAULT
+
+    def test_all_rooms_reachable(self):
+        self.assertFalse(conectividad.all_rooms_reachable(self.rooms), "La sala aislada no tiene camino al inicio.")
+        self.rooms[0][0] = RoomsTypes.EMPTY
+        self.assertTrue(conectividad.all_rooms_reachable(self.rooms), "El pasillo está conectado.")
+
+    def test_incremental_checker(self):
+        checker = conectividad.ConnectivityChecker(self.rooms)
+        self.assertEqual(checker.orphans, {(0, 0)}, "Solo la sala aislada debería estar desconectada.")
+
+        checker.set_cell(0, 1, RoomsTypes.DEFAULT)
+        checker.set_cell(0, 0, RoomsTypes.EMPTY)
+        self.assertTrue(checker.is_connected(), "El mapa debería estar conectado tras los cambios.")
+
+        self.assertFalse(checker.try_cell(1, 2, RoomsTypes.SECRET), "Una secreta en el pasillo lo desconecta.")
+        self.assertEqual(self.rooms[2][1], RoomsTypes.DEFAULT, "try_cell no debe modificar el mapa.")
+        self.assertTrue(checker.try_cell(4, 2, RoomsTypes.SECRET), "Una secreta al final del pasillo es válida.")
+
+    def test_articulation_points(self):
+        self.assertEqual(conectividad.articulation_points(self.rooms), {(1, 2), (2, 2), (3, 2)},
+                         "En un pasillo todas las celdas interiores son puntos de articulación.")
+        self.rooms[1][1] = self.rooms[1][2] = self.rooms[1][3] = RoomsTypes.DEFAULT
+        self.assertEqual(conectividad.articulation_points(self.rooms), {(1, 2), (3, 2)}, "Con un ciclo solo quedan los pasillos de los extremos.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import sys
+import os
+import threading
+import time
+import concurrent.futures
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+# Sin ventana ni sonido
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame as pg
+
+class TestGame(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pg.init()
+        pg.display.set_mode((1, 1))
+        # Importación aquí: los sprites cargan sus imágenes al importarse y necesitan la ventana
+        from src.modules.Game import Game
+        cls.game = Game('isaac', pg.display.get_surface(), seed=5)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.game.close()
+
+    def test_background_level(self):
+        game = self.game
+        first_level = game.current_level
+        self.assertIn(game.floors[0], game.level_build_times, "Se debe guardar el tiempo de construcción.")
+        self.assertIn(game.main_hero, first_level.current_room.main_hero_group,
+                      "El personaje se añade a los grupos de las habitaciones en el hilo principal.")
+
+        # Mientras el siguiente piso no está listo, el cambio de piso espera
+        built_level = game.next_level.result()
+        pending = concurrent.futures.Future()
+        threading.Timer(0.2, pending.set_result, (built_level,)).start()
+        game.next_level = pending
+        game.move_to_next_level()
+        self.assertIs(game.current_level, built_level)
+        self.assertGreaterEqual(game.level_wait_times[-1], 0.15, "Se debe esperar al piso pendiente.")
+        self.assertIn(game.main_hero, built_level.current_room.main_hero_group)
+
+        # Con el piso ya construido no se espera
+        game.next_level.result()
+        start = time.perf_counter()
+        game.move_to_next_level()
+        self.assertLess(game.level_wait_times[-1], 0.05, "Un piso ya construido no debe hacer esperar.")
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len(game.level_wait_times), 2)
+        self.assertIn(game.current_level.floor_type, game.level_build_times)
+
+    def test_rooms_share_fly_paths(self):
+        from src.modules.BaseClasses import MovingEnemy
+        for row in self.game.current_level.get_rooms():
+            for room in row:
+                for enemy in room.enemies if room is not None else ():
+                    if isinstance(enemy, MovingEnemy):
+                        self.assertIs(enemy.fly_graph, room.fly_paths,
+                                      "La habitación debe dar su grafo en diagonal a los enemigos.")
+
+    def test_diagonal_enemy_uses_astar(self):
+        from src.modules.enemies.Maw import Maw
+        from src.utils import graph
+        from src.utils.funcs import cell_to_pixels
+
+        class DiagonalMaw(Maw):
+            use_diagonals = True
+
+        hero = pg.sprite.Sprite()
+        hero.rect = pg.Rect(0, 0, 10, 10)
+        hero.rect.center = cell_to_pixels((8, 5))
+        fly_graph = graph.GridGraph.from_blocked(13, 7, (), use_diagonals=True)
+
+        # Por defecto vuela en línea recta, sin buscar caminos
+        maw = Maw((2, 1), hero, (), ())
+        maw.update_fly_graph(fly_graph)
+        misses, hits = graph.path_cache.misses, graph.path_cache.hits
+        maw.update_move_speed()
+        self.assertEqual((graph.path_cache.misses, graph.path_cache.hits), (misses, hits),
+                         "Sin use_diagonals el volador no debe buscar caminos.")
+        self.assertEqual(maw.path, [])
+
+        maw = DiagonalMaw((2, 1), hero, (), ())
+        maw.update_fly_graph(fly_graph)
+        maw.update_move_speed()
+        self.assertEqual(graph.path_cache.misses, misses + 1, "El camino se debe buscar con A* y la caché.")
+        self.assertEqual(maw.path, [(3, 2)], "En un grafo en diagonal el primer paso es en diagonal.")
+        self.assertGreater(maw.vx, 0)
+        self.assertGreater(maw.vy, 0)
+
+        maw.update_move_speed()
+        self.assertEqual(graph.path_cache.hits, hits + 1, "La misma consulta debe salir de la caché.")
+
+    def test_close(self):
+        from src.modules.Game import Game
+        game = Game('isaac', pg.display.get_surface(), seed=6)
+        game.close()
+        with self.assertRaises(RuntimeError, msg="Después de cerrar no se pueden construir más pisos."):
+            game.level_builder.submit(int)
+
+if __name__ == '__main__':
+    unittest.main()
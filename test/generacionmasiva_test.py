@@ -0,0 +1,49 @@
+import sys
+import os
+import io
+import json
+import subprocess
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.tipos import FloorsTypes
+from src.modules.levels.generacionMasiva import generate_corpus, layout_from_rows
+from src.modules.levels.reservaMapas import is_valid_layout
+
+class TestGeneracionMasiva(unittest.TestCase):
+
+    def test_without_pygame(self):
+        code = 'import sys, src.modules.levels.generacionMasiva; sys.exit("pygame" in sys.modules)'
+        result = subprocess.run([sys.executable, '-c', code], cwd=root_dir)
+        self.assertEqual(result.returncode, 0, "La generación masiva no debe importar pygame.")
+
+    def test_generate_corpus(self):
+        floors = [FloorsTypes.BASEMENT, FloorsTypes.WOMB]
+        progress = []
+        file = io.StringIO()
+        written = generate_corpus(file, 3, floors, seed=7, workers=2, chunk_size=2,
+                                  progress=lambda *args: progress.append(args))
+
+        lines = file.getvalue().splitlines()
+        self.assertEqual(written, 6, "Se deben generar tres mapas por piso.")
+        self.assertEqual(len(lines), 6, "Debe haber una línea por mapa.")
+        self.assertEqual(progress[-1][:2], (6, 6), "El progreso debe llegar al total.")
+
+        maps = [json.loads(line) for line in lines]
+        self.assertEqual({(m['floor'], m['index']) for m in maps},
+                         {(floor.value, index) for floor in floors for index in range(3)})
+        for m in maps:
+            self.assertTrue(is_valid_layout(layout_from_rows(m['rooms'])), "Todos los mapas deben ser válidos.")
+
+        again = io.StringIO()
+        generate_corpus(again, 3, floors, seed=7, workers=1, chunk_size=3)
+        self.assertEqual(sorted(lines), sorted(again.getvalue().splitlines()),
+                         "Con la misma semilla se debe generar el mismo corpus.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src import consts
+import src.modules.levels.algoritmoGenetico as ag
+import src.modules.levels.genomaVectorizado as gv
+
+class TestGenomaVectorizado(unittest.TestCase):
+
+    def setUp(self):
+        self.population = ag.generate_initial_population(10, 10, 6, 15)
+        self.rng = np.random.default_rng(0)
+
+    def test_encode_decode(self):
+        encoded = gv.encode_population(self.population)
+
+        self.assertEqual(encoded.shape, (10, 6, 10), "La población codificada no tiene la forma esperada.")
+        self.assertEqual(encoded.dtype, np.uint8, "La población codificada no es uint8.")
+        self.assertEqual(gv.decode_population(encoded), self.population, "La decodificación no recupera los mapas.")
+
+    def test_fitness_batch_matches_fitness(self):
+        nRooms = (15, 20)
+        population = gv.encode_population(self.population)
+        children = gv.mutate_batch(gv.crossover_batch(population, population[::-1], self.rng), 0.5, 0.3, self.rng)
+
+        for individuals in (population, children):
+            expected = [ag.fitness(rooms, nRooms) for rooms in gv.decode_population(individuals)]
+            self.assertEqual(gv.fitness_batch(individuals, nRooms).tolist(), expected,
+                             "La aptitud vectorizada no coincide con la aptitud original.")
+
+    def test_crossover_batch(self):
+        parents1 = np.full((4, 5, 5), gv.DEFAULT, dtype=np.uint8)
+        parents2 = np.full((4, 5, 5), gv.BOSS, dtype=np.uint8)
+
+        children = gv.crossover_batch(parents1, parents2, self.rng)
+
+        self.assertEqual(children.shape, (4, 5, 5), "Los hijos no tienen la forma esperada.")
+        self.assertTrue(np.all(children[:, 0, 0] == gv.DEFAULT), "La primera celda debe venir del primer padre.")
+
+    def test_mutate_batch_keeps_spawn(self):
+        population = np.full((8, 5, 5), gv.DEFAULT, dtype=np.uint8)
+        population[:, 0, 0] = gv.SPAWN
+
+        mutated = gv.mutate_batch(population, 1.0, 1.0, self.rng)
+
+        self.assertTrue(np.all(mutated[:, 0, 0] == gv.SPAWN), "La habitación de inicio no debería mutarse.")
+        self.assertTrue(np.all(np.isin(mutated, gv.MUTATION_CODES) | (mutated == gv.SPAWN)),
+                        "La mutación ha producido un tipo de habitación no permitido.")
+
+    def test_random_walk_batch(self):
+        population = gv.random_walk_batch(50, 10, 6, 15, self.rng)
+
+        self.assertEqual(population.shape, (50, 6, 10), "La población no tiene la forma esperada.")
+        self.assertTrue(np.all(population[:, 2, 4] == gv.SPAWN), "La sala de inicio debe estar en el centro.")
+        self.assertTrue(np.all(gv.count_rooms_batch(population) == 15), "Cada mapa debe tener 15 habitaciones.")
+        self.assertTrue(np.all(np.isin(population, (gv.EMPTY, gv.DEFAULT, gv.SPAWN))),
+                        "El paseo solo coloca habitaciones normales.")
+
+    def test_steady_state_genetic_algorithm(self):
+        rooms = gv.steady_state_genetic_algorithm(10, 10, 6, (12, 17), 5, rng=self.rng)
+
+        self.assertEqual(len(rooms), 6, "El mapa no tiene la altura esperada.")
+        self.assertEqual(len(rooms[0]), 10, "El mapa no tiene el ancho esperado.")
+        self.assertTrue(all(isinstance(room, consts.RoomsTypes) for row in rooms for room in row),
+                        "El mapa debe devolverse como valores de RoomsTypes.")
+
+if __name__ == '__main__':
+    unittest.main()
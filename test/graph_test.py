@@ -0,0 +1,120 @@
+import sys
+import os
+import heapq
+import math
+import random
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.tipos import RoomsTypes
+import src.modules.levels.algoritmoGenetico as ag
+from src.utils.graph import GridGraph, PathCache, make_neighbors_graph, make_path_to_cell
+
+class TestGraph(unittest.TestCase):
+
+    def test_grid_graph_matches_dict(self):
+        rng = random.Random(0)
+        for rooms in ag.generate_initial_population(30, 10, 6, 15, rng):
+            for ignore_secret in (False, True):
+                for use_diagonals in (False, True):
+                    graph = make_neighbors_graph(rooms, ignore_secret=ignore_secret, use_diagonals=use_diagonals)
+                    grid = GridGraph.from_rooms(rooms, ignore_secret=ignore_secret, use_diagonals=use_diagonals)
+                    self.assertEqual(dict(grid.items()), dict(graph), "El grafo debe tener los mismos vecinos.")
+
+            graph = make_neighbors_graph(rooms, ignore_secret=True)
+            grid = GridGraph.from_rooms(rooms, ignore_secret=True)
+            start = (4, 2)
+            for end in list(graph) + [(0, 0)]:
+                self.assertEqual(grid.path(start, end), make_path_to_cell(graph, start, end),
+                                 "El camino debe ser el mismo que el de la búsqueda con diccionario.")
+                path = make_path_to_cell(graph, start, end)
+                distance = grid.distances(start)[grid.index(end)]
+                self.assertEqual(distance, len(path) - 1 if path else -1)
+                self.assertEqual(bool(grid.flood_fill(start) >> grid.index(end) & 1), bool(path))
+
+    def test_with_blocked(self):
+        rng = random.Random(1)
+        width, height = 13, 7
+        blocked = set()
+        grid = GridGraph.from_blocked(width, height, blocked)
+        for _ in range(50):
+            # Romper o colocar unos pocos obstáculos
+            blocked ^= {(rng.randrange(width), rng.randrange(height)) for _ in range(rng.randint(1, 3))}
+            cells = [[RoomsTypes.EMPTY if (x, y) in blocked else RoomsTypes.DEFAULT for x in range(width)]
+                     for y in range(height)]
+
+            previous, previous_items = grid, dict(grid.items())
+            grid = grid.with_blocked(blocked)
+            self.assertEqual(dict(grid.items()), dict(make_neighbors_graph(cells)),
+                             "El grafo con las celdas bloqueadas debe ser igual al reconstruido.")
+            self.assertEqual(dict(previous.items()), previous_items, "El grafo anterior no se debe modificar.")
+
+        self.assertNotIn((-1, 0), grid)
+        self.assertEqual(grid.get((-1, 0), []), [], "Una celda fuera de la cuadrícula no tiene vecinos.")
+
+    def test_astar(self):
+        rng = random.Random(2)
+        width, height = 13, 7
+        for _ in range(30):
+            blocked = {(rng.randrange(width), rng.randrange(height)) for _ in range(20)}
+            grid = GridGraph.from_blocked(width, height, blocked)
+            cells = list(grid)
+            start = rng.choice(cells)
+            for end in cells + [(0, 0)]:
+                path, bfs_path = grid.astar(start, end), grid.path(start, end)
+                self.assertEqual(len(path) if path else 0, len(bfs_path) if bfs_path else 0,
+                                 "Sin diagonales, A* debe encontrar caminos tan cortos como la búsqueda en anchura.")
+                if path:
+                    self.assertEqual((path[0], path[-1]), (start, end))
+                    self.assertTrue(all(b in grid[a] for a, b in zip(path, path[1:])))
+
+                path = grid.astar(start, end, use_diagonals=True)
+                self.assertEqual(bool(path), bool(bfs_path), "Las diagonales no cambian qué celdas son alcanzables.")
+                if path:
+                    self.assertAlmostEqual(sum(math.dist(a, b) for a, b in zip(path, path[1:])),
+                                           self._octile_distance(grid, start, end),
+                                           msg="Con diagonales, A* debe encontrar el camino de menor coste.")
+                    for (ax, ay), (bx, by) in zip(path, path[1:]):
+                        self.assertFalse({(bx, ay), (ax, by)} & blocked, "No se deben cortar esquinas.")
+
+    @staticmethod
+    def _octile_distance(grid: GridGraph, start: tuple[int, int], end: tuple[int, int]) -> float:
+        # Dijkstra de referencia con las mismas reglas que GridGraph.astar con diagonales
+        costs = {start: 0}
+        heap = [(0, start)]
+        while heap:
+            cost, (x, y) = heapq.heappop(heap)
+            if (x, y) == end:
+                return cost
+            for i in (-1, 0, 1):
+                for j in (-1, 0, 1):
+                    cell = (x + i, y + j)
+                    if (i, j) == (0, 0) or cell not in grid or (i and j and ((x + i, y) not in grid or
+                                                                             (x, y + j) not in grid)):
+                        continue
+                    if cost + math.hypot(i, j) < costs.get(cell, math.inf):
+                        costs[cell] = cost + math.hypot(i, j)
+                        heapq.heappush(heap, (costs[cell], cell))
+        return math.inf
+
+    def test_path_cache(self):
+        cache = PathCache()
+        grid = GridGraph.from_blocked(13, 7, [(6, y) for y in range(6)])
+        path = cache.path(grid, (0, 0), (12, 0))
+        self.assertEqual(cache.path(grid, (0, 0), (12, 0)), path)
+        self.assertEqual(cache.path(grid, path[1], (12, 0)), path[1:],
+                         "El camino desde la siguiente celda debe salir del camino guardado.")
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        grid = grid.with_blocked([(6, y) for y in range(1, 7)])
+        self.assertNotEqual(cache.path(grid, (0, 0), (12, 0)), path, "Otra versión del grafo no usa la caché.")
+        self.assertEqual(cache.misses, 2)
+        self.assertFalse(cache.path(grid.with_blocked([(6, y) for y in range(7)]), (0, 0), (12, 0)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+import src.modules.levels.modeloIslas as mi
+from src.modules.levels.cacheAptitud import layout_key
+
+class TestModeloIslas(unittest.TestCase):
+
+    def test_migrate_ring(self):
+        islands = [(['a1', 'a2', 'a3'], [30, 20, 10]), (['b1', 'b2', 'b3'], [60, 50, 40])]
+
+        migrated = mi.migrate(islands, 1, 'ring')
+
+        self.assertEqual(migrated[0], (['b1', 'a1', 'a2'], [60, 30, 20]), "El mejor de la isla B debe llegar a la isla A.")
+        self.assertEqual(migrated[1], (['b1', 'b2', 'a1'], [60, 50, 30]), "El mejor de la isla A debe sustituir al peor de B.")
+
+    def test_migrate_fully_connected(self):
+        islands = [(['a1', 'a2'], [3, 2]), (['b1', 'b2'], [6, 5]), (['c1', 'c2'], [9, 8])]
+
+        migrated = mi.migrate(islands, 1, 'fully_connected')
+
+        for population, scores in migrated:
+            self.assertEqual(len(population), 2, "La migración no debe cambiar el tamaño de las islas.")
+            self.assertEqual(scores, sorted(scores, reverse=True), "Las islas deben quedar ordenadas.")
+
+    def test_island_genetic_algorithm(self):
+        rooms = mi.island_genetic_algorithm(5, 10, 6, (12, 17), 4, islands=2, migration_interval=2, seed=1)
+        same_rooms = mi.island_genetic_algorithm(5, 10, 6, (12, 17), 4, islands=2, migration_interval=2, seed=1)
+
+        self.assertEqual(len(rooms), 6, "El mapa no tiene la altura esperada.")
+        self.assertEqual(rooms, same_rooms, "Con la misma semilla el resultado debe ser el mismo.")
+
+    def test_cache_between_epochs(self):
+        room_numbers = (12, 17)
+        islands = [mi._evolve_island(None, None, None, 5, 10, 6, room_numbers, 2, seed) for seed in (1, 2)]
+        for population, scores, cached in islands:
+            for rooms, score in zip(population, scores):
+                self.assertEqual(cached[layout_key(rooms, room_numbers)], score,
+                                 "La isla debe devolver las puntuaciones de su caché.")
+
+        migrated = mi.migrate([(population, scores) for population, scores, _ in islands], 1, 'ring')
+        with patch.object(mi.ag, 'fitness', side_effect=AssertionError("No se debe volver a puntuar.")):
+            for (population, scores), (_, _, cached) in zip(migrated, islands):
+                _, _, new_cached = mi._evolve_island(population, scores, cached, 5, 10, 6, room_numbers, 0, 3)
+                self.assertTrue(set(cached) <= set(new_cached), "La caché se conserva entre épocas.")
+                for rooms in population:
+                    self.assertIn(layout_key(rooms, room_numbers), new_cached,
+                                  "Los emigrantes llegan con su puntuación.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import sys
+import os
+import random
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.consts import RoomsTypes
+from src.modules.levels import reparacion
+import src.modules.levels.algoritmoGenetico as ag
+from src.modules.levels.reservaMapas import is_valid_layout
+from src.utils.conectividad import all_rooms_reachable
+from src.utils.graph import make_neighbors_graph
+
+class TestReparacion(unittest.TestCase):
+
+    def setUp(self):
+        # Pasillo vertical desde la sala de inicio y una habitación unida solo en diagonal
+        self.rooms = [[RoomsTypes.EMPTY] * 5 for _ in range(5)]
+        self.rooms[2][2] = RoomsTypes.SPAWN
+        self.rooms[3][2] = RoomsTypes.DEFAULT
+        self.rooms[4][3] = RoomsTypes.DEFAULT
+
+    def test_reconnect_orphans(self):
+        self.assertFalse(all_rooms_reachable(self.rooms))
+        self.assertEqual(reparacion.reconnect_orphans(self.rooms), 1, "Basta con una habitación para reconectar.")
+        self.assertTrue(all_rooms_reachable(self.rooms), "Todas las habitaciones deben tener camino al inicio.")
+
+    def test_add_dead_ends(self):
+        reparacion.reconnect_orphans(self.rooms)
+        self.assertGreater(reparacion.add_dead_ends(self.rooms), 0)
+
+        graph = make_neighbors_graph(self.rooms, ignore_secret=True)
+        solo = [room for room in graph if len(graph[room]) == 1 and self.rooms[room[1]][room[0]] == RoomsTypes.DEFAULT]
+        self.assertGreaterEqual(len(solo), reparacion.DEAD_ENDS_NEEDED, "Debe haber sitio para las salas especiales.")
+        self.assertTrue(all_rooms_reachable(self.rooms))
+
+    def test_repair_layout(self):
+        self.assertTrue(reparacion.repair_layout(self.rooms))
+        self.assertTrue(ag.set_special_rooms(self.rooms, random.Random(0)), "Después de reparar se colocan las salas especiales.")
+        self.assertTrue(is_valid_layout(self.rooms))
+        self.assertTrue(any(RoomsTypes.SECRET in row for row in self.rooms), "Debe haber habitación secreta.")
+
+    def test_repair_stats(self):
+        repairs = reparacion.RepairStats()
+        for seed in range(20):
+            self.assertTrue(is_valid_layout(ag.generate_level(10, 6, 12, random.Random(seed), repairs)))
+
+        stats = repairs.stats()
+        self.assertEqual(stats['first_try'] + stats['repaired'], 20, "Cada mapa se genera bien o se repara.")
+        self.assertEqual(stats['layouts'], 20 + stats['retries'])
+
+        # Cada ejecución cuenta solo sus mapas
+        population_repairs = reparacion.RepairStats()
+        ag.generate_initial_population(8, 10, 6, 15, random.Random(1), population_repairs)
+        self.assertEqual(population_repairs.first_try + population_repairs.repaired, 8)
+        self.assertEqual(repairs.stats(), stats, "Los contadores de otra ejecución no deben cambiar.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import os
+import random
+import tempfile
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.consts import FloorsTypes, RoomsTypes
+from src.modules.levels.LevelGenerator import generate_level
+from src.modules.levels.reservaMapas import LayoutPool, is_valid_layout, default_path
+
+class TestReservaMapas(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.pool = LayoutPool(os.path.join(self.directory.name, 'layouts.sqlite'), capacity=3, low_water=0)
+        self.room_numbers = (12, 17)
+
+    def tearDown(self):
+        self.pool.wait()
+        self.directory.cleanup()
+
+    def test_put_and_take(self):
+        rooms = generate_level(10, 6, self.room_numbers, rng=random.Random(3))
+        self.assertTrue(self.pool.put(FloorsTypes.BASEMENT, self.room_numbers, rooms), "El mapa generado es válido.")
+        self.assertEqual(self.pool.count(FloorsTypes.BASEMENT, self.room_numbers), 1)
+        self.assertEqual(self.pool.count(FloorsTypes.CAVES, self.room_numbers), 0, "Cada piso tiene su reserva.")
+
+        self.assertEqual(self.pool.take(FloorsTypes.BASEMENT, self.room_numbers), rooms, "Se debe obtener el mismo mapa.")
+        self.assertIsNone(self.pool.take(FloorsTypes.BASEMENT, (30, 35)), "No hay mapas con ese rango.")
+
+    def test_invalid_layout(self):
+        rooms = [[RoomsTypes.EMPTY] * 10 for _ in range(6)]
+        rooms[2][4] = RoomsTypes.SPAWN
+        self.assertFalse(is_valid_layout(rooms), "Un mapa sin jefe no es válido.")
+        self.assertFalse(self.pool.put(FloorsTypes.BASEMENT, self.room_numbers, rooms))
+
+    def test_special_rooms_required(self):
+        rooms = generate_level(10, 6, self.room_numbers, rng=random.Random(3))
+        self.assertTrue(is_valid_layout(rooms))
+        for room_type in (RoomsTypes.SECRET, RoomsTypes.TREASURE, RoomsTypes.SHOP):
+            without = [[RoomsTypes.DEFAULT if room == room_type else room for room in row] for row in rooms]
+            self.assertFalse(is_valid_layout(without), f"Un mapa sin {room_type.value} no es válido.")
+            self.assertFalse(self.pool.put(FloorsTypes.BASEMENT, self.room_numbers, without))
+
+    def test_default_path(self):
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.directory.name)
+            self.assertEqual(os.path.dirname(default_path()), root_dir,
+                             "La reserva no debe depender de la carpeta de trabajo.")
+        finally:
+            os.chdir(cwd)
+
+    def test_refill(self):
+        self.assertIsNone(self.pool.take(FloorsTypes.DEPTHS, self.room_numbers), "La reserva empieza vacía.")
+        self.pool.wait()
+        self.assertEqual(self.pool.count(FloorsTypes.DEPTHS, self.room_numbers), 3, "La reserva se debe llenar.")
+        self.assertIsNotNone(self.pool.take(FloorsTypes.DEPTHS, self.room_numbers))
+
+if __name__ == '__main__':
+    unittest.main()
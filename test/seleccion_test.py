@@ -0,0 +1,63 @@
+import sys
+import os
+import random
+import unittest
+import numpy as np
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+import src.modules.levels.algoritmoGenetico as ag
+import src.modules.levels.genomaVectorizado as gv
+from src.modules.levels.seleccion import AliasTable, ParentSelector
+
+class TestSeleccion(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(0)
+
+    def test_alias_table(self):
+        table = AliasTable([10, 30, 0, 60])
+        counts = [0] * 4
+        for _ in range(20000):
+            counts[table.sample(self.rng)] += 1
+
+        self.assertEqual(counts[2], 0, "Un individuo con aptitud 0 no debe elegirse.")
+        for count, expected in zip(counts, (0.1, 0.3, 0.0, 0.6)):
+            self.assertAlmostEqual(count / 20000, expected, delta=0.02, msg="La frecuencia no sigue los pesos.")
+
+    def test_zero_and_negative_scores(self):
+        table = AliasTable([-20, 0, -5])
+        samples = {table.sample(self.rng) for _ in range(200)}
+        self.assertEqual(samples, {0, 1, 2}, "Si ninguna aptitud es positiva la elección debe ser uniforme.")
+
+        population = ['a', 'b']
+        parents = ag.select_parents_baker(population, [('a', -10), ('b', -30)], self.rng)
+        self.assertEqual(len(parents), 2, "La ruleta de Baker no debe fallar con aptitudes negativas.")
+
+    def test_tournament(self):
+        selector = ParentSelector('tournament', tournament_size=4)
+        selector.prepare([1, 2, 3, 100])
+        wins = sum(selector.select(self.rng) == 3 for _ in range(1000))
+        self.assertGreater(wins, 600, "El mejor debe ganar la mayoría de los torneos.")
+
+        parents = selector.select_batch(np.array([1, 2, 3, 100]), 50, np.random.default_rng(0))
+        self.assertEqual(parents.shape, (50, 2), "Las parejas no tienen la forma esperada.")
+        self.assertGreater(np.mean(parents == 3), 0.6)
+
+    def test_elitism(self):
+        selector = ParentSelector(elitism=2)
+        self.assertEqual(selector.elite([5, 50, 20, 40]), [1, 3], "Se deben conservar los dos mejores.")
+
+        selection = ParentSelector('tournament', elitism=1)
+        rooms = ag.generational_genetic_algorithm(6, 10, 6, (12, 17), 4, rng=random.Random(1), selection=selection)
+        self.assertEqual((len(rooms), len(rooms[0])), (6, 10), "El algoritmo generacional debe aceptar la selección.")
+        rooms = gv.generational_genetic_algorithm(6, 10, 6, (12, 17), 4, rng=np.random.default_rng(1),
+                                                  selection=selection)
+        self.assertEqual((len(rooms), len(rooms[0])), (6, 10), "El motor vectorizado debe aceptar la selección.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import sys
+import os
+import random
+import unittest
+
+# Obtener la ruta del directorio raíz
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Agregar la ruta del directorio raíz al PATH de Python
+sys.path.append(root_dir)
+
+from src.utils.campoFlujo import FlowField
+from src.utils.graph import GridGraph
+from src.utils.tablaSaltos import NextHopTable, next_hop_table
+
+class TestTablaSaltos(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(3)
+        self.blocked = {(rng.randrange(13), rng.randrange(7)) for _ in range(20)}
+        self.graph = GridGraph.from_blocked(13, 7, self.blocked)
+
+    def test_matches_bfs(self):
+        table = NextHopTable(self.graph).fill()
+        self.assertEqual(len(table.hops), 91 * 91)
+        for target in self.graph.coords:
+            distances = self.graph.distances(target)
+            for start in self.graph.coords:
+                distance = distances[self.graph.index(start)]
+                self.assertEqual(table.distance(start, target), distance if distance >= 0 else None,
+                                 "La distancia debe ser la de la búsqueda en anchura.")
+                next_cell = table.next_cell(start, target)
+                if distance > 0:
+                    self.assertIn(next_cell, self.graph[start], "El siguiente paso debe ser una celda vecina.")
+                    self.assertEqual(table.distance(next_cell, target), distance - 1,
+                                     "El siguiente paso debe acercarse al destino.")
+                else:
+                    self.assertIsNone(next_cell)
+
+    def test_shared_by_layout(self):
+        table = next_hop_table(self.graph)
+        self.assertIs(next_hop_table(self.graph.with_blocked(self.blocked)), table,
+                      "Los grafos con los mismos obstáculos deben compartir la tabla.")
+        self.assertIsNot(next_hop_table(self.graph.with_blocked(self.blocked | {(0, 0), (12, 6)})), table,
+                         "Si cambian los obstáculos la tabla es otra.")
+
+        table.next_cell((0, 0), (12, 6))
+        rows = table.rows
+        table.next_cell((5, 5), (12, 6))
+        self.assertEqual(table.rows, rows, "Cada destino se calcula una sola vez.")
+
+    def test_flow_field(self):
+        field = FlowField()
+        target = next(iter(self.graph))
+        field.update(self.graph, target)
+        table = next_hop_table(self.graph)
+        for cell in self.graph:
+            self.assertEqual(field.next_cell(cell), table.next_cell(cell, target))
+            self.assertEqual(field.distance(cell), table.distance(cell, target))
+
+    def test_too_many_cells(self):
+        with self.assertRaises(ValueError):
+            NextHopTable(GridGraph.from_blocked(16, 16, ()))
+
+if __name__ == '__main__':
+    unittest.main()